@@ -3,10 +3,12 @@ from django.contrib.auth.admin import UserAdmin as BaseUserAdmin
 from .models import (
     User, ExpertProfile, ClientProfile, EmergencyContact, Service, Language,
     University, DegreeLevel, Major, Specialization, ApproachMethod,
-    TargetGroup, SessionType, AddictionType, AdminProfile, Document
+    TargetGroup, SessionType, AddictionType, AdminProfile, Document, StorageDeletion
 )
 from django.utils import timezone
 
+from . import text_search
+
 
 # ====================================================================
 # I. İÇ İLİŞKİLİ MODELLER (Alt tablolar)
@@ -54,10 +56,8 @@ class ExpertProfileAdmin(admin.ModelAdmin):
         'user', 'get_full_name', 'title', 'experience_years',
         'approval_status', 'rating_average', 'get_services_short'
     )
-    search_fields = (
-        'user__email', 'user__first_name', 'user__last_name',
-        'title', 'license_number'
-    )
+    # Ad, unvan ve hakkında metni icontains yerine metin indeksinde aranır (get_search_results)
+    search_fields = ('user__email', 'license_number')
     list_filter = ('approval_status', 'services', 'specializations', 'availability_status')
 
     fieldsets = (
@@ -78,6 +78,13 @@ class ExpertProfileAdmin(admin.ModelAdmin):
         'approach_methods', 'target_groups', 'session_types'
     )
 
+    def get_search_results(self, request, queryset, search_term):
+        results, may_have_duplicates = super().get_search_results(request, queryset, search_term)
+        if search_term:
+            matched_ids = text_search.search_experts(queryset, search_term)
+            results = results | queryset.filter(id__in=matched_ids)
+        return results, may_have_duplicates
+
     def get_full_name(self, obj):
         return obj.user.get_full_name()
     get_full_name.short_description = 'Ad Soyad'
@@ -171,6 +178,8 @@ class DocumentAdmin(admin.ModelAdmin):
         'uid',
         'file_key',
         'original_filename',
+        'size',
+        'content_hash',
         'uploaded_at',
         'updated_at',
     )
@@ -186,7 +195,7 @@ class DocumentAdmin(admin.ModelAdmin):
             "fields": ('is_primary', 'is_current', 'verified', 'verified_at')
         }),
         ("Sistem Alanları", {
-            "fields": ('uid', 'file_key', 'uploaded_at', 'updated_at')
+            "fields": ('uid', 'file_key', 'size', 'content_hash', 'uploaded_at', 'updated_at')
         }),
     )
     
@@ -198,6 +207,18 @@ class DocumentAdmin(admin.ModelAdmin):
         return False
 
 
+@admin.register(StorageDeletion)
+class StorageDeletionAdmin(admin.ModelAdmin):
+    """Storage'dan silinmeyi bekleyen dosyalar (process_storage_deletions ile işlenir)."""
+    list_display = ('file_key', 'reason', 'attempts', 'next_attempt_at', 'created_at')
+    list_filter = ('reason',)
+    search_fields = ('file_key',)
+    readonly_fields = ('file_key', 'reason', 'attempts', 'last_error', 'next_attempt_at', 'created_at')
+
+    def has_add_permission(self, request):
+        return False
+
+
 # ====================================================================
 # V. DİĞER YARDIMCI MODELLER (Basit Yönetim)
 # ====================================================================
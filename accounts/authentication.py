@@ -1,5 +1,11 @@
+from django.utils.translation import gettext_lazy as _
 from rest_framework_simplejwt.authentication import JWTAuthentication
-from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+from rest_framework_simplejwt.utils import get_md5_hash_password
+
+from .blacklist import is_blacklisted
+from .user_cache import get_cached_user
 
 class CookieJWTAuthentication(JWTAuthentication):
     def authenticate(self, request):
@@ -17,10 +23,35 @@ class CookieJWTAuthentication(JWTAuthentication):
             validated_token = self.get_validated_token(raw_token)
             
             # Token blacklist kontrolü yap - bu çok önemli
-            if BlacklistedToken.objects.filter(token__jti=validated_token['jti']).exists():
+            # Süreç içi filtre, sadece olası eşleşmede veritabanına gider (bkz. blacklist.py)
+            if is_blacklisted(validated_token['jti']):
                 return None  # Blacklist'te varsa authentication başarısız
             
             return self.get_user(validated_token), validated_token
             
         except Exception:
-            return None 
\ No newline at end of file
+            return None
+
+    def get_user(self, validated_token):
+        """
+        JWTAuthentication.get_user ile aynı kontroller; kullanıcı profilleriyle
+        birlikte kısa ömürlü cache'ten okunur (bkz. user_cache.py).
+        """
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(_("Token contained no recognizable user identification")) from e
+
+        try:
+            user = get_cached_user(user_id, api_settings.USER_ID_FIELD)
+        except self.user_model.DoesNotExist as e:
+            raise AuthenticationFailed(_("User not found"), code="user_not_found") from e
+
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+
+        if api_settings.CHECK_REVOKE_TOKEN:
+            if validated_token.get(api_settings.REVOKE_TOKEN_CLAIM) != get_md5_hash_password(user.password):
+                raise AuthenticationFailed(_("The user's password has been changed."), code="password_changed")
+
+        return user
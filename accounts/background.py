@@ -0,0 +1,43 @@
+"""
+İstek cevabını bekletmemesi gereken küçük işler için arka plan çalıştırıcısı.
+
+İşler süreç içi bir thread havuzunda, mevcut transaction commit edildikten
+sonra çalıştırılır. BACKGROUND_TASKS_SYNC=True ise (testler, tek seferlik
+komutlar) iş aynı thread'de hemen çalışır.
+"""
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import close_old_connections, transaction
+
+logger = logging.getLogger(__name__)
+
+_executor = None
+
+
+def _get_executor():
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=getattr(settings, 'BACKGROUND_TASK_WORKERS', 2),
+            thread_name_prefix='lunova-bg',
+        )
+    return _executor
+
+
+def _run(func, args, kwargs):
+    try:
+        func(*args, **kwargs)
+    except Exception:
+        logger.exception("Arka plan işi başarısız: %s", getattr(func, '__name__', func))
+    finally:
+        close_old_connections()
+
+
+def run_in_background(func, *args, **kwargs):
+    """func'ı commit sonrası arka planda çalıştırır."""
+    if getattr(settings, 'BACKGROUND_TASKS_SYNC', False):
+        transaction.on_commit(lambda: func(*args, **kwargs))
+        return
+    transaction.on_commit(lambda: _get_executor().submit(_run, func, args, kwargs))
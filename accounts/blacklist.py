@@ -0,0 +1,97 @@
+"""
+Token blacklist kontrolü için süreç içi filtre.
+
+Her istekte BlacklistedToken tablosuna join atmak yerine, süresi henüz
+dolmamış blacklist kayıtlarının jti'leri süreç belleğinde bir kümede tutulur.
+Küme, cache backend'indeki bir versiyon sayacı ile senkron tutulur:
+- Bir token blacklist'e eklendiğinde (post_save) sayaç artırılır
+- Her kontrolde sayaç okunur; değiştiyse küme veritabanından yeniden yüklenir
+- Kümede bulunan jti (olası eşleşme) veritabanından doğrulanır
+
+Sayaç süreçler arasında ancak paylaşılan bir cache (CACHE_URL, ör. Redis)
+üzerinden görülür. Süreç içi cache'te (locmem) bir worker'da blacklist'e
+alınan token diğer worker'larda AUTH_BLACKLIST_MAX_AGE saniyeye kadar kabul
+edilebileceği için filtre bu durumda devre dışıdır ve her kontrol
+veritabanına gider (bkz. checks.py). Paylaşılan cache ile en kötü durum:
+sayaç cache'ten düşerse veya cache'e yazılamazsa filtre en geç
+AUTH_BLACKLIST_MAX_AGE saniyede bir yenilenir.
+"""
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+VERSION_CACHE_KEY = 'auth:blacklist:version'
+PROCESS_LOCAL_CACHES = (
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+)
+
+_lock = threading.Lock()
+_state = {'version': None, 'loaded_at': 0.0, 'jtis': frozenset()}
+
+
+def _current_version():
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        # Cache boşaldıysa eski değerle çakışmaması için zamana bağlı bir başlangıç
+        cache.add(VERSION_CACHE_KEY, time.time_ns())
+        version = cache.get(VERSION_CACHE_KEY)
+    return version
+
+
+def bump_version():
+    """Tüm süreçlerdeki filtrelerin bir sonraki kontrolde yenilenmesini sağlar."""
+    try:
+        cache.incr(VERSION_CACHE_KEY)
+    except ValueError:
+        cache.add(VERSION_CACHE_KEY, time.time_ns())
+
+
+def _load_jtis():
+    return frozenset(
+        BlacklistedToken.objects.filter(token__expires_at__gt=timezone.now())
+        .values_list('token__jti', flat=True)
+    )
+
+
+def _blacklisted_jtis():
+    version = _current_version()
+    max_age = getattr(settings, 'AUTH_BLACKLIST_MAX_AGE', 60)
+    now = time.monotonic()
+    if _state['version'] == version and now - _state['loaded_at'] < max_age:
+        return _state['jtis']
+
+    with _lock:
+        if _state['version'] != version or now - _state['loaded_at'] >= max_age:
+            _state['jtis'] = _load_jtis()
+            _state['version'] = version
+            _state['loaded_at'] = now
+    return _state['jtis']
+
+
+def add_local(jti):
+    """Bu süreçte blacklist'e eklenen jti'yi yeniden yüklemeyi beklemeden kümeye ekler."""
+    with _lock:
+        _state['jtis'] = _state['jtis'] | {jti}
+
+
+def filter_enabled():
+    """Filtre sadece sayaç worker'lar arasında paylaşılıyorsa kullanılır."""
+    return (
+        getattr(settings, 'AUTH_BLACKLIST_FILTER', False)
+        and settings.CACHES['default']['BACKEND'] not in PROCESS_LOCAL_CACHES
+    )
+
+
+def is_blacklisted(jti):
+    if not filter_enabled():
+        return BlacklistedToken.objects.filter(token__jti=jti).exists()
+
+    if jti not in _blacklisted_jtis():
+        return False
+    # Olası eşleşme: kayıt bu arada silinmiş olabilir, veritabanından doğrula
+    return BlacklistedToken.objects.filter(token__jti=jti).exists()
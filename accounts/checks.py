@@ -0,0 +1,44 @@
+from django.conf import settings
+from django.core.checks import Warning, register
+
+from .blacklist import PROCESS_LOCAL_CACHES
+
+
+@register()
+def blacklist_filter_cache(app_configs, **kwargs):
+    """Blacklist filtresi paylaşılmayan bir cache ile açılmışsa uyarır."""
+    if getattr(settings, 'AUTH_BLACKLIST_FILTER', False) and settings.CACHES['default']['BACKEND'] in PROCESS_LOCAL_CACHES:
+        return [Warning(
+            "AUTH_BLACKLIST_FILTER açık ancak CACHES['default'] süreç içi bir cache; filtre devre dışı "
+            "bırakıldı ve blacklist her istekte veritabanından kontrol ediliyor.",
+            hint="Çok worker'lı ortamlarda CACHE_URL ile paylaşılan bir cache (ör. redis://...) verin.",
+            id='accounts.W001',
+        )]
+    return []
+
+
+@register()
+def user_cache_backend(app_configs, **kwargs):
+    """Kullanıcı cache'i paylaşılmayan bir cache ile açılmışsa uyarır."""
+    if getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 0) and settings.CACHES['default']['BACKEND'] in PROCESS_LOCAL_CACHES:
+        return [Warning(
+            "AUTH_USER_CACHE_TIMEOUT açık ancak CACHES['default'] süreç içi bir cache; pasifleştirilen "
+            "veya rolü/parolası değişen kullanıcı diğer worker'larda AUTH_USER_CACHE_TIMEOUT saniyeye "
+            "kadar doğrulanmaya devam eder.",
+            hint="CACHE_URL ile paylaşılan bir cache verin veya AUTH_USER_CACHE_TIMEOUT=0 ile kapatın.",
+            id='accounts.W002',
+        )]
+    return []
+
+
+@register()
+def profile_cache_backend(app_configs, **kwargs):
+    """Profil cache'i paylaşılmayan bir cache ile açılmışsa uyarır."""
+    if getattr(settings, 'PROFILE_CACHE_TIMEOUT', 0) and settings.CACHES['default']['BACKEND'] in PROCESS_LOCAL_CACHES:
+        return [Warning(
+            "PROFILE_CACHE_TIMEOUT açık ancak CACHES['default'] süreç içi bir cache; profil değiştiğinde "
+            "diğer worker'lar eski /profile/ cevabını PROFILE_CACHE_TIMEOUT saniyeye kadar sunmaya devam eder.",
+            hint="CACHE_URL ile paylaşılan bir cache verin veya PROFILE_CACHE_TIMEOUT=0 ile kapatın.",
+            id='accounts.W003',
+        )]
+    return []
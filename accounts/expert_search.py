@@ -0,0 +1,194 @@
+"""
+Uzman arama için süreç içi ters indeks (inverted index).
+
+Onaylı uzmanların M2M ilişkileri (hizmet, uzmanlık, dil, yaklaşım, hedef grup,
+seans türü) facet -> değer -> uzman id kümesi şeklinde bellekte tutulur.
+Filtreler küme kesişimleriyle, facet sayıları küme boyutlarıyla hesaplanır;
+istek başına veritabanına sadece sonuç sayfası için gidilir.
+
+İndeks, cache backend'indeki bir versiyon sayacı ile senkron tutulur
+(bkz. accounts/blacklist.py): ExpertProfile kaydedildiğinde/silindiğinde ve
+M2M ilişkileri değiştiğinde (m2m_changed) sayaç artırılır, bir sonraki
+aramada indeks yeniden kurulur. Paylaşılan cache yoksa indeks en geç
+EXPERT_SEARCH_INDEX_MAX_AGE saniyede bir yenilenir.
+"""
+import threading
+import time
+from dataclasses import dataclass
+
+from django.conf import settings
+from django.core.cache import cache
+
+from .models import ExpertProfile
+
+VERSION_CACHE_KEY = 'experts:search:version'
+
+# ExpertProfile M2M alanları; arama uç noktasında sorgu parametreleri de aynı isimlerde
+FACETS = (
+    'services',
+    'specializations',
+    'languages',
+    'approach_methods',
+    'target_groups',
+    'session_types',
+)
+
+# Sıralamada önce gelen müsaitlik durumları
+AVAILABILITY_RANK = {'available': 0, 'active': 1, 'busy': 2, 'away': 3}
+
+_lock = threading.Lock()
+_state = {'version': None, 'loaded_at': 0.0, 'index': None}
+
+
+@dataclass
+class ExpertRow:
+    id: int
+    price: float | None
+    rating: float
+    availability: str
+
+
+class ExpertSearchIndex:
+    def __init__(self, rows, facets):
+        self.rows = {row.id: row for row in rows}
+        # facet -> {değer id: frozenset(uzman id)}
+        self.facets = facets
+        self.all_ids = frozenset(self.rows)
+        ranked = sorted(self.rows.values(), key=self._rank_key)
+        self.position = {row.id: index for index, row in enumerate(ranked)}
+
+    @staticmethod
+    def _rank_key(row):
+        # Müsaitlik, yüksek puan, düşük ücret; ücreti belirtilmemişler sona
+        return (
+            AVAILABILITY_RANK.get(row.availability, len(AVAILABILITY_RANK)),
+            -row.rating,
+            row.price is None,
+            row.price or 0,
+            row.id,
+        )
+
+    def _facet_match(self, facet, values):
+        """Bir facet içinde seçilen değerlerden herhangi birine sahip uzmanlar (VEYA)."""
+        postings = self.facets[facet]
+        matched = set()
+        for value in values:
+            matched |= postings.get(value, frozenset())
+        return matched
+
+    def _scalar_match(self, min_price=None, max_price=None, min_rating=None, availability=None):
+        if min_price is None and max_price is None and min_rating is None and not availability:
+            return self.all_ids
+        matched = set()
+        for row in self.rows.values():
+            if min_price is not None and (row.price is None or row.price < min_price):
+                continue
+            if max_price is not None and (row.price is None or row.price > max_price):
+                continue
+            if min_rating is not None and row.rating < min_rating:
+                continue
+            if availability and row.availability not in availability:
+                continue
+            matched.add(row.id)
+        return matched
+
+    def search(self, selected=None, within=None, **scalars):
+        """
+        selected: {facet: [değer id, ...]} — facet'ler arası VE, facet içi VEYA.
+        within: verilirse sadece bu uzman id'leri aranır ve sonuçlar bu listenin
+            sırasını izler (ör. metin aramasının alaka sırası).
+        scalars: min_price, max_price, min_rating, availability.
+
+        Sıralı uzman id'lerini ve facet sayılarını döner. Bir facet'in sayıları
+        o facet'in kendi seçimi hariç diğer tüm filtrelere göre hesaplanır;
+        böylece istemci aynı facet'te başka değer eklerse kaç sonuç geleceğini görür.
+        """
+        selected = {facet: values for facet, values in (selected or {}).items() if values}
+        base = self._scalar_match(**scalars)
+        if within is not None:
+            base = base & set(within)
+        matches = {facet: self._facet_match(facet, values) for facet, values in selected.items()}
+
+        result = set(base)
+        for matched in matches.values():
+            result &= matched
+
+        counts = {}
+        for facet in FACETS:
+            scope = set(base)
+            for other, matched in matches.items():
+                if other != facet:
+                    scope &= matched
+            counts[facet] = {
+                value: len(ids & scope)
+                for value, ids in self.facets[facet].items()
+                if not ids.isdisjoint(scope)
+            }
+
+        if within is not None:
+            ids = [expert_id for expert_id in dict.fromkeys(within) if expert_id in result]
+        else:
+            ids = sorted(result, key=self.position.__getitem__)
+        return ids, counts
+
+
+def _build_index():
+    rows = [
+        ExpertRow(
+            id=expert_id,
+            price=float(price) if price is not None else None,
+            rating=rating or 0,
+            availability=availability,
+        )
+        for expert_id, price, rating, availability in ExpertProfile.objects.filter(
+            approval_status=True
+        ).values_list('id', 'session_price', 'rating_average', 'availability_status')
+    ]
+    expert_ids = {row.id for row in rows}
+
+    facets = {}
+    for facet in FACETS:
+        field = ExpertProfile._meta.get_field(facet)
+        postings = {}
+        through_rows = field.remote_field.through.objects.values_list(
+            field.m2m_column_name(), field.m2m_reverse_name()
+        )
+        for expert_id, value in through_rows:
+            if expert_id in expert_ids:
+                postings.setdefault(value, set()).add(expert_id)
+        facets[facet] = {value: frozenset(ids) for value, ids in postings.items()}
+
+    return ExpertSearchIndex(rows, facets)
+
+
+def _current_version():
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(VERSION_CACHE_KEY, time.time_ns())
+        version = cache.get(VERSION_CACHE_KEY)
+    return version
+
+
+def bump_version():
+    """Tüm süreçlerdeki indekslerin bir sonraki aramada yeniden kurulmasını sağlar."""
+    try:
+        cache.incr(VERSION_CACHE_KEY)
+    except ValueError:
+        cache.add(VERSION_CACHE_KEY, time.time_ns())
+    with _lock:
+        _state['version'] = None
+
+
+def get_index():
+    version = _current_version()
+    max_age = getattr(settings, 'EXPERT_SEARCH_INDEX_MAX_AGE', 300)
+    now = time.monotonic()
+    if _state['version'] == version and now - _state['loaded_at'] < max_age:
+        return _state['index']
+
+    with _lock:
+        if _state['version'] != version or now - _state['loaded_at'] >= max_age:
+            _state['index'] = _build_index()
+            _state['version'] = version
+            _state['loaded_at'] = now
+    return _state['index']
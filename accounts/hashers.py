@@ -0,0 +1,59 @@
+"""
+Parola hash maliyeti ve girişte şeffaf yeniden hash'leme.
+
+PBKDF2 iterasyon sayısı PASSWORD_HASH_ITERATIONS ayarından okunur. Ayar
+değiştiğinde eski hash'ler kullanıcı bir sonraki girişini yaptığında, cevabı
+geciktirmeden arka planda yeni maliyetle yeniden hash'lenir.
+"""
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    PBKDF2PasswordHasher as DjangoPBKDF2PasswordHasher,
+    check_password,
+    get_hasher,
+    identify_hasher,
+    make_password,
+)
+
+from .background import run_in_background
+
+
+class PBKDF2PasswordHasher(DjangoPBKDF2PasswordHasher):
+    """Iterasyon sayısı ayardan okunan PBKDF2 (algoritma adı aynı, eski hash'ler geçerli)."""
+
+    @property
+    def iterations(self):
+        return getattr(settings, 'PASSWORD_HASH_ITERATIONS', None) or DjangoPBKDF2PasswordHasher.iterations
+
+
+def needs_rehash(encoded):
+    preferred = get_hasher('default')
+    try:
+        hasher = identify_hasher(encoded)
+    except ValueError:
+        return False
+    return hasher.algorithm != preferred.algorithm or preferred.must_update(encoded)
+
+
+def rehash_password(user_id, old_encoded, raw_password):
+    """Parola bu arada değişmediyse güncel hasher ile yeniden hash'ler."""
+    from .models import User
+    from .user_cache import invalidate_user
+
+    updated = User.objects.filter(pk=user_id, password=old_encoded).update(
+        password=make_password(raw_password)
+    )
+    if updated:
+        invalidate_user(user_id)
+
+
+def verify_password(user, raw_password):
+    """
+    Parolayı doğrular. Hash eski bir algoritma veya maliyetle üretilmişse
+    yeniden hash'leme arka plana bırakılır (Django bunu senkron yapar).
+    """
+    encoded = user.password
+    if not check_password(raw_password, encoded):
+        return False
+    if needs_rehash(encoded):
+        run_in_background(rehash_password, user.pk, encoded, raw_password)
+    return True
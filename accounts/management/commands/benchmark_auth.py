@@ -0,0 +1,101 @@
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, override_settings
+from django.utils import timezone
+from rest_framework.permissions import IsAuthenticated
+from rest_framework.response import Response
+from rest_framework.test import APIRequestFactory
+from rest_framework.views import APIView
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.blacklist import filter_enabled
+from accounts.models import ClientProfile, User
+
+# Karşılaştırılan senaryolar: (etiket, ayar değişiklikleri)
+SCENARIOS = [
+    ('blacklist: veritabanı', {'AUTH_BLACKLIST_FILTER': False, 'AUTH_USER_CACHE_TIMEOUT': 0}),
+    ('blacklist: süreç içi filtre', {'AUTH_BLACKLIST_FILTER': True, 'AUTH_USER_CACHE_TIMEOUT': 0}),
+    ('blacklist filtresi + kullanıcı cache', {'AUTH_BLACKLIST_FILTER': True, 'AUTH_USER_CACHE_TIMEOUT': 60}),
+]
+
+
+class PingView(APIView):
+    """Kimlik doğrulama ve tipik profil kontrollerinin maliyetini ölçmek için view."""
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request):
+        user = request.user
+        return Response({
+            'id': user.id,
+            'is_expert': hasattr(user, 'expertprofile'),
+            'is_client': hasattr(user, 'clientprofile'),
+        })
+
+
+class Command(BaseCommand):
+    help = (
+        "Kimlik doğrulamalı isteklerin saniyedeki sayısını ve istek başına sorgu sayısını "
+        "ölçer. Veriler bir transaction içinde oluşturulur ve sonunda geri alınır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=2000, help='Senaryo başına istek sayısı')
+        parser.add_argument('--blacklisted', type=int, default=1000, help='Önceden blacklist\'e eklenecek token sayısı')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1:
+            raise CommandError('--requests pozitif olmalıdır.')
+
+        with transaction.atomic():
+            self._run(options['requests'], options['blacklisted'])
+            transaction.set_rollback(True)
+
+    def _run(self, request_count, blacklisted):
+        user = User.objects.create_user(
+            email=f'bench-{uuid.uuid4().hex[:8]}@example.com',
+            username=f'bench-{uuid.uuid4().hex[:8]}',
+            password=uuid.uuid4().hex,
+        )
+        ClientProfile.objects.create(user=user)
+        expires_at = timezone.now() + timedelta(days=1)
+        outstanding = OutstandingToken.objects.bulk_create([
+            OutstandingToken(user=user, jti=uuid.uuid4().hex, token='x', expires_at=expires_at)
+            for _ in range(blacklisted)
+        ])
+        BlacklistedToken.objects.bulk_create([BlacklistedToken(token=token) for token in outstanding])
+
+        access_token = str(RefreshToken.for_user(user).access_token)
+        factory = APIRequestFactory()
+        view = PingView.as_view()
+
+        def call():
+            request = factory.get('/bench/')
+            request.COOKIES['access_token'] = access_token
+            response = view(request)
+            if response.status_code != 200:
+                raise CommandError(f'Beklenmeyen cevap: {response.status_code}')
+
+        for label, overrides in SCENARIOS:
+            with override_settings(**overrides):
+                call()  # ısınma: filtre/cache ilk yüklemesi
+                with CaptureQueriesContext(connection) as queries:
+                    call()
+                started = time.perf_counter()
+                for _ in range(request_count):
+                    call()
+                elapsed = time.perf_counter() - started
+                # locmem cache ile filtre kullanılmaz (bkz. accounts/blacklist.py)
+                note = ' (filtre devre dışı: CACHE_URL paylaşılan bir cache değil)' if (
+                    overrides['AUTH_BLACKLIST_FILTER'] and not filter_enabled()
+                ) else ''
+
+            self.stdout.write(
+                f"{label}: {request_count / elapsed:.0f} istek/s, "
+                f"{elapsed / request_count * 1000:.3f} ms/istek, "
+                f"{len(queries)} sorgu/istek{note}"
+            )
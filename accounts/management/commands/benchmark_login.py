@@ -0,0 +1,96 @@
+import statistics
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test.utils import override_settings
+from rest_framework.test import APIRequestFactory
+
+from accounts.models import ClientProfile, Document, DocumentType, User
+from accounts.views.views import LoginView
+
+
+def percentile(values, pct):
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(pct / 100 * len(ordered))) - 1))
+    return ordered[index]
+
+
+class Command(BaseCommand):
+    help = (
+        "LoginView gecikmesini eşzamanlı isteklerle ölçer (p50/p95/p99). "
+        "Test kullanıcısı ölçüm sonunda silinir."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=100, help='Toplam giriş isteği')
+        parser.add_argument('--concurrency', type=int, default=4, help='Eşzamanlı istek sayısı')
+        parser.add_argument('--iterations', type=int, default=None,
+                            help='PASSWORD_HASH_ITERATIONS değerini ölçüm süresince değiştirir')
+
+    def handle(self, *args, **options):
+        if options['requests'] < 1 or options['concurrency'] < 1:
+            raise CommandError('--requests ve --concurrency pozitif olmalıdır.')
+
+        overrides = {'BACKGROUND_TASKS_SYNC': True}
+        if options['iterations']:
+            overrides['PASSWORD_HASH_ITERATIONS'] = options['iterations']
+
+        with override_settings(**overrides):
+            password = uuid.uuid4().hex
+            user = User.objects.create_user(
+                email=f'bench-{uuid.uuid4().hex[:8]}@example.com',
+                username=f'bench-{uuid.uuid4().hex[:8]}',
+                password=password,
+            )
+            try:
+                ClientProfile.objects.create(user=user)
+                Document.objects.create(
+                    user=user,
+                    type=DocumentType.PROFILE_PHOTO,
+                    file_key=f'bench/{user.id}/{uuid.uuid4().hex}.webp',
+                    original_filename='photo.webp',
+                    is_primary=True,
+                )
+                self._run(user.email, password, options['requests'], options['concurrency'])
+            finally:
+                user.delete()
+
+    def _run(self, email, password, request_count, concurrency):
+        factory = APIRequestFactory()
+        view = LoginView.as_view()
+
+        def login(_):
+            request = factory.post(
+                '/login/', {'email': email, 'password': password}, format='json',
+                HTTP_X_FRONTEND_TYPE='client',
+            )
+            started = time.perf_counter()
+            response = view(request)
+            elapsed = time.perf_counter() - started
+            if response.status_code != 200:
+                raise CommandError(f'Beklenmeyen cevap: {response.status_code} {response.data}')
+            return elapsed
+
+        def worker(batch):
+            try:
+                return [login(i) for i in batch]
+            finally:
+                connection.close()
+
+        login(None)  # ısınma: eski hash varsa burada yükseltilir
+
+        batches = [range(i, request_count, concurrency) for i in range(concurrency)]
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            latencies = [value for batch in executor.map(worker, batches) for value in batch]
+        total = time.perf_counter() - started
+
+        ms = [value * 1000 for value in latencies]
+        self.stdout.write(
+            f"{request_count} giriş, eşzamanlılık {concurrency}: {request_count / total:.1f} giriş/s | "
+            f"p50 {statistics.median(ms):.1f} ms, p95 {percentile(ms, 95):.1f} ms, "
+            f"p99 {percentile(ms, 99):.1f} ms, max {max(ms):.1f} ms"
+        )
@@ -0,0 +1,110 @@
+import random
+import statistics
+import time
+import uuid
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from rest_framework.test import APIRequestFactory
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import ClientProfile, ExpertProfile, User, UserRole
+from accounts.views.views import ClientRosterView
+from appointments.models import Appointment
+from forms.models import Form, FormResponse
+
+RISK_LEVELS = ('Düşük', 'Orta', 'Yüksek')
+
+
+class Command(BaseCommand):
+    help = (
+        "Uzman paneli danışan listesinin (/accounts/clients/roster/) sayfa gecikmesini ve "
+        "sorgu sayısını ölçer. Veriler bir transaction içinde oluşturulur ve sonunda geri alınır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--clients', type=int, default=1000, help='Uzmana atanmış danışan sayısı')
+        parser.add_argument('--appointments', type=int, default=10, help='Danışan başına randevu sayısı')
+        parser.add_argument('--requests', type=int, default=50, help='Ölçülen istek sayısı')
+        parser.add_argument('--limit', type=int, default=20, help='Sayfa boyutu')
+
+    def handle(self, *args, **options):
+        if options['clients'] < 1 or options['requests'] < 1:
+            raise CommandError('--clients ve --requests pozitif olmalıdır.')
+
+        with transaction.atomic():
+            self._run(options)
+            transaction.set_rollback(True)
+
+    def _run(self, options):
+        prefix = uuid.uuid4().hex[:8]
+        expert_user = User.objects.create_user(
+            email=f'bench-{prefix}@example.com', username=f'bench-{prefix}',
+            password=uuid.uuid4().hex, role=UserRole.EXPERT,
+        )
+        expert = ExpertProfile.objects.create(user=expert_user, approval_status=True)
+
+        users = User.objects.bulk_create([
+            User(email=f'bench-{prefix}-{index}@example.com', username=f'bench-{prefix}-{index}',
+                 first_name=f'Danışan {index}', role=UserRole.CLIENT)
+            for index in range(options['clients'])
+        ])
+        ClientProfile.objects.bulk_create([ClientProfile(user=user, expert=expert) for user in users])
+
+        today = timezone.localdate()
+        statuses = ('completed', 'completed', 'confirmed', 'pending', 'cancelled')
+        Appointment.objects.bulk_create([
+            Appointment(
+                expert=expert_user, client=user,
+                date=today + timedelta(days=random.randint(-120, 60)),
+                time=f'{random.randint(8, 18):02d}:00',
+                status=random.choice(statuses),
+            )
+            for user in users
+            for _ in range(options['appointments'])
+        ], batch_size=2000)
+
+        form = Form.objects.create(title=f'bench-{prefix}', scoring_type='binary', max_score=10)
+        FormResponse.objects.bulk_create([
+            FormResponse(form=form, user=user, total_score=random.randint(0, 10), risk_level=random.choice(RISK_LEVELS))
+            for user in users
+        ], batch_size=2000)
+
+        access_token = str(RefreshToken.for_user(expert_user).access_token)
+        factory = APIRequestFactory()
+        view = ClientRosterView.as_view()
+        pages = max(1, options['clients'] // options['limit'])
+
+        def call(offset):
+            request = factory.get('/bench/', {'limit': options['limit'], 'offset': offset})
+            request.COOKIES['access_token'] = access_token
+            response = view(request)
+            if response.status_code != 200:
+                raise CommandError(f'Beklenmeyen cevap: {response.status_code}')
+            return response
+
+        call(0)  # ısınma: kullanıcı cache'i, bağlantı
+        with CaptureQueriesContext(connection) as queries:
+            response = call(0)
+        roster_sql = [query for query in queries if 'accounts_clientprofile' in query['sql']]
+
+        durations = []
+        for index in range(options['requests']):
+            offset = (index % pages) * options['limit']
+            started = time.perf_counter()
+            call(offset)
+            durations.append((time.perf_counter() - started) * 1000)
+
+        durations.sort()
+        self.stdout.write(
+            f"{options['clients']} danışan, {options['clients'] * options['appointments']} randevu, "
+            f"sayfa {options['limit']}: toplam {response.data['count']}"
+        )
+        self.stdout.write(
+            f"p50 {statistics.median(durations):.2f} ms, "
+            f"p95 {durations[min(len(durations) - 1, int(len(durations) * 0.95))]:.2f} ms, "
+            f"{len(queries)} sorgu/istek ({len(roster_sql)} danışan listesi sorgusu)"
+        )
@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+
+from accounts.models import Document, DocumentType
+from accounts.thumbnails import generate_thumbnails
+
+
+class Command(BaseCommand):
+    help = "Güncel profil fotoğrafları için küçük resimleri üretir (mevcut kayıtlar için backfill)."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--all', action='store_true',
+                            help='Küçük resmi olanlar dahil hepsini yeniden üret')
+
+    def handle(self, *args, **options):
+        documents = Document.objects.filter(type=DocumentType.PROFILE_PHOTO, is_current=True)
+        if not options['all']:
+            documents = documents.filter(variants={})
+
+        total = 0
+        for document_id in documents.values_list('id', flat=True).iterator():
+            generate_thumbnails(document_id)
+            total += 1
+        self.stdout.write(f"{total} profil fotoğrafı işlendi.")
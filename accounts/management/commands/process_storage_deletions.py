@@ -0,0 +1,36 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from accounts.storage.gc import MAX_ATTEMPTS, process_deletions
+
+
+class Command(BaseCommand):
+    help = (
+        "Outbox'ta (StorageDeletion) bekleyen dosyaları storage'dan toplu olarak siler. "
+        "--loop ile worker olarak sürekli çalışır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=500, help='delete_many çağrısı başına key sayısı')
+        parser.add_argument('--max-attempts', type=int, default=MAX_ATTEMPTS, help='Bir key için en fazla deneme')
+        parser.add_argument('--loop', action='store_true', help='Worker modu: sürekli çalış')
+        parser.add_argument('--interval', type=int, default=60, help='Worker modunda turlar arası bekleme (sn)')
+
+    def handle(self, *args, **options):
+        if options['batch_size'] < 1:
+            raise CommandError('--batch-size pozitif olmalıdır.')
+
+        while True:
+            result = process_deletions(
+                batch_size=options['batch_size'],
+                max_attempts=options['max_attempts'],
+            )
+            if result.deleted or result.failed or result.skipped or not options['loop']:
+                self.stdout.write(
+                    f"{result.deleted} dosya silindi, {result.failed} başarısız (yeniden denenecek), "
+                    f"{result.skipped} atlandı (tekrar kullanımda)"
+                )
+            if not options['loop']:
+                return
+            time.sleep(options['interval'])
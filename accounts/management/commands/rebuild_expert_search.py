@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+
+from accounts.models import ExpertProfile
+from accounts.text_search import refresh_search_document
+
+
+class Command(BaseCommand):
+    help = (
+        "Uzmanların serbest metin arama metnini (ve SQLite'ta FTS tablosunu) yeniden üretir. "
+        "Hizmet/uzmanlık adları değiştirildiğinde çalıştırılmalıdır."
+    )
+
+    def handle(self, *args, **options):
+        total = 0
+        for expert_id in ExpertProfile.objects.values_list('id', flat=True).iterator():
+            refresh_search_document(expert_id)
+            total += 1
+        self.stdout.write(f"{total} uzmanın arama metni güncellendi.")
@@ -0,0 +1,42 @@
+from datetime import timedelta
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from accounts.models import StorageDeletionReason
+from accounts.storage.gc import find_orphans, schedule_deletion
+
+
+class Command(BaseCommand):
+    help = (
+        "Storage'daki dosyaları Document.file_key ile karşılaştırır; hiçbir güncel belgeye "
+        "ait olmayan dosyaları (ör. finalize edilmemiş upload'lar) silinmek üzere outbox'a yazar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--prefix', default='', help="Sadece bu önekle başlayan key'ler")
+        parser.add_argument('--grace-hours', type=float, default=24,
+                            help='Bu süreden yeni dosyalar (devam eden upload olabilir) atlanır')
+        parser.add_argument('--dry-run', action='store_true', help='Yazmadan sadece raporla')
+
+    def handle(self, *args, **options):
+        try:
+            orphans = find_orphans(options['prefix'], grace=timedelta(hours=options['grace_hours']))
+        except NotImplementedError as exc:
+            raise CommandError(str(exc))
+
+        for key in orphans[:20]:
+            self.stdout.write(f"  {key}")
+        if len(orphans) > 20:
+            self.stdout.write(f"  ... (+{len(orphans) - 20})")
+
+        if options['dry_run']:
+            self.stdout.write(f"[dry-run] {len(orphans)} sahipsiz dosya bulundu.")
+            return
+
+        with transaction.atomic():
+            schedule_deletion(orphans, StorageDeletionReason.ORPHAN)
+        self.stdout.write(
+            f"{len(orphans)} sahipsiz dosya silinmek üzere kuyruğa alındı "
+            "(process_storage_deletions ile silinir)."
+        )
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:09
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StorageDeletion',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('file_key', models.CharField(max_length=255, unique=True)),
+                ('reason', models.CharField(choices=[('document_deleted', 'Belge Silindi'), ('replaced', 'Yenisiyle Değiştirildi'), ('orphan', 'Sahipsiz Dosya')], max_length=32)),
+                ('attempts', models.PositiveIntegerField(default=0, verbose_name='Deneme Sayısı')),
+                ('last_error', models.TextField(blank=True, default='', verbose_name='Son Hata')),
+                ('next_attempt_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now, verbose_name='Sonraki Deneme')),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'verbose_name': 'Bekleyen Dosya Silme',
+                'verbose_name_plural': 'Bekleyen Dosya Silmeleri',
+                'ordering': ['next_attempt_at'],
+            },
+        ),
+    ]
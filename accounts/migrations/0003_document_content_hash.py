@@ -0,0 +1,28 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:11
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0002_storage_deletion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='content_hash',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=128, verbose_name='İçerik Özeti'),
+        ),
+        migrations.AddField(
+            model_name='document',
+            name='size',
+            field=models.PositiveBigIntegerField(blank=True, null=True, verbose_name='Boyut (byte)'),
+        ),
+        migrations.AlterField(
+            model_name='storagedeletion',
+            name='reason',
+            field=models.CharField(choices=[('document_deleted', 'Belge Silindi'), ('replaced', 'Yenisiyle Değiştirildi'), ('duplicate', 'Mükerrer İçerik'), ('orphan', 'Sahipsiz Dosya')], max_length=32),
+        ),
+    ]
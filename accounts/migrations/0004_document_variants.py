@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0003_document_content_hash'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='document',
+            name='variants',
+            field=models.JSONField(blank=True, default=dict, verbose_name='Küçük Resimler'),
+        ),
+    ]
@@ -0,0 +1,88 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:17
+
+import unicodedata
+
+from django.db import migrations, models
+
+# accounts/text_search.py'nin bu migration yazıldığı andaki hâli; modül
+# değişse de geçmiş migration aynı tabloyu ve metni üretir
+FTS_TABLE = 'accounts_expertprofile_fts'
+SEARCH_RELATIONS = ('specializations', 'approach_methods', 'services')
+TURKISH_FOLD = str.maketrans({'ı': 'i', 'ğ': 'g', 'ş': 's', 'ç': 'c', 'ö': 'o', 'ü': 'u'})
+
+PG_INDEXES = (
+    "CREATE INDEX IF NOT EXISTS accounts_expertprofile_search_fts "
+    "ON accounts_expertprofile USING GIN (to_tsvector('simple'::regconfig, COALESCE(search_document, '')))",
+    "CREATE INDEX IF NOT EXISTS accounts_expertprofile_search_trgm "
+    "ON accounts_expertprofile USING GIN (search_document gin_trgm_ops)",
+)
+
+
+def normalize(text):
+    if not text:
+        return ''
+    text = text.replace('I', 'ı').replace('İ', 'i').lower().translate(TURKISH_FOLD)
+    text = ''.join(
+        char for char in unicodedata.normalize('NFKD', text)
+        if not unicodedata.combining(char)
+    )
+    return ' '.join(''.join(char if char.isalnum() else ' ' for char in text).split())
+
+
+def build_search_document(expert):
+    user = expert.user
+    parts = [
+        user.first_name,
+        user.last_name,
+        expert.title,
+        expert.institution,
+        expert.about,
+    ]
+    for relation in SEARCH_RELATIONS:
+        parts.extend(getattr(expert, relation).values_list('name', flat=True))
+    return normalize(' '.join(part for part in parts if part))
+
+
+def create_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+        for sql in PG_INDEXES:
+            schema_editor.execute(sql)
+    elif connection.vendor == 'sqlite':
+        schema_editor.execute(
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5(body, tokenize='trigram')"
+        )
+
+    ExpertProfile = apps.get_model('accounts', 'ExpertProfile')
+    for expert in ExpertProfile.objects.select_related('user').iterator():
+        document = build_search_document(expert)
+        ExpertProfile.objects.filter(pk=expert.pk).update(search_document=document)
+        if connection.vendor == 'sqlite':
+            with connection.cursor() as cursor:
+                cursor.execute(f"INSERT INTO {FTS_TABLE} (rowid, body) VALUES (%s, %s)", [expert.pk, document])
+
+
+def drop_search_index(apps, schema_editor):
+    connection = schema_editor.connection
+    if connection.vendor == 'postgresql':
+        schema_editor.execute("DROP INDEX IF EXISTS accounts_expertprofile_search_fts")
+        schema_editor.execute("DROP INDEX IF EXISTS accounts_expertprofile_search_trgm")
+    elif connection.vendor == 'sqlite':
+        schema_editor.execute(f"DROP TABLE IF EXISTS {FTS_TABLE}")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0004_document_variants'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='expertprofile',
+            name='search_document',
+            field=models.TextField(blank=True, default='', editable=False, verbose_name='Arama Metni'),
+        ),
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:25
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0005_expert_search'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Güncellenme Tarihi'),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='clientprofile',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True, default=django.utils.timezone.now, verbose_name='Güncellenme Tarihi'),
+            preserve_default=False,
+        ),
+        migrations.AlterField(
+            model_name='emergencycontact',
+            name='updated_at',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
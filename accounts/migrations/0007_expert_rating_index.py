@@ -0,0 +1,17 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0006_updated_at_timestamps'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='expertprofile',
+            index=models.Index(condition=models.Q(('approval_status', True)), fields=['-rating_average', '-rating_count', 'id'], name='expert_rating_order_idx'),
+        ),
+    ]
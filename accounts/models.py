@@ -4,6 +4,7 @@ from django.db import models
 from django.core.validators import RegexValidator
 import uuid
 from django.db.models import Q
+from django.utils import timezone
 
 
 class UserRole(models.TextChoices):
@@ -68,6 +69,7 @@ class User(AbstractUser):
     username = models.CharField("Kullanıcı Adı", max_length=150, unique=True, null=True, blank=True)
     timezone = models.CharField("Saat Dilimi", max_length=64, default="Europe/Istanbul",
                                 help_text="Kullanıcının varsayılan saat dilimi")
+    updated_at = models.DateTimeField("Güncellenme Tarihi", auto_now=True)
 
     USERNAME_FIELD = 'email'
     REQUIRED_FIELDS = ['first_name', 'last_name', 'role']
@@ -142,6 +144,8 @@ class ExpertProfile(BaseProfile):
     ])
     rating_average = models.FloatField("Ortalama Puan", default=0)
     rating_count = models.PositiveIntegerField("Puan Sayısı", default=0)
+    # Serbest metin araması için normalize edilmiş metin, bkz. accounts/text_search.py
+    search_document = models.TextField("Arama Metni", blank=True, default="", editable=False)
 
     # İlişkiler
     university = models.ForeignKey("University", verbose_name="Üniversite", on_delete=models.SET_NULL,
@@ -170,6 +174,14 @@ class ExpertProfile(BaseProfile):
     class Meta:
         verbose_name = "Uzman Profili"
         verbose_name_plural = "Uzman Profilleri"
+        indexes = [
+            # Rehberde puana göre sıralama (ExpertListView ?ordering=rating)
+            models.Index(
+                fields=['-rating_average', '-rating_count', 'id'],
+                condition=models.Q(approval_status=True),
+                name='expert_rating_order_idx',
+            ),
+        ]
 
 
 class DocumentType(models.TextChoices):
@@ -205,10 +217,26 @@ class Document(models.Model):
     verified = models.BooleanField(default=False)
     verified_at = models.DateTimeField(null=True, blank=True)
     is_current = models.BooleanField(default=True)
+    # Finalize sırasında storage'dan (HEAD) okunur; aynı içerik tekrar yüklenmez
+    size = models.PositiveBigIntegerField("Boyut (byte)", null=True, blank=True)
+    content_hash = models.CharField("İçerik Özeti", max_length=128, blank=True, default="", db_index=True)
+    # Küçük resimler (profil fotoğrafı): {"64": "<key>", "128": "<key>", ...}, bkz. accounts/thumbnails.py
+    variants = models.JSONField("Küçük Resimler", default=dict, blank=True)
 
     def __str__(self):
         return f"{self.user.get_full_name()} - {self.get_type_display()}"
     
+    def storage_keys(self):
+        """Belgeye ait storage'daki tüm dosyalar (orijinal + küçük resimler)."""
+        return [self.file_key, *self.variants.values()]
+
+    def variant_key(self, size):
+        """size pikselden küçük olmayan en küçük varyant; yoksa orijinal dosya."""
+        for variant_size in sorted(int(s) for s in self.variants):
+            if variant_size >= size:
+                return self.variants[str(variant_size)]
+        return self.file_key
+
     def save(self, *args, **kwargs):
         # Eğer bu dosya primary olarak set edildiyse, 
         # aynı kullanıcı ve aynı tipteki diğer dosyaların primary özelliğini kaldır.
@@ -231,6 +259,35 @@ class Document(models.Model):
     ]
 
 
+class StorageDeletionReason(models.TextChoices):
+    DOCUMENT_DELETED = "document_deleted", "Belge Silindi"
+    REPLACED = "replaced", "Yenisiyle Değiştirildi"
+    DUPLICATE = "duplicate", "Mükerrer İçerik"
+    ORPHAN = "orphan", "Sahipsiz Dosya"
+
+
+class StorageDeletion(models.Model):
+    """
+    Storage'dan silinecek dosyalar için outbox.
+    Belge ile aynı transaction içinde yazılır; silme işlemi
+    process_storage_deletions komutu / arka plan işi tarafından toplu yapılır.
+    """
+    file_key = models.CharField(max_length=255, unique=True)
+    reason = models.CharField(max_length=32, choices=StorageDeletionReason.choices)
+    attempts = models.PositiveIntegerField("Deneme Sayısı", default=0)
+    last_error = models.TextField("Son Hata", blank=True, default="")
+    next_attempt_at = models.DateTimeField("Sonraki Deneme", default=timezone.now, db_index=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    def __str__(self):
+        return self.file_key
+
+    class Meta:
+        verbose_name = "Bekleyen Dosya Silme"
+        verbose_name_plural = "Bekleyen Dosya Silmeleri"
+        ordering = ["next_attempt_at"]
+
+
 class Language(models.Model):
     name = models.CharField(max_length=64, unique=True)
     code = models.CharField(max_length=10, unique=True)  # örn: "tr", "en"
@@ -349,6 +406,7 @@ class ClientProfile(BaseProfile):
     received_service_before = models.BooleanField("Daha Önce Hizmet Aldı mı?", default=False)
     onboarding_complete = models.BooleanField("Profilini Tamamladı mı?", default=False)
     is_active_in_treatment = models.BooleanField("Tedavi Aktif mi?", default=True)
+    updated_at = models.DateTimeField("Güncellenme Tarihi", auto_now=True)
 
     def __str__(self):
         return f"{self.user.get_full_name()} ({self.user.id_number or self.user.national_id})"
@@ -394,7 +452,7 @@ class EmergencyContact(models.Model):
     )
 
     created_at = models.DateTimeField(auto_now_add=True)
-    updated_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Acil Durum İletişimi"
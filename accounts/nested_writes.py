@@ -0,0 +1,120 @@
+"""
+Profil güncellemelerinde iç içe (nested) ilişkilerin fark tabanlı yazımı.
+
+Gelen liste mevcut kayıtlarla bellekte karşılaştırılır; sadece eklenen,
+silinen ve değişen satırlar için toplu sorgu atılır:
+- M2M: ilişki başına en fazla bir INSERT (through tablosuna bulk_create) ve
+  bir DELETE
+- Ters FK (ör. acil durum kişileri): bulk_create, bulk_update ve tek DELETE
+
+Mevcut kayıtlar prefetch edilmişse (bkz. ProfileView.get_object) okumak için
+ek sorgu gerekmez. Toplu işlemler post_save üretmez; M2M değişiklikleri için
+m2m_changed sinyali elle gönderilir, böylece arama indeksi ve profil cache'i
+(accounts/signals.py) güncel kalır. Çağıranlar işlemi transaction içinde
+yapmalıdır.
+"""
+from django.db import router
+from django.db.models.signals import m2m_changed
+from django.utils import timezone
+
+
+def _drop_prefetched(instance, name):
+    getattr(instance, '_prefetched_objects_cache', {}).pop(name, None)
+
+
+def sync_many_to_many(instance, field_name, targets):
+    """instance.<field_name> ilişkisini targets listesine eşitler."""
+    field = instance._meta.get_field(field_name)
+    through = field.remote_field.through
+    model = field.related_model
+    using = router.db_for_write(through, instance=instance)
+    source_column, target_column = field.m2m_column_name(), field.m2m_reverse_name()
+
+    current = {obj.pk for obj in getattr(instance, field_name).all()}
+    wanted = list(dict.fromkeys(obj.pk for obj in targets))
+    removed = current.difference(wanted)
+    added = [pk for pk in wanted if pk not in current]
+
+    signal_kwargs = {'sender': through, 'instance': instance, 'reverse': False, 'model': model, 'using': using}
+    if removed:
+        m2m_changed.send(action='pre_remove', pk_set=removed, **signal_kwargs)
+        through._default_manager.using(using).filter(**{
+            source_column: instance.pk,
+            f'{target_column}__in': removed,
+        }).delete()
+        m2m_changed.send(action='post_remove', pk_set=removed, **signal_kwargs)
+    if added:
+        m2m_changed.send(action='pre_add', pk_set=set(added), **signal_kwargs)
+        through._default_manager.using(using).bulk_create(
+            [through(**{source_column: instance.pk, target_column: pk}) for pk in added],
+            # Aynı anda gelen başka bir istek aynı satırı eklemiş olabilir
+            ignore_conflicts=True,
+        )
+        m2m_changed.send(action='post_add', pk_set=set(added), **signal_kwargs)
+
+    if removed or added:
+        _drop_prefetched(instance, field_name)
+    return added, removed
+
+
+def sync_related(instance, related_name, items, fields):
+    """
+    instance.<related_name> (ters FK) kayıtlarını items listesine eşitler.
+
+    id içeren öğeler o kaydı günceller. id içermeyen öğeler, alanları birebir
+    aynı olan sahipsiz bir mevcut kayıtla eşleşirse dokunulmaz, aksi halde
+    yeni kayıt olur. Listede karşılığı olmayan mevcut kayıtlar silinir.
+    (created, updated, deleted) sayılarını döner.
+    """
+    manager = getattr(instance, related_name)
+    model = manager.model
+    existing = {obj.pk: obj for obj in manager.all()}
+    defaults = {name: model._meta.get_field(name).get_default() for name in fields}
+
+    claimed = {}
+    for item in items:
+        pk = item.get('id')
+        if pk in existing and pk not in claimed:
+            claimed[pk] = item
+
+    to_create, to_update, changed_fields = [], [], set()
+    for item in items:
+        pk = item.get('id')
+        if pk in claimed and claimed[pk] is item:
+            obj = existing[pk]
+        else:
+            values = {name: item.get(name, defaults[name]) for name in fields}
+            obj = next((
+                candidate for candidate_pk, candidate in existing.items()
+                if candidate_pk not in claimed
+                and all(getattr(candidate, name) == value for name, value in values.items())
+            ), None)
+            if obj is None:
+                to_create.append(model(**{manager.field.name: instance}, **values))
+                continue
+            claimed[obj.pk] = item
+
+        changes = [name for name in fields if name in item and getattr(obj, name) != item[name]]
+        if changes:
+            for name in changes:
+                setattr(obj, name, item[name])
+            changed_fields.update(changes)
+            to_update.append(obj)
+
+    deleted = [pk for pk in existing if pk not in claimed]
+    if deleted:
+        model._default_manager.filter(pk__in=deleted).delete()
+    if to_update:
+        # bulk_update auto_now alanlarını doldurmaz
+        if any(field.name == 'updated_at' for field in model._meta.concrete_fields):
+            now = timezone.now()
+            for obj in to_update:
+                obj.updated_at = now
+            changed_fields.add('updated_at')
+        model._default_manager.bulk_update(to_update, sorted(changed_fields))
+    if to_create:
+        model._default_manager.bulk_create(to_create)
+
+    if deleted or to_update or to_create:
+        _drop_prefetched(instance, related_name)
+    return len(to_create), len(to_update), len(deleted)
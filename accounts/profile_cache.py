@@ -0,0 +1,77 @@
+"""
+Serileştirilmiş profil (/profile/ GET cevabı) cache'i.
+
+Profil cevabı uzman için 6 M2M, 3 FK ve belgeleri, danışan için bağımlılık
+türleri, acil durum kişileri, atanan uzman ve belgeleri içerir. Cevap
+kullanıcı başına PROFILE_CACHE_TIMEOUT saniye cache'te tutulur; profil,
+kullanıcı, M2M ilişkileri, belgeler, acil durum kişileri veya atanan uzman
+değiştiğinde girdi düşürülür (signals.py).
+
+Belgelerin imzalı URL'leri cache'te saklanmaz; her okumada presign cache'inden
+(accounts/storage/presign_cache.py) yeniden doldurulur, böylece cache ömrü
+URL ömrüne bağlı kalmaz. Sözlük adları değiştiğinde (taxonomies ETag'i)
+girdi kendiliğinden geçersiz sayılır.
+
+Girdi sadece değişikliği yapan worker'ın cache'inden düşürülebildiği için
+cache varsayılan olarak sadece paylaşılan bir cache (CACHE_URL) verildiğinde
+açıktır; süreç içi cache ile açılırsa manage.py check uyarı verir (checks.py).
+"""
+import copy
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import ClientProfile
+from .serializers.document_serializers import ACCESS_URL_EXPIRES
+from .storage.presign_cache import presign_download_many_cached
+from .taxonomies import get_snapshot
+
+
+def cache_key(user_id):
+    return f'profile:{user_id}'
+
+
+def get_profile(user_id):
+    """Cache'teki profil cevabı (imzalı URL'ler tazelenmiş) veya None."""
+    if not getattr(settings, 'PROFILE_CACHE_TIMEOUT', 0):
+        return None
+    entry = cache.get(cache_key(user_id))
+    if entry is None or entry['taxonomies'] != get_snapshot().etag:
+        return None
+
+    data = copy.deepcopy(entry['data'])
+    try:
+        urls = presign_download_many_cached(entry['document_keys'], expires=ACCESS_URL_EXPIRES)
+    except Exception:
+        # storage ile db tutarsız → sessizce yok say
+        urls = {}
+    for document, key in zip(data.get('documents', []), entry['document_keys']):
+        document['access_url'] = urls.get(key)
+    return data
+
+
+def set_profile(user_id, data, document_keys):
+    """data['documents'] ile aynı sırada belge file_key'leri verilmelidir."""
+    timeout = getattr(settings, 'PROFILE_CACHE_TIMEOUT', 0)
+    if not timeout:
+        return
+    cache.set(cache_key(user_id), {
+        'data': data,
+        'document_keys': list(document_keys),
+        'taxonomies': get_snapshot().etag,
+    }, timeout)
+
+
+def invalidate_profile(*user_ids):
+    keys = [cache_key(user_id) for user_id in user_ids]
+    if not keys:
+        return
+    cache.delete_many(keys)
+    # Commit öncesi başka bir istek eski veriyi tekrar cache'e yazmış olabilir
+    transaction.on_commit(lambda: cache.delete_many(keys))
+
+
+def invalidate_assigned_clients(expert_user_id):
+    """Uzmanın adı/unvanı danışan profillerinde görünür."""
+    invalidate_profile(*ClientProfile.objects.filter(expert__user_id=expert_user_id).values_list('user_id', flat=True))
@@ -0,0 +1,76 @@
+"""
+Uzman paneli için danışan listesi (roster).
+
+Uzmana atanmış her danışan için sıradaki randevu, son tamamlanan randevu, en
+son doldurulan formun risk seviyesi ve randevu/form sayıları korelasyonlu alt
+sorgularla (Subquery/OuterRef) annotate edilir; sayfa ve toplam kayıt sayısı
+(pencere fonksiyonu) tek SQL ifadesiyle okunur. Alt sorgular
+appointment_roster_idx ve formresponse_user_latest_idx indekslerini kullanır.
+"""
+from django.db.models import Count, F, IntegerField, OuterRef, Q, Subquery, Value, Window
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from appointments.models import Appointment
+from forms.models import FormResponse
+
+from .models import ClientProfile
+
+# Henüz gerçekleşmemiş (iptal edilmemiş) randevu durumları
+UPCOMING_STATUSES = ('pending', 'waiting_approval', 'confirmed', 'cancel_requested')
+
+
+def _count(queryset, group_by):
+    """Korelasyonlu alt sorguyla satır sayısı (JOIN + GROUP BY satırları çoğaltmasın diye)."""
+    return Coalesce(
+        Subquery(
+            queryset.order_by().values(group_by).annotate(total=Count('id')).values('total'),
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def roster_queryset(expert_user, now=None):
+    """Uzmana atanmış danışanlar; sıradaki randevusu en yakın olan önce."""
+    now = timezone.localtime(now or timezone.now())
+    today, current_time = now.date(), now.time()
+
+    appointments = Appointment.objects.filter(client_id=OuterRef('user_id'), expert=expert_user, is_deleted=False)
+    upcoming = appointments.filter(status__in=UPCOMING_STATUSES).filter(
+        Q(date__gt=today) | Q(date=today, time__gte=current_time)
+    )
+    next_appointment = upcoming.order_by('date', 'time', 'id')
+    completed = appointments.filter(status='completed')
+    last_completed = completed.order_by('-date', '-time', '-id')
+    responses = FormResponse.objects.filter(user_id=OuterRef('user_id'))
+    latest_response = responses.order_by('-submitted_at', '-id')
+
+    return (
+        ClientProfile.objects.filter(expert__user=expert_user)
+        .select_related('user')
+        .annotate(
+            next_appointment_id=Subquery(next_appointment.values('id')[:1]),
+            next_appointment_date=Subquery(next_appointment.values('date')[:1]),
+            next_appointment_time=Subquery(next_appointment.values('time')[:1]),
+            next_appointment_status=Subquery(next_appointment.values('status')[:1]),
+            last_completed_id=Subquery(last_completed.values('id')[:1]),
+            last_completed_date=Subquery(last_completed.values('date')[:1]),
+            last_completed_time=Subquery(last_completed.values('time')[:1]),
+            latest_form_title=Subquery(latest_response.values('form__title')[:1]),
+            latest_risk_level=Subquery(latest_response.values('risk_level')[:1]),
+            latest_form_submitted_at=Subquery(latest_response.values('submitted_at')[:1]),
+            upcoming_count=_count(upcoming, 'client_id'),
+            completed_count=_count(completed, 'client_id'),
+            form_response_count=_count(responses, 'user_id'),
+            # Sayfalamada toplam kayıt sayısı ayrı COUNT sorgusu gerektirmez
+            total_count=Window(Count('id')),
+        )
+        .order_by(
+            F('next_appointment_date').asc(nulls_last=True),
+            F('next_appointment_time').asc(nulls_last=True),
+            'user__first_name',
+            'user__last_name',
+            'id',
+        )
+    )
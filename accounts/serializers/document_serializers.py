@@ -1,7 +1,38 @@
 from rest_framework import serializers
-from accounts.models import Document, DocumentType
+from accounts.background import run_in_background
+from accounts.models import Document, DocumentType, StorageDeletionReason, UserRole
 from accounts.storage import storage
-from django.db import transaction, IntegrityError
+from accounts.storage.gc import process_deletions, schedule_deletion
+from accounts.storage.presign_cache import presign_download_cached, presign_download_many_cached
+from accounts.thumbnails import generate_thumbnails
+from django.db import models, transaction, IntegrityError
+
+ACCESS_URL_EXPIRES = 3600
+
+
+def _can_access(obj, user):
+    return bool(user) and obj.user_id == user.id and obj.is_current
+
+
+class DocumentListSerializer(serializers.ListSerializer):
+    """
+    Listedeki tüm dokümanların URL'lerini tek bir toplu presign çağrısıyla
+    hazırlar; DocumentSerializer.get_access_url bu sonuçtan okur.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+
+        request = self.context.get("request")
+        user = request.user if request else None
+        keys = [obj.file_key for obj in items if _can_access(obj, user)]
+        try:
+            self.child._access_urls = presign_download_many_cached(keys, expires=ACCESS_URL_EXPIRES)
+        except Exception:
+            # storage ile db tutarsız → sessizce yok say
+            self.child._access_urls = {}
+
+        return super().to_representation(items)
 
 
 class DocumentSerializer(serializers.ModelSerializer):
@@ -26,8 +57,11 @@ class DocumentSerializer(serializers.ModelSerializer):
             "updated_at",
             "verified",
             "verified_at",
+            "size",
         ]
+        list_serializer_class = DocumentListSerializer
         read_only_fields = [
+            "size",
             "uploaded_at",
             "updated_at",
             "verified",
@@ -44,17 +78,16 @@ class DocumentSerializer(serializers.ModelSerializer):
         request = self.context.get("request")
         user = request.user if request else None
 
-        if not user or obj.user_id != user.id:
+        if not _can_access(obj, user):
             return None
 
-        if not obj.is_current:
-            return None
+        # Liste içinde: URL'ler DocumentListSerializer tarafından toplu üretildi
+        access_urls = getattr(self, "_access_urls", None)
+        if access_urls is not None:
+            return access_urls.get(obj.file_key)
 
         try:
-            return storage.presign_download(
-                key=obj.file_key,
-                expires=3600
-            )
+            return presign_download_cached(obj.file_key, expires=ACCESS_URL_EXPIRES)
         except Exception as exc:
             # storage ile db tutarsız → sessizce yok say
             return None
@@ -108,10 +141,39 @@ class DocumentSerializer(serializers.ModelSerializer):
                 )
             })
 
-    
+        # Key presign-upload'da bu kullanıcı için üretilmiş olmalı
+        role_path = "experts" if user.role == UserRole.EXPERT else "clients"
+        if not file_key.startswith(f"{role_path}/{user.id}/"):
+            raise serializers.ValidationError({
+                "file_key": "Bu dosya anahtarı size ait değil."
+            })
+
+        # Dosya gerçekten yüklenmiş mi? (HEAD)
+        head = storage.head(file_key)
+        if head is None:
+            raise serializers.ValidationError({
+                "file_key": "Dosya storage'da bulunamadı. Önce upload işlemini tamamlayın."
+            })
+        size = head.get("size")
+        content_hash = head.get("content_hash") or ""
+
         try:
             with transaction.atomic():
 
+                # Aynı içerik aynı tipte zaten yüklüyse mevcut belge döner,
+                # yeni yüklenen kopya silinmek üzere kuyruğa alınır
+                if content_hash:
+                    duplicate = Document.objects.filter(
+                        user=user,
+                        type=doc_type,
+                        is_current=True,
+                        content_hash=content_hash
+                    ).first()
+                    if duplicate:
+                        schedule_deletion([file_key], StorageDeletionReason.DUPLICATE)
+                        run_in_background(process_deletions, max_batches=1)
+                        return duplicate
+
                 single_instance_types = [DocumentType.PROFILE_PHOTO]
 
                 # Profil foto
@@ -123,23 +185,80 @@ class DocumentSerializer(serializers.ModelSerializer):
                     ).first()
 
                     if existing_doc:
-                        storage.delete(existing_doc.file_key)
+                        # Eski dosya commit sonrası toplu silinir (outbox)
+                        schedule_deletion(existing_doc.storage_keys(), StorageDeletionReason.REPLACED)
+                        run_in_background(process_deletions, max_batches=1)
 
                         existing_doc.file_key = file_key
                         existing_doc.original_filename = original_filename
+                        existing_doc.size = size
+                        existing_doc.content_hash = content_hash
+                        existing_doc.variants = {}
                         existing_doc.is_primary = True
                         existing_doc.save()
+                        run_in_background(generate_thumbnails, existing_doc.id)
                         return existing_doc
 
                 # Normal doküman
-                return Document.objects.create(
+                document = Document.objects.create(
                     user=user,
                     original_filename=original_filename,
                     file_key=file_key,
                     type=doc_type,
-                    is_primary=is_primary
+                    is_primary=is_primary,
+                    size=size,
+                    content_hash=content_hash
                 )
+                if doc_type == DocumentType.PROFILE_PHOTO:
+                    run_in_background(generate_thumbnails, document.id)
+                return document
                 
         except IntegrityError:
             # race condition fallback
-            return Document.objects.get(file_key=file_key)
\ No newline at end of file
+            return Document.objects.get(file_key=file_key)
+
+
+def profile_photo_prefetch(lookup="documents", to_attr="profile_photos"):
+    """
+    Kullanıcıların güncel profil fotoğraflarını listeler için tek sorguda getirir.
+    Örn. ExpertProfile listesinde: prefetch_related(profile_photo_prefetch("user__documents"))
+    """
+    return models.Prefetch(
+        lookup,
+        queryset=Document.objects.filter(type=DocumentType.PROFILE_PHOTO, is_current=True)
+        .only("id", "user_id", "file_key", "variants")
+        .order_by("-is_primary", "-updated_at"),
+        to_attr=to_attr,
+    )
+
+
+def profile_photo_keys(users, size=128):
+    """
+    profile_photo_prefetch ile gelen fotoğraflardan {user_id: key} üretir;
+    küçük resim varsa size piksele uyan varyant seçilir.
+    """
+    keys = {}
+    for user in users:
+        photos = getattr(user, "profile_photos", None)
+        if photos:
+            keys[user.id] = photos[0].variant_key(size)
+    return keys
+
+
+def get_profile_photo_url(user, size=128):
+    """
+    Kullanıcının güncel profil fotoğrafı için (cache'lenmiş) indirme URL'si.
+    Küçük resimler üretildiyse size piksele uyan varyant döner.
+    """
+    document = (
+        Document.objects.filter(user=user, type=DocumentType.PROFILE_PHOTO, is_current=True)
+        .only("file_key", "variants")
+        .first()
+    )
+    if not document:
+        return None
+    try:
+        return presign_download_cached(document.variant_key(size), expires=ACCESS_URL_EXPIRES)
+    except Exception:
+        # storage ile db tutarsız → sessizce yok say
+        return None
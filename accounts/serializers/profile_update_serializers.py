@@ -1,12 +1,15 @@
 # accounts/serializers/base_update_serializer.py
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
-from accounts.models import EmergencyContact, GenderChoices
+from django.db import transaction
+from accounts.models import GenderChoices
 from rest_framework import serializers
 from accounts.models import (
-    ExpertProfile, ClientProfile, Language, AddictionType
-    # Diğer Foreign Key/M2M modellerini de eklemeyi unutmayın
+    ExpertProfile, ClientProfile, Language, AddictionType, Service, Specialization,
+    ApproachMethod, TargetGroup, SessionType, University, DegreeLevel, Major
 )
+from accounts.nested_writes import sync_many_to_many, sync_related
+from accounts.taxonomies import TaxonomyPrimaryKeyRelatedField, TaxonomySlugRelatedField
 from .document_serializers import DocumentSerializer
 from .serializers import EmergencyContactSerializer
 
@@ -44,17 +47,48 @@ class BaseUserUpdateSerializer(serializers.ModelSerializer):
         if value is not None and value not in [choice.value for choice in GenderChoices]:
             raise serializers.ValidationError('Geçersiz cinsiyet değeri.')
         return value
-    
 
-class ExpertProfileUpdateSerializer(serializers.ModelSerializer):
+
+class BaseProfileUpdateSerializer(serializers.ModelSerializer):
+    """
+    Profilin kendi alanlarını kaydeder, M2M ilişkilerini fark tabanlı yazar
+    (accounts/nested_writes.py). ModelSerializer.update her M2M için ayrı
+    set() çağırır; burada ilişki başına en fazla bir INSERT ve bir DELETE atılır.
+    """
+    m2m_fields = ()
+
+    def update(self, instance, validated_data):
+        relations = {
+            name: validated_data.pop(name)
+            for name in self.m2m_fields
+            if name in validated_data
+        }
+        instance = super().update(instance, validated_data)
+        for name, targets in relations.items():
+            sync_many_to_many(instance, name, targets)
+        return instance
+
+
+class EmergencyContactWriteSerializer(EmergencyContactSerializer):
+    # Mevcut bir kaydı güncellemek için id gönderilir
+    id = serializers.IntegerField(required=False)
+
+
+class ExpertProfileUpdateSerializer(BaseProfileUpdateSerializer):
     documents = DocumentSerializer(source="user.documents", many=True, read_only=True)
     user_data = BaseUserUpdateSerializer(source='user', required=False)
-    languages = serializers.SlugRelatedField(
-        many=True,
-        slug_field='code',
-        queryset=Language.objects.all(), 
-        required=False 
-    )
+    # Sözlük alanları liste başına tek sorguyla veritabanından doğrulanır (accounts/taxonomies.py)
+    languages = TaxonomySlugRelatedField(Language, slug_field='code', many=True, required=False)
+    services = TaxonomyPrimaryKeyRelatedField(Service, many=True, required=False)
+    specializations = TaxonomyPrimaryKeyRelatedField(Specialization, many=True, required=False)
+    approach_methods = TaxonomyPrimaryKeyRelatedField(ApproachMethod, many=True, required=False)
+    target_groups = TaxonomyPrimaryKeyRelatedField(TargetGroup, many=True, required=False)
+    session_types = TaxonomyPrimaryKeyRelatedField(SessionType, many=True, required=False)
+    university = TaxonomyPrimaryKeyRelatedField(University, required=False, allow_null=True)
+    degree_level = TaxonomyPrimaryKeyRelatedField(DegreeLevel, required=False, allow_null=True)
+    major = TaxonomyPrimaryKeyRelatedField(Major, required=False, allow_null=True)
+
+    m2m_fields = ("services", "specializations", "languages", "approach_methods", "target_groups", "session_types")
 
     class Meta:
         model = ExpertProfile
@@ -83,6 +117,7 @@ class ExpertProfileUpdateSerializer(serializers.ModelSerializer):
 
         return super().validate(attrs)
 
+    @transaction.atomic
     def update(self, instance, validated_data):
         user_data = validated_data.pop('user', None)
         user_instance = instance.user
@@ -101,15 +136,13 @@ class ExpertProfileUpdateSerializer(serializers.ModelSerializer):
 
 
 
-class ClientProfileUpdateSerializer(serializers.ModelSerializer):
+class ClientProfileUpdateSerializer(BaseProfileUpdateSerializer):
     documents = DocumentSerializer(source="user.documents", many=True, read_only=True)
     user_data = BaseUserUpdateSerializer(source='user', required=False)
-    substances_used = serializers.PrimaryKeyRelatedField(
-        queryset=AddictionType.objects.all(), 
-        many=True, 
-        required=False
-    )
-    emergency_contacts = EmergencyContactSerializer(many=True, required=False)
+    substances_used = TaxonomyPrimaryKeyRelatedField(AddictionType, many=True, required=False)
+    emergency_contacts = EmergencyContactWriteSerializer(many=True, required=False)
+
+    m2m_fields = ("substances_used",)
 
     class Meta:
         model = ClientProfile
@@ -138,6 +171,14 @@ class ClientProfileUpdateSerializer(serializers.ModelSerializer):
 
         return super().validate(attrs)
 
+    def validate_emergency_contacts(self, value):
+        ids = [item['id'] for item in value if item.get('id') is not None]
+        existing = {contact.pk for contact in self.instance.emergency_contacts.all()} if self.instance else set()
+        if len(ids) != len(set(ids)) or not existing.issuperset(ids):
+            raise serializers.ValidationError('Geçersiz acil durum kişisi.')
+        return value
+
+    @transaction.atomic
     def update(self, instance, validated_data):
         # 1. Acil durum kişilerini pop ile al (super().update hata vermesin diye)
         # 'source' kullandığımız için validated_data içine 'emergency_contacts' anahtarıyla gelir
@@ -154,10 +195,13 @@ class ClientProfileUpdateSerializer(serializers.ModelSerializer):
 
         # 3. Emergency Contact verilerini işle
         if emergency_data is not None:
-            # Mevcutları silip yenileri eklemek en temiz yoldur
-            instance.emergency_contacts.all().delete()
-            for contact_item in emergency_data:
-                EmergencyContact.objects.create(client_profile=instance, **contact_item)
+            # Gönderilen liste mevcut kişilerin yerini alır; sadece farklar yazılır
+            sync_related(
+                instance,
+                'emergency_contacts',
+                emergency_data,
+                fields=['name', 'phone_number', 'relationship', 'is_primary'],
+            )
 
-        # 4. Profilin kendi alanlarını güncelle
+        # 4. Profilin kendi alanlarını ve M2M ilişkilerini güncelle
         return super().update(instance, validated_data)
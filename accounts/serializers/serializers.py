@@ -1,6 +1,7 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model, authenticate
 from django.contrib.auth.password_validation import validate_password
+from django.db import models
 from django.utils.translation import gettext_lazy as _
 from accounts.models import (UserRole,
                              AdminProfile,
@@ -10,6 +11,11 @@ from accounts.models import (UserRole,
                              University,
                              GenderChoices,
                              EmergencyContact)
+from accounts.serializers.document_serializers import (ACCESS_URL_EXPIRES,
+                                                       get_profile_photo_url,
+                                                       profile_photo_keys)
+from accounts.storage.presign_cache import presign_download_many_cached
+from accounts.taxonomies import TaxonomyPrimaryKeyRelatedField
 
 User = get_user_model()
 
@@ -20,18 +26,44 @@ class AdminProfileSerializer(serializers.ModelSerializer):
         fields = []
 
 
+class ExpertDirectoryListSerializer(serializers.ListSerializer):
+    """
+    Listedeki uzmanların profil fotoğrafı URL'lerini tek bir toplu presign
+    çağrısıyla hazırlar. Queryset fotoğrafları profile_photo_prefetch ile getirmelidir.
+    """
+
+    def to_representation(self, data):
+        items = list(data.all() if isinstance(data, models.manager.BaseManager) else data)
+
+        photo_keys = profile_photo_keys(
+            (item.user for item in items), size=ExpertListSerializer.PHOTO_SIZE
+        )
+        try:
+            urls = presign_download_many_cached(list(photo_keys.values()), expires=ACCESS_URL_EXPIRES)
+        except Exception:
+            # storage ile db tutarsız → sessizce yok say
+            urls = {}
+        self.child._photo_urls = {user_id: urls.get(key) for user_id, key in photo_keys.items()}
+
+        return super().to_representation(items)
+
+
 class ExpertListSerializer(serializers.ModelSerializer):
     """Simplified serializer for expert listing with basic profile info"""
+    # Listede gösterilecek profil fotoğrafı küçük resmi (px)
+    PHOTO_SIZE = 128
+
     first_name = serializers.CharField(source='user.first_name', read_only=True)
     last_name = serializers.CharField(source='user.last_name', read_only=True)
     email = serializers.EmailField(source='user.email', read_only=True)
     phone_number = serializers.CharField(source='user.phone_number', read_only=True)
-    profile_photo = serializers.ImageField(source='user.profile_photo', read_only=True)
+    profile_photo = serializers.SerializerMethodField()
     gender = serializers.CharField(source='user.gender', read_only=True)
     services = serializers.SerializerMethodField()
 
     class Meta:
         model = ExpertProfile
+        list_serializer_class = ExpertDirectoryListSerializer
         fields = [
             'id',
             'first_name',
@@ -44,10 +76,20 @@ class ExpertListSerializer(serializers.ModelSerializer):
             'approval_status',
             'gender',
             'services',
+            'rating_average',
+            'rating_count',
         ]
 
+    def get_profile_photo(self, obj):
+        # Liste içinde: URL'ler ExpertDirectoryListSerializer tarafından toplu üretildi
+        photo_urls = getattr(self, '_photo_urls', None)
+        if photo_urls is not None:
+            return photo_urls.get(obj.user_id)
+        return get_profile_photo_url(obj.user, size=self.PHOTO_SIZE)
+
     def get_services(self, obj):
         """Return list of service names"""
+        # services prefetch edildiyse sorgu atılmaz
         return [service.name for service in obj.services.all()]
 
 
@@ -173,11 +215,7 @@ class ExpertRegisterSerializer(BaseRegisterSerializer):
 class ClientRegisterSerializer(BaseRegisterSerializer):
     support_goal = serializers.CharField(required=False, allow_blank=True)
     received_service_before = serializers.BooleanField(default=False)
-    substances_used = serializers.ListField(
-        child=serializers.PrimaryKeyRelatedField(queryset=AddictionType.objects.all()),
-        required=True,
-        allow_empty=False
-    )
+    substances_used = TaxonomyPrimaryKeyRelatedField(AddictionType, many=True, allow_empty=False)
 
     def create(self, validated_data):
         substances_used = validated_data.pop('substances_used', [])
@@ -247,6 +285,71 @@ class ClientListSerializer(serializers.ModelSerializer):
         """Return list of addiction type names"""
         return [addiction.name for addiction in obj.substances_used.all()]
 
+
+class ClientRosterSerializer(serializers.ModelSerializer):
+    """
+    Uzman panelindeki danışan satırı; alanlar accounts/roster.py
+    roster_queryset annotate'lerinden okunur, ek sorgu çalıştırmaz.
+    """
+    first_name = serializers.CharField(source='user.first_name', read_only=True)
+    last_name = serializers.CharField(source='user.last_name', read_only=True)
+    email = serializers.EmailField(source='user.email', read_only=True)
+    phone_number = serializers.CharField(source='user.phone_number', read_only=True)
+    next_appointment = serializers.SerializerMethodField()
+    last_completed_appointment = serializers.SerializerMethodField()
+    latest_form = serializers.SerializerMethodField()
+    counts = serializers.SerializerMethodField()
+
+    class Meta:
+        model = ClientProfile
+        fields = [
+            'id',
+            'first_name',
+            'last_name',
+            'email',
+            'phone_number',
+            'is_active_in_treatment',
+            'next_appointment',
+            'last_completed_appointment',
+            'latest_form',
+            'counts',
+        ]
+
+    def get_next_appointment(self, obj):
+        if obj.next_appointment_id is None:
+            return None
+        return {
+            'id': obj.next_appointment_id,
+            'date': obj.next_appointment_date,
+            'time': obj.next_appointment_time,
+            'status': obj.next_appointment_status,
+        }
+
+    def get_last_completed_appointment(self, obj):
+        if obj.last_completed_id is None:
+            return None
+        return {
+            'id': obj.last_completed_id,
+            'date': obj.last_completed_date,
+            'time': obj.last_completed_time,
+        }
+
+    def get_latest_form(self, obj):
+        if obj.latest_form_submitted_at is None:
+            return None
+        return {
+            'title': obj.latest_form_title,
+            'risk_level': obj.latest_risk_level,
+            'submitted_at': obj.latest_form_submitted_at,
+        }
+
+    def get_counts(self, obj):
+        return {
+            'upcoming_appointments': obj.upcoming_count,
+            'completed_appointments': obj.completed_count,
+            'form_responses': obj.form_response_count,
+        }
+
 # -----------------------------
 # Admin Register Serializer
 # -----------------------------
@@ -0,0 +1,199 @@
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+from django.utils import timezone
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken
+
+from . import expert_search, taxonomies, text_search
+from .blacklist import add_local, bump_version
+from .models import AdminProfile, ClientProfile, Document, EmergencyContact, ExpertProfile, User, UserRole
+from .profile_cache import invalidate_assigned_clients, invalidate_profile
+from .user_cache import invalidate_user
+
+
+@receiver(post_save, sender=BlacklistedToken)
+def token_blacklisted(sender, instance, created, **kwargs):
+    if not created:
+        return
+    jti = instance.token.jti
+
+    def publish():
+        add_local(jti)
+        bump_version()
+
+    # Diğer süreçler kaydı ancak commit sonrası görebilir
+    transaction.on_commit(publish)
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def user_changed(sender, instance, **kwargs):
+    invalidate_user(instance.pk)
+
+
+@receiver(post_save, sender=ExpertProfile)
+@receiver(post_delete, sender=ExpertProfile)
+@receiver(post_save, sender=ClientProfile)
+@receiver(post_delete, sender=ClientProfile)
+@receiver(post_save, sender=AdminProfile)
+@receiver(post_delete, sender=AdminProfile)
+def profile_changed(sender, instance, **kwargs):
+    invalidate_user(instance.user_id)
+
+
+@receiver(post_save, sender=ExpertProfile)
+@receiver(post_delete, sender=ExpertProfile)
+def expert_search_changed(sender, **kwargs):
+    transaction.on_commit(expert_search.bump_version)
+
+
+def expert_facets_changed(sender, action, **kwargs):
+    if action in ('post_add', 'post_remove', 'post_clear'):
+        transaction.on_commit(expert_search.bump_version)
+
+
+for _facet in expert_search.FACETS:
+    m2m_changed.connect(
+        expert_facets_changed,
+        sender=getattr(ExpertProfile, _facet).through,
+        dispatch_uid=f'expert_search_{_facet}',
+    )
+
+
+@receiver(post_save, sender=ExpertProfile)
+def expert_search_document_changed(sender, instance, **kwargs):
+    text_search.refresh_search_document(instance.pk)
+
+
+@receiver(post_delete, sender=ExpertProfile)
+def expert_search_document_removed(sender, instance, **kwargs):
+    text_search.remove_search_document(instance.pk)
+
+
+@receiver(post_save, sender=User)
+def expert_name_changed(sender, instance, **kwargs):
+    # Ad/soyad arama metnine dahil
+    if instance.role != UserRole.EXPERT:
+        return
+    for expert_id in ExpertProfile.objects.filter(user_id=instance.pk).values_list('id', flat=True):
+        text_search.refresh_search_document(expert_id)
+
+
+def expert_search_relations_changed(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    # reverse: değişiklik hizmet/uzmanlık tarafından yapıldı, pk_set uzman id'leri
+    expert_ids = (pk_set or ()) if reverse else (instance.pk,)
+    for expert_id in expert_ids:
+        text_search.refresh_search_document(expert_id)
+
+
+for _relation in text_search.SEARCH_RELATIONS:
+    m2m_changed.connect(
+        expert_search_relations_changed,
+        sender=getattr(ExpertProfile, _relation).through,
+        dispatch_uid=f'expert_text_search_{_relation}',
+    )
+
+
+def taxonomy_changed(sender, **kwargs):
+    transaction.on_commit(taxonomies.bump_version)
+
+
+for _model in taxonomies.TAXONOMY_MODELS:
+    post_save.connect(taxonomy_changed, sender=_model, dispatch_uid=f'taxonomy_saved_{_model.__name__}')
+    post_delete.connect(taxonomy_changed, sender=_model, dispatch_uid=f'taxonomy_deleted_{_model.__name__}')
+
+
+# -----------------------------
+# Serileştirilmiş profil cache'i (/profile/)
+# -----------------------------
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+@receiver(post_save, sender=ExpertProfile)
+@receiver(post_save, sender=ClientProfile)
+@receiver(post_delete, sender=ClientProfile)
+def profile_cache_changed(sender, instance, **kwargs):
+    user_id = instance.pk if sender is User else instance.user_id
+    invalidate_profile(user_id)
+    if sender is ExpertProfile or (sender is User and instance.role == UserRole.EXPERT):
+        invalidate_assigned_clients(user_id)
+
+
+@receiver(pre_delete, sender=ExpertProfile)
+def profile_cache_expert_removed(sender, instance, **kwargs):
+    # Danışanların expert alanı SET_NULL ile sinyalsiz boşaltılır
+    invalidate_profile(instance.user_id)
+    invalidate_assigned_clients(instance.user_id)
+
+
+@receiver(post_save, sender=Document)
+@receiver(post_delete, sender=Document)
+def profile_cache_document_changed(sender, instance, **kwargs):
+    invalidate_profile(instance.user_id)
+
+
+@receiver(post_save, sender=EmergencyContact)
+@receiver(post_delete, sender=EmergencyContact)
+def profile_cache_contact_changed(sender, instance, **kwargs):
+    invalidate_profile(*ClientProfile.objects.filter(pk=instance.client_profile_id).values_list('user_id', flat=True))
+
+
+def profile_cache_relations_changed(sender, instance, action, reverse, model, pk_set, **kwargs):
+    if action not in ('post_add', 'post_remove', 'post_clear'):
+        return
+    if not reverse:
+        invalidate_profile(instance.user_id)
+        return
+    # reverse: değişiklik sözlük tarafından yapıldı, pk_set profil id'leri (clear'da None)
+    profiles = model.objects.filter(pk__in=pk_set) if pk_set is not None else model.objects.none()
+    invalidate_profile(*profiles.values_list('user_id', flat=True))
+
+
+def _relation_fields(through, profile_model):
+    """Ara tablodaki (profil, sözlük) FK sütun adları."""
+    profile_field = next(f.attname for f in through._meta.concrete_fields if f.related_model is profile_model)
+    other_field = next(
+        f.attname for f in through._meta.concrete_fields
+        if f.is_relation and f.attname != profile_field
+    )
+    return profile_field, other_field
+
+
+def profile_relations_touched(sender, instance, action, reverse, model, pk_set, **kwargs):
+    """
+    Profil ETag'leri (ProfileView, uzman rehberi) profil satırının updated_at'inden
+    okunur; M2M değişiklikleri satırı kaydetmediği için updated_at elle ilerletilir.
+    """
+    if not reverse:
+        if action in ('post_add', 'post_remove', 'post_clear'):
+            type(instance).objects.filter(pk=instance.pk).update(updated_at=timezone.now())
+        return
+    # reverse: değişiklik sözlük tarafından yapıldı; clear'da pk_set verilmez,
+    # etkilenen profiller temizlemeden önce okunur
+    profile_field, other_field = _relation_fields(sender, model)
+    if action == 'pre_clear':
+        instance._cleared_profile_ids = set(
+            sender.objects.filter(**{other_field: instance.pk}).values_list(profile_field, flat=True)
+        )
+    elif action in ('post_add', 'post_remove', 'post_clear'):
+        profile_ids = pk_set if action != 'post_clear' else getattr(instance, '_cleared_profile_ids', ())
+        if profile_ids:
+            model.objects.filter(pk__in=profile_ids).update(updated_at=timezone.now())
+
+
+for _model, _relations in (
+    (ExpertProfile, ('services', 'specializations', 'languages', 'approach_methods', 'target_groups', 'session_types')),
+    (ClientProfile, ('substances_used',)),
+):
+    for _relation in _relations:
+        m2m_changed.connect(
+            profile_cache_relations_changed,
+            sender=getattr(_model, _relation).through,
+            dispatch_uid=f'profile_cache_{_model.__name__}_{_relation}',
+        )
+        m2m_changed.connect(
+            profile_relations_touched,
+            sender=getattr(_model, _relation).through,
+            dispatch_uid=f'profile_updated_at_{_model.__name__}_{_relation}',
+        )
@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
 
 
 class StorageProvider(ABC):
 
+    # Toplu işlemleri desteklemeyen sağlayıcılarda fallback'in eşzamanlı çağrı sayısı
+    batch_workers = 8
+
     @abstractmethod
-    def presign_upload(self, key: str, content_type: str, expires: int = 300) -> dict:
+    def presign_upload(self, key: str, content_type: str | None = None, expires: int = 300) -> dict:
         """
         Upload için presigned URL üretir.
         Dönüş:
@@ -25,3 +29,64 @@ class StorageProvider(ABC):
     def delete(self, key: str):
         """Storage'dan dosya siler"""
         pass
+
+    @abstractmethod
+    def head(self, key: str) -> dict | None:
+        """
+        Dosyanın varlığını ve özelliklerini döner; dosya yoksa None.
+        Dönüş:
+        {
+            "size": 1234,
+            "content_type": "image/png",
+            "content_hash": "sha256:..." | None   # sağlayıcı veremiyorsa None
+        }
+        """
+        pass
+
+    def read(self, key: str) -> bytes:
+        """Dosya içeriğini döner (sunucu tarafı işleme, ör. küçük resim üretimi için)."""
+        raise NotImplementedError(f"{type(self).__name__} dosya okumayı desteklemiyor.")
+
+    def write(self, key: str, data: bytes, content_type: str | None = None):
+        """Sunucu tarafında üretilen dosyayı yazar (varsa üzerine)."""
+        raise NotImplementedError(f"{type(self).__name__} dosya yazmayı desteklemiyor.")
+
+    def list_keys(self, prefix: str = ""):
+        """
+        Storage'daki dosyaları (key, son_değişiklik) olarak üretir; son_değişiklik
+        bilinmiyorsa None. Uzlaştırma (reconcile_storage) için kullanılır.
+        """
+        raise NotImplementedError(f"{type(self).__name__} dosya listelemeyi desteklemiyor.")
+
+    def _map_concurrently(self, func, keys):
+        """func(key)'i key'ler için eşzamanlı çalıştırır; {key: (sonuç, hata)} döner."""
+        def call(key):
+            try:
+                return key, func(key), None
+            except Exception as exc:
+                return key, None, exc
+
+        if len(keys) <= 1:
+            results = [call(key) for key in keys]
+        else:
+            with ThreadPoolExecutor(max_workers=min(self.batch_workers, len(keys))) as executor:
+                results = list(executor.map(call, keys))
+        return {key: (result, error) for key, result, error in results}
+
+    def presign_download_many(self, keys: list[str], expires: int = 600) -> dict:
+        """
+        Birden fazla dosya için download URL'si üretir.
+        Dönüş: {key: url}; URL üretilemeyen key'ler dönüşte yer almaz.
+        Sağlayıcı toplu imzalamayı destekliyorsa override edilmelidir.
+        """
+        results = self._map_concurrently(lambda key: self.presign_download(key, expires), list(dict.fromkeys(keys)))
+        return {key: url for key, (url, error) in results.items() if error is None}
+
+    def delete_many(self, keys: list[str]) -> list[str]:
+        """
+        Birden fazla dosyayı siler.
+        Dönüş: silinemeyen key'ler (boş liste = hepsi silindi).
+        Sağlayıcı toplu silmeyi destekliyorsa override edilmelidir.
+        """
+        results = self._map_concurrently(self.delete, list(dict.fromkeys(keys)))
+        return [key for key, (_, error) in results.items() if error is not None]
@@ -2,6 +2,7 @@
 from django.conf import settings
 from .supabase import SupabaseStorage
 from .mock import MockStorage
+from .local import LocalStorage
 
 def get_storage():
     match settings.STORAGE_PROVIDER:
@@ -9,5 +10,7 @@ def get_storage():
             return SupabaseStorage()
         case "mock":
             return MockStorage()
+        case "local":
+            return LocalStorage()
         case _:
             raise RuntimeError("Invalid STORAGE_PROVIDER")
@@ -0,0 +1,139 @@
+"""
+Storage çöp toplama.
+
+Silinen/değiştirilen belgelerin dosyaları istek içinde silinmez; belge
+güncellemesiyle aynı transaction içinde StorageDeletion outbox tablosuna
+yazılır. process_deletions bekleyen kayıtları delete_many ile toplu siler,
+başarısız olanları artan bekleme süreleriyle yeniden dener. Komut ve istek
+sonrası arka plan işleri aynı anda çalışabildiği için her batch kısa bir
+transaction'da kilitlenip (skip_locked) next_attempt_at ileri alınarak
+sahiplenilir; storage çağrısı kilit tutulmadan yapılır. İş yarıda kalırsa
+kayıtlar CLAIM_TIMEOUT sonra tekrar seçilir.
+
+find_orphans ise storage'daki key'leri Document.file_key ve küçük resim
+varyantlarıyla karşılaştırıp hiçbir güncel belgeye ait olmayan
+(ör. tamamlanmamış upload'lar) dosyaları bulur.
+"""
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.db import transaction
+from django.utils import timezone
+
+from accounts.models import Document, StorageDeletion
+
+from . import storage
+
+MAX_ATTEMPTS = 8
+# Sahiplenilen batch'in başka bir çalıştırmaya kapalı kaldığı süre
+CLAIM_TIMEOUT = timedelta(minutes=15)
+
+
+@dataclass
+class DeletionResult:
+    deleted: int = 0
+    failed: int = 0
+    skipped: int = 0
+
+
+def schedule_deletion(file_keys, reason):
+    """Dosyaları silinmek üzere outbox'a yazar (çağıranın transaction'ı içinde)."""
+    StorageDeletion.objects.bulk_create(
+        [StorageDeletion(file_key=key, reason=reason) for key in dict.fromkeys(file_keys) if key],
+        ignore_conflicts=True,
+    )
+
+
+def retry_delay(attempts):
+    """1, 2, 4, ... dakika; en fazla 6 saat."""
+    return timedelta(minutes=min(2 ** max(attempts - 1, 0), 360))
+
+
+def claim_batch(started_at, batch_size, max_attempts):
+    """Zamanı gelmiş kayıtlardan bir batch'i bu çalıştırma için sahiplenir."""
+    lease = timezone.now() + CLAIM_TIMEOUT
+    with transaction.atomic():
+        ids = list(
+            StorageDeletion.objects.select_for_update(skip_locked=True)
+            .filter(next_attempt_at__lte=started_at, attempts__lt=max_attempts)
+            .order_by('next_attempt_at', 'id')
+            .values_list('id', flat=True)[:batch_size]
+        )
+        if not ids:
+            return []
+        # Satır kilidi olmayan veritabanlarında (SQLite) koşullu güncelleme yarışı çözer:
+        # aynı kayıtları okuyan ikinci çalıştırma onları güncelleyemez
+        StorageDeletion.objects.filter(id__in=ids, next_attempt_at__lte=started_at).update(next_attempt_at=lease)
+        return list(StorageDeletion.objects.filter(id__in=ids, next_attempt_at=lease).order_by('id'))
+
+
+def process_deletions(batch_size=500, max_attempts=MAX_ATTEMPTS, max_batches=None):
+    """Zamanı gelmiş silme kayıtlarını batch'ler halinde işler."""
+    result = DeletionResult()
+    batches = 0
+    # Bu çalıştırmada başarısız olanlar tekrar seçilmesin
+    started_at = timezone.now()
+
+    while max_batches is None or batches < max_batches:
+        pending = claim_batch(started_at, batch_size, max_attempts)
+        if not pending:
+            break
+        batches += 1
+
+        # Key bu arada tekrar güncel bir belgeye bağlandıysa silinmez
+        in_use = set(
+            Document.objects.filter(file_key__in=[item.file_key for item in pending], is_current=True)
+            .values_list('file_key', flat=True)
+        )
+        to_delete = [item for item in pending if item.file_key not in in_use]
+
+        try:
+            failed_keys = set(storage.delete_many([item.file_key for item in to_delete]))
+            error = "delete_many bu key'i silemedi."
+        except Exception as exc:
+            failed_keys = {item.file_key for item in to_delete}
+            error = str(exc)
+
+        now = timezone.now()
+        failed = []
+        for item in to_delete:
+            if item.file_key in failed_keys:
+                item.attempts += 1
+                item.last_error = error[:2000]
+                item.next_attempt_at = now + retry_delay(item.attempts)
+                failed.append(item)
+
+        with transaction.atomic():
+            StorageDeletion.objects.bulk_update(failed, ['attempts', 'last_error', 'next_attempt_at'])
+            StorageDeletion.objects.filter(
+                id__in=[item.id for item in pending if item.file_key not in failed_keys]
+            ).delete()
+
+        result.deleted += len(to_delete) - len(failed)
+        result.failed += len(failed)
+        result.skipped += len(pending) - len(to_delete)
+
+    return result
+
+
+def find_orphans(prefix="", grace=timedelta(hours=24)):
+    """
+    Storage'da olup güncel bir belgeye ait olmayan, grace süresinden eski key'ler.
+    Outbox'ta zaten bekleyen key'ler dahil edilmez.
+    """
+    referenced = set()
+    for file_key, variants in Document.objects.filter(is_current=True).values_list('file_key', 'variants'):
+        referenced.add(file_key)
+        referenced.update((variants or {}).values())
+    pending = set(StorageDeletion.objects.values_list('file_key', flat=True))
+    cutoff = timezone.now() - grace
+
+    orphans = []
+    for key, modified_at in storage.list_keys(prefix):
+        if key in referenced or key in pending:
+            continue
+        if modified_at is not None and modified_at > cutoff:
+            # Upload'ı henüz finalize edilmemiş olabilir
+            continue
+        orphans.append(key)
+    return orphans
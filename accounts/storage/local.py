@@ -0,0 +1,169 @@
+import hashlib
+import json
+import os
+import time
+from datetime import datetime, timezone
+from urllib.parse import quote, unquote, urlencode
+
+from django.conf import settings
+from django.utils.crypto import constant_time_compare, salted_hmac
+
+from .base import StorageProvider
+
+SIGNING_SALT = "accounts.storage.local"
+CHUNK_SIZE = 64 * 1024
+
+
+class LocalStorage(StorageProvider):
+    """
+    Dosyaları yerel diskte tutan sağlayıcı (yük testi / offline geliştirme).
+
+    Supabase'deki akışın aynısını sunar: HMAC ile imzalı, süreli upload/download
+    URL'leri Django view'ları tarafından (accounts/views/storage_views.py) karşılanır.
+    Dosyalar key'in hash'ine göre iki seviyeli alt dizinlere dağıtılır:
+        <root>/ab/cd/<url-encoded key>
+    """
+
+    def __init__(self):
+        self.root = str(getattr(settings, "LOCAL_STORAGE_ROOT", settings.BASE_DIR / "local-storage"))
+        self.base_url = getattr(
+            settings,
+            "LOCAL_STORAGE_BASE_URL",
+            "http://localhost:8000/api/v1/accounts/storage"
+        ).rstrip("/")
+
+    # -------- Dosya yerleşimi --------
+
+    def path_for(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.root, digest[:2], digest[2:4], quote(key, safe=""))
+
+    def meta_path_for(self, key: str) -> str:
+        return self.path_for(key) + ".meta"
+
+    # -------- İmzalama --------
+
+    def signature(self, method: str, key: str, expires_at: int) -> str:
+        return salted_hmac(SIGNING_SALT, f"{method}:{key}:{expires_at}", algorithm="sha256").hexdigest()
+
+    def verify(self, method: str, key: str, expires_at, signature: str) -> bool:
+        try:
+            expires_at = int(expires_at)
+        except (TypeError, ValueError):
+            return False
+        if expires_at < time.time():
+            return False
+        return constant_time_compare(self.signature(method, key, expires_at), signature or "")
+
+    def _signed_url(self, action: str, method: str, key: str, expires: int) -> str:
+        expires_at = int(time.time()) + expires
+        query = urlencode({"expires": expires_at, "signature": self.signature(method, key, expires_at)})
+        return f"{self.base_url}/{action}/{quote(key)}?{query}"
+
+    # -------- StorageProvider --------
+
+    def presign_upload(self, key: str, content_type: str | None = None, expires: int = 300) -> dict:
+        presigned = {
+            "url": self._signed_url("upload", "PUT", key, expires),
+            "method": "PUT"
+        }
+        if content_type:
+            presigned["headers"] = {"Content-Type": content_type}
+        return presigned
+
+    def presign_download(self, key: str, expires: int = 600) -> str:
+        return self._signed_url("download", "GET", key, expires)
+
+    def presign_download_many(self, keys: list[str], expires: int = 600) -> dict:
+        # Yerel imzalama ucuz, thread havuzuna gerek yok
+        return {key: self.presign_download(key, expires) for key in keys}
+
+    def head(self, key: str) -> dict | None:
+        try:
+            size = os.path.getsize(self.path_for(key))
+        except FileNotFoundError:
+            return None
+        meta = self.read_meta(key)
+        return {
+            "size": size,
+            "content_type": meta.get("content_type"),
+            "content_hash": meta.get("content_hash"),
+        }
+
+    def read(self, key: str) -> bytes:
+        with open(self.path_for(key), "rb") as fh:
+            return fh.read()
+
+    def write(self, key: str, data: bytes, content_type: str | None = None):
+        self.save_stream(key, [data], content_type=content_type)
+
+    def delete(self, key: str):
+        for path in (self.path_for(key), self.meta_path_for(key)):
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+
+    def delete_many(self, keys: list[str]) -> list[str]:
+        failed = []
+        for key in dict.fromkeys(keys):
+            try:
+                self.delete(key)
+            except OSError:
+                failed.append(key)
+        return failed
+
+    def list_keys(self, prefix: str = ""):
+        for dirpath, _, filenames in os.walk(self.root):
+            for name in filenames:
+                if name.endswith((".meta", ".part")):
+                    continue
+                key = unquote(name)
+                if not key.startswith(prefix):
+                    continue
+                mtime = os.path.getmtime(os.path.join(dirpath, name))
+                yield key, datetime.fromtimestamp(mtime, tz=timezone.utc)
+
+    # -------- View'lar için dosya işlemleri --------
+
+    def save_stream(self, key: str, chunks, content_type: str | None = None, max_size: int | None = None) -> int:
+        """
+        Parçaları geçici dosyaya yazar (yazarken SHA-256 hesaplanır),
+        tamamlanınca atomik olarak yerine taşır.
+        max_size aşılırsa ValueError fırlatır ve yarım dosya bırakmaz.
+        """
+        path = self.path_for(key)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{time.monotonic_ns()}.part"
+        size = 0
+        digest = hashlib.sha256()
+        try:
+            with open(tmp_path, "wb") as fh:
+                for chunk in chunks:
+                    size += len(chunk)
+                    if max_size is not None and size > max_size:
+                        raise ValueError("Dosya boyutu sınırı aşıldı.")
+                    digest.update(chunk)
+                    fh.write(chunk)
+            os.replace(tmp_path, path)
+        except BaseException:
+            try:
+                os.remove(tmp_path)
+            except FileNotFoundError:
+                pass
+            raise
+
+        with open(self.meta_path_for(key), "w") as fh:
+            json.dump({
+                "content_type": content_type,
+                "size": size,
+                "content_hash": f"sha256:{digest.hexdigest()}",
+            }, fh)
+        return size
+
+    def read_meta(self, key: str) -> dict:
+        try:
+            with open(self.meta_path_for(key)) as fh:
+                return json.load(fh)
+        except (FileNotFoundError, ValueError):
+            return {}
@@ -1,3 +1,5 @@
+from collections import Counter
+
 from django.conf import settings
 from .base import StorageProvider
 from urllib.parse import quote
@@ -7,6 +9,7 @@ class MockStorage(StorageProvider):
     """
     Local / test ortamı için SupabaseStorage mock'u.
     Gerçek dosya işlemi yapmaz, sadece davranışı simüle eder.
+    Her metot çağrısı `calls` sayacına yazılır; testler toplu çağrıları doğrulayabilir.
     """
 
     def __init__(self):
@@ -15,28 +18,69 @@ class MockStorage(StorageProvider):
             "MOCK_STORAGE_BASE_URL",
             "http://localhost:8000/mock-storage"
         )
+        self.calls = Counter()
+
+    def reset_calls(self):
+        self.calls.clear()
 
-    def presign_upload(self, key: str) -> dict:
+    def _download_url(self, key: str, expires: int) -> str:
+        return f"{self.base_url}/download/{quote(key)}?expires={expires}"
+
+    def presign_upload(self, key: str, content_type: str | None = None, expires: int = 300) -> dict:
         """
         Supabase create_signed_upload_url taklidi
         """
+        self.calls["presign_upload"] += 1
         safe_key = quote(key)
 
-        return {
-            "url": f"{self.base_url}/upload/{safe_key}?token=mock-upload-token",
+        presigned = {
+            "url": f"{self.base_url}/upload/{safe_key}?token=mock-upload-token&expires={expires}",
             "method": "PUT"
         }
+        if content_type:
+            presigned["headers"] = {"Content-Type": content_type}
+        return presigned
 
     def presign_download(self, key: str, expires: int = 600) -> str:
         """
         Supabase create_signed_url taklidi
         """
-        safe_key = quote(key)
-        return f"{self.base_url}/download/{safe_key}?expires={expires}"
+        self.calls["presign_download"] += 1
+        return self._download_url(key, expires)
+
+    def presign_download_many(self, keys: list[str], expires: int = 600) -> dict:
+        """
+        Supabase create_signed_urls taklidi
+        """
+        self.calls["presign_download_many"] += 1
+        return {key: self._download_url(key, expires) for key in keys}
+
+    def head(self, key: str) -> dict | None:
+        """
+        Mock storage'da dosya tutulmaz; her key yüklenmiş varsayılır.
+        İçerik bilinmediği için hash üretilmez (tekilleştirme yapılmaz).
+        """
+        self.calls["head"] += 1
+        return {"size": None, "content_type": None, "content_hash": None}
 
     def delete(self, key: str):
         """
         Gerçekte hiçbir şey silmez.
         DB kaydı silindiğinde 'silinmiş varsayılır'.
         """
+        self.calls["delete"] += 1
         return None
+
+    def delete_many(self, keys: list[str]) -> list[str]:
+        """
+        Supabase remove([...]) taklidi
+        """
+        self.calls["delete_many"] += 1
+        return []
+
+    def list_keys(self, prefix: str = ""):
+        """
+        Mock storage'da dosya tutulmaz; liste hep boştur.
+        """
+        self.calls["list_keys"] += 1
+        return iter(())
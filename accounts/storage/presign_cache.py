@@ -0,0 +1,51 @@
+"""
+İndirme URL'leri için cache.
+
+Aynı dosya için her istekte storage sağlayıcısına gidip yeni imzalı URL
+üretmek yerine, üretilen URL süresi dolmadan kısa bir süre öncesine kadar
+file_key bazında cache'te tutulur. Listelerde cache'te olmayan URL'ler tek
+bir toplu çağrıyla (presign_download_many) üretilir.
+"""
+import hashlib
+
+from django.core.cache import cache
+
+from . import storage
+
+# URL'nin süresi dolmadan en az bu kadar saniye önce cache'ten düşer
+PRESIGN_EXPIRY_MARGIN = 300
+
+
+def _cache_key(key, expires):
+    digest = hashlib.sha1(key.encode('utf-8')).hexdigest()
+    return f'storage:presign:{expires}:{digest}'
+
+
+def presign_download_cached(key, expires=3600):
+    cache_key = _cache_key(key, expires)
+    url = cache.get(cache_key)
+    if url is None:
+        url = storage.presign_download(key=key, expires=expires)
+        timeout = expires - PRESIGN_EXPIRY_MARGIN
+        if timeout > 0:
+            cache.set(cache_key, url, timeout)
+    return url
+
+
+def presign_download_many_cached(keys, expires=3600):
+    """
+    Birden fazla dosya için URL döner: {key: url}.
+    Cache'te olmayanlar tek bir toplu storage çağrısıyla imzalanır.
+    """
+    cache_keys = {_cache_key(key, expires): key for key in dict.fromkeys(keys)}
+    urls = {cache_keys[cache_key]: url for cache_key, url in cache.get_many(cache_keys).items()}
+
+    missing = [key for key in cache_keys.values() if key not in urls]
+    if missing:
+        fresh = storage.presign_download_many(missing, expires=expires)
+        urls.update(fresh)
+        timeout = expires - PRESIGN_EXPIRY_MARGIN
+        if fresh and timeout > 0:
+            cache.set_many({_cache_key(key, expires): url for key, url in fresh.items()}, timeout)
+    return urls
+
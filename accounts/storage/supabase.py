@@ -1,7 +1,13 @@
+from storage3.exceptions import StorageApiError
 from supabase import create_client
 from django.conf import settings
+from django.utils.dateparse import parse_datetime
 from .base import StorageProvider
 
+# Supabase tek istekte en fazla bu kadar nesne siler
+REMOVE_BATCH_SIZE = 1000
+LIST_PAGE_SIZE = 1000
+
 
 class SupabaseStorage(StorageProvider):
 
@@ -12,15 +18,19 @@ class SupabaseStorage(StorageProvider):
         )
         self.bucket = settings.SUPABASE_BUCKET
 
-    def presign_upload(self, key: str) -> dict:
+    def presign_upload(self, key: str, content_type: str | None = None, expires: int = 300) -> dict:
+        # Supabase imzalı upload URL'lerinin süresi sabittir (2 saat), expires kullanılmaz
         res = self.client.storage.from_(self.bucket).create_signed_upload_url(
             key,
         )
 
-        return {
+        presigned = {
             "url": res["signedUrl"],
             "method": "PUT"
         }
+        if content_type:
+            presigned["headers"] = {"Content-Type": content_type}
+        return presigned
 
 
     def presign_download(self, key: str, expires: int = 600) -> str:
@@ -30,5 +40,74 @@ class SupabaseStorage(StorageProvider):
         )
         return res["signedUrl"]
 
+    def presign_download_many(self, keys: list[str], expires: int = 600) -> dict:
+        if not keys:
+            return {}
+        res = self.client.storage.from_(self.bucket).create_signed_urls(
+            list(keys),
+            expires
+        )
+        return {
+            item["path"]: item["signedUrl"]
+            for item in res
+            if not item.get("error") and item.get("signedUrl")
+        }
+
+    def head(self, key: str) -> dict | None:
+        try:
+            info = self.client.storage.from_(self.bucket).info(key)
+        except StorageApiError as exc:
+            # Supabase olmayan nesne için 400/404 döner
+            if str(exc.status) in ("400", "404"):
+                return None
+            raise
+        etag = (info.get("etag") or "").strip('"')
+        return {
+            "size": info.get("size"),
+            "content_type": info.get("content_type"),
+            # Tek parça yüklemelerde ETag içeriğin MD5'idir
+            "content_hash": f"etag:{etag}" if etag else None,
+        }
+
+    def read(self, key: str) -> bytes:
+        return self.client.storage.from_(self.bucket).download(key)
+
+    def write(self, key: str, data: bytes, content_type: str | None = None):
+        file_options = {"upsert": "true"}
+        if content_type:
+            file_options["content-type"] = content_type
+        self.client.storage.from_(self.bucket).upload(key, data, file_options)
+
     def delete(self, key: str):
         self.client.storage.from_(self.bucket).remove([key])
+
+    def delete_many(self, keys: list[str]) -> list[str]:
+        keys = list(dict.fromkeys(keys))
+        failed = []
+        for start in range(0, len(keys), REMOVE_BATCH_SIZE):
+            batch = keys[start:start + REMOVE_BATCH_SIZE]
+            try:
+                self.client.storage.from_(self.bucket).remove(batch)
+            except Exception:
+                failed.extend(batch)
+        return failed
+
+    def list_keys(self, prefix: str = ""):
+        # Supabase listelemesi klasör bazlı; klasörler (id=None) gezilerek tüm key'ler üretilir
+        bucket = self.client.storage.from_(self.bucket)
+        folders = [prefix.strip("/")]
+        while folders:
+            folder = folders.pop()
+            offset = 0
+            while True:
+                items = bucket.list(folder, {"limit": LIST_PAGE_SIZE, "offset": offset})
+                for item in items:
+                    path = f"{folder}/{item['name']}" if folder else item["name"]
+                    if item.get("id") is None:
+                        folders.append(path)
+                    else:
+                        modified = item.get("updated_at") or item.get("created_at")
+                        yield path, parse_datetime(modified) if modified else None
+                if len(items) < LIST_PAGE_SIZE:
+                    break
+                offset += LIST_PAGE_SIZE
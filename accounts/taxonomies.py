@@ -0,0 +1,185 @@
+"""
+Sözlük (taxonomy) tabloları için süreç içi read-through cache.
+
+Hizmet, dil, üniversite, bölüm, uzmanlık alanı vb. küçük ve nadiren değişen
+tablolar süreç belleğinde tutulur:
+- /taxonomies/ uç noktası tüm açılır liste verisini tek cevapta, ETag ile döner
+- Profil cevapları ve ETag'ler sözlük adlarını buradan okur
+
+Cache yalnızca okuma içindir. Yazma isteklerindeki ilişki alanları
+(TaxonomyPrimaryKeyRelatedField, TaxonomySlugRelatedField) gelen değerleri
+veritabanından, liste halinde tek sorguyla doğrular: başka bir süreçte
+silinmiş kayıt cache'te kalsa da 400 döner (atamada IntegrityError/500 yerine).
+
+Cache, cache backend'indeki bir versiyon sayacı ile senkron tutulur (bkz.
+accounts/blacklist.py): bu tablolardan birinde kayıt eklenip/değişip
+silindiğinde sayaç commit sonrası artırılır ve tüm süreçler bir sonraki
+okumada yeniden yükler. Paylaşılan cache yoksa veriler en geç
+TAXONOMY_CACHE_MAX_AGE saniyede bir yenilenir.
+"""
+import hashlib
+import json
+import threading
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from rest_framework import serializers
+from rest_framework.relations import MANY_RELATION_KWARGS
+
+from .models import (AddictionType, ApproachMethod, DegreeLevel, Language, Major, Service,
+                     SessionType, Specialization, TargetGroup, University)
+
+VERSION_CACHE_KEY = 'taxonomies:version'
+
+# Cevaptaki anahtar -> (model, döndürülecek alanlar)
+TAXONOMIES = {
+    'services': (Service, ('id', 'name', 'slug', 'description')),
+    'languages': (Language, ('id', 'name', 'code')),
+    'universities': (University, ('id', 'name', 'country')),
+    'degree_levels': (DegreeLevel, ('id', 'name')),
+    'majors': (Major, ('id', 'name')),
+    'specializations': (Specialization, ('id', 'name')),
+    'approach_methods': (ApproachMethod, ('id', 'name')),
+    'target_groups': (TargetGroup, ('id', 'name')),
+    'session_types': (SessionType, ('id', 'name')),
+    'addiction_types': (AddictionType, ('id', 'name', 'slug', 'description')),
+}
+
+TAXONOMY_MODELS = tuple(model for model, _ in TAXONOMIES.values())
+
+_lock = threading.Lock()
+_state = {'version': None, 'loaded_at': 0.0, 'snapshot': None}
+
+
+class TaxonomySnapshot:
+    def __init__(self, instances):
+        # instances: model -> [instance]; sadece cevap verisini üretmek için kullanılır,
+        # nesneler süreçte tutulmaz
+        self.payload = {}
+        for name, (model, fields) in TAXONOMIES.items():
+            rows = sorted(instances[model], key=lambda obj: (obj.name, obj.pk))
+            self.payload[name] = [
+                {field: getattr(obj, field) for field in fields}
+                for obj in rows
+                # Pasif kayıtlar listelenmez, mevcut ilişkiler için doğrulamada kalır
+                if getattr(obj, 'is_active', True)
+            ]
+        body = json.dumps(self.payload, sort_keys=True, ensure_ascii=False, default=str)
+        # İçerikten türetilir: aynı veri tüm süreçlerde aynı ETag'i üretir
+        self.etag = '"%s"' % hashlib.sha1(body.encode('utf-8')).hexdigest()
+
+
+def _load():
+    return TaxonomySnapshot({
+        model: list(model.objects.all())
+        for model in TAXONOMY_MODELS
+    })
+
+
+def _current_version():
+    version = cache.get(VERSION_CACHE_KEY)
+    if version is None:
+        cache.add(VERSION_CACHE_KEY, time.time_ns())
+        version = cache.get(VERSION_CACHE_KEY)
+    return version
+
+
+def bump_version():
+    """Tüm süreçlerin sözlük verisini bir sonraki okumada yeniden yüklemesini sağlar."""
+    try:
+        cache.incr(VERSION_CACHE_KEY)
+    except ValueError:
+        cache.add(VERSION_CACHE_KEY, time.time_ns())
+    with _lock:
+        _state['version'] = None
+
+
+def get_snapshot():
+    version = _current_version()
+    max_age = getattr(settings, 'TAXONOMY_CACHE_MAX_AGE', 600)
+    now = time.monotonic()
+    if _state['version'] == version and now - _state['loaded_at'] < max_age:
+        return _state['snapshot']
+
+    with _lock:
+        if _state['version'] != version or now - _state['loaded_at'] >= max_age:
+            _state['snapshot'] = _load()
+            _state['version'] = version
+            _state['loaded_at'] = now
+    return _state['snapshot']
+
+
+# -----------------------------
+# Serializer alanları
+# -----------------------------
+class TaxonomyManyRelatedField(serializers.ManyRelatedField):
+    """many=True: tüm değerler tek sorguyla doğrulanır."""
+
+    def to_internal_value(self, data):
+        if isinstance(data, str) or not hasattr(data, '__iter__'):
+            self.fail('not_a_list', input_type=type(data).__name__)
+        if not self.allow_empty and len(data) == 0:
+            self.fail('empty')
+        return self.child_relation.to_internal_values(data)
+
+
+class TaxonomyRelatedFieldMixin:
+    def __init__(self, model, **kwargs):
+        self.model = model
+        if not kwargs.get('read_only'):
+            kwargs.setdefault('queryset', model.objects.all())
+        super().__init__(**kwargs)
+
+    @classmethod
+    def many_init(cls, *args, **kwargs):
+        list_kwargs = {'child_relation': cls(*args, **kwargs)}
+        for key in kwargs:
+            if key in MANY_RELATION_KWARGS:
+                list_kwargs[key] = kwargs[key]
+        return TaxonomyManyRelatedField(**list_kwargs)
+
+    def to_internal_value(self, data):
+        return self.to_internal_values([data])[0]
+
+    def to_internal_values(self, values):
+        """Değerleri sırasıyla model nesnelerine çevirir; olmayan varsa does_not_exist."""
+        lookups = [self.to_lookup(value) for value in values]
+        found = self.get_queryset().in_bulk(set(lookups), field_name=self.lookup_field)
+        for value, lookup in zip(values, lookups):
+            if lookup not in found:
+                self.fail_missing(value)
+        return [found[lookup] for lookup in lookups]
+
+
+class TaxonomyPrimaryKeyRelatedField(TaxonomyRelatedFieldMixin, serializers.PrimaryKeyRelatedField):
+    """Sözlük tablolarına pk ile ilişki."""
+    lookup_field = 'pk'
+
+    def to_lookup(self, data):
+        if isinstance(data, bool):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+        try:
+            return int(data)
+        except (TypeError, ValueError):
+            self.fail('incorrect_type', data_type=type(data).__name__)
+
+    def fail_missing(self, value):
+        self.fail('does_not_exist', pk_value=value)
+
+
+class TaxonomySlugRelatedField(TaxonomyRelatedFieldMixin, serializers.SlugRelatedField):
+    """Sözlük tablolarına tekil slug/kod alanıyla ilişki."""
+
+    def __init__(self, model, slug_field, **kwargs):
+        super().__init__(model, slug_field=slug_field, **kwargs)
+
+    @property
+    def lookup_field(self):
+        return self.slug_field
+
+    def to_lookup(self, data):
+        return str(data)
+
+    def fail_missing(self, value):
+        self.fail('does_not_exist', slug_name=self.slug_field, value=str(value))
@@ -0,0 +1,70 @@
+import tempfile
+from datetime import timedelta
+
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.token_blacklist.models import BlacklistedToken, OutstandingToken
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts import blacklist
+from accounts.models import ClientProfile, User
+
+SHARED_CACHE = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+        'LOCATION': tempfile.mkdtemp(prefix='lunova-blacklist-'),
+    }
+}
+
+
+class TokenBlacklistTests(TestCase):
+    def setUp(self):
+        blacklist._state.update(version=None, loaded_at=0.0, jtis=frozenset())
+        self.user = User.objects.create_user(
+            email='client@test.com', username='client', password='testpass123', role='client',
+        )
+        ClientProfile.objects.create(user=self.user)
+        self.refresh = RefreshToken.for_user(self.user)
+        self.access = self.refresh.access_token
+        self.client = APIClient()
+        self.client.cookies['access_token'] = str(self.access)
+        self.client.cookies['refresh_token'] = str(self.refresh)
+
+    def blacklist_access_token(self, publish=True):
+        """Access token'ı blacklist'e ekler; publish=False başka bir worker'daki yazmayı taklit eder."""
+        with self.captureOnCommitCallbacks(execute=publish):
+            token = OutstandingToken.objects.create(
+                user=self.user, jti=self.access['jti'], token=str(self.access),
+                expires_at=timezone.now() + timedelta(days=1),
+            )
+            BlacklistedToken.objects.create(token=token)
+
+    def test_logout_blacklists_refresh_token(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            response = self.client.post('/api/v1/accounts/logout/')
+        self.assertEqual(response.status_code, 205)
+        self.assertTrue(blacklist.is_blacklisted(self.refresh['jti']))
+
+    def test_blacklisted_token_rejected_without_shared_cache(self):
+        with override_settings(AUTH_BLACKLIST_FILTER=True):
+            self.assertEqual(self.client.get('/api/v1/accounts/me/').status_code, 200)
+            # locmem cache ile filtre kullanılmaz; diğer worker'ın yazdığı kayıt hemen görülür
+            self.blacklist_access_token(publish=False)
+            self.assertFalse(blacklist.filter_enabled())
+            self.assertEqual(self.client.get('/api/v1/accounts/me/').status_code, 401)
+
+    @override_settings(AUTH_BLACKLIST_FILTER=True, CACHES=SHARED_CACHE)
+    def test_blacklisted_token_rejected_with_shared_cache(self):
+        self.assertTrue(blacklist.filter_enabled())
+        self.assertEqual(self.client.get('/api/v1/accounts/me/').status_code, 200)
+        self.blacklist_access_token(publish=False)
+        # Diğer worker sayacı paylaşılan cache'te artırır
+        blacklist.bump_version()
+        self.assertEqual(self.client.get('/api/v1/accounts/me/').status_code, 401)
+
+    @override_settings(AUTH_BLACKLIST_FILTER=True, CACHES=SHARED_CACHE)
+    def test_blacklisted_token_rejected_in_same_process(self):
+        self.assertEqual(self.client.get('/api/v1/accounts/me/').status_code, 200)
+        self.blacklist_access_token()
+        self.assertEqual(self.client.get('/api/v1/accounts/me/').status_code, 401)
@@ -0,0 +1,31 @@
+from django.test import SimpleTestCase, override_settings
+
+from accounts import checks
+
+LOCAL_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.locmem.LocMemCache'}}
+SHARED_CACHE = {'default': {'BACKEND': 'django.core.cache.backends.redis.RedisCache', 'LOCATION': 'redis://127.0.0.1:6379/1'}}
+
+
+class ProcessLocalCacheCheckTests(SimpleTestCase):
+    def ids(self, check):
+        return [message.id for message in check(None)]
+
+    @override_settings(CACHES=LOCAL_CACHE, AUTH_USER_CACHE_TIMEOUT=60)
+    def test_user_cache_on_local_cache_warns(self):
+        self.assertEqual(self.ids(checks.user_cache_backend), ['accounts.W002'])
+
+    @override_settings(CACHES=LOCAL_CACHE, AUTH_USER_CACHE_TIMEOUT=0)
+    def test_disabled_user_cache_is_silent(self):
+        self.assertEqual(self.ids(checks.user_cache_backend), [])
+
+    @override_settings(CACHES=SHARED_CACHE, AUTH_USER_CACHE_TIMEOUT=60)
+    def test_user_cache_on_shared_cache_is_silent(self):
+        self.assertEqual(self.ids(checks.user_cache_backend), [])
+
+    @override_settings(CACHES=LOCAL_CACHE, PROFILE_CACHE_TIMEOUT=600)
+    def test_profile_cache_on_local_cache_warns(self):
+        self.assertEqual(self.ids(checks.profile_cache_backend), ['accounts.W003'])
+
+    @override_settings(CACHES=SHARED_CACHE, PROFILE_CACHE_TIMEOUT=600)
+    def test_profile_cache_on_shared_cache_is_silent(self):
+        self.assertEqual(self.ids(checks.profile_cache_backend), [])
@@ -0,0 +1,111 @@
+from datetime import date, time
+
+from django.core.cache import cache
+from django.test import TestCase
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts.models import ClientProfile, ExpertProfile, Service, User
+from appointments.models import Appointment
+
+PROFILE_URL = '/api/v1/accounts/profile/'
+EXPERTS_URL = '/api/v1/accounts/experts/'
+APPOINTMENTS_URL = '/api/v1/appointments/'
+
+
+class ConditionalGetTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.expert_user = User.objects.create_user(
+            email='expert@test.com', username='expert', password='testpass123', role='expert',
+        )
+        self.expert = ExpertProfile.objects.create(user=self.expert_user, approval_status=True, title='Psk.')
+        self.client_user = User.objects.create_user(
+            email='client@test.com', username='client', password='testpass123', role='client',
+        )
+        ClientProfile.objects.create(user=self.client_user, expert=self.expert)
+
+    def api(self, user):
+        client = APIClient()
+        client.cookies['access_token'] = str(RefreshToken.for_user(user).access_token)
+        return client
+
+    def assert_not_modified(self, client, url, etag):
+        response = client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertFalse(response.content)
+
+    def test_profile_not_modified_until_changed(self):
+        client = self.api(self.expert_user)
+        first = client.get(PROFILE_URL)
+        self.assertEqual(first.status_code, 200)
+        self.assert_not_modified(client, PROFILE_URL, first['ETag'])
+
+        self.expert.title = 'Uzm. Psk.'
+        self.expert.save()
+
+        second = client.get(PROFILE_URL, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second['ETag'], first['ETag'])
+        self.assert_not_modified(client, PROFILE_URL, second['ETag'])
+
+    def test_client_profile_changes_with_assigned_expert(self):
+        client = self.api(self.client_user)
+        first = client.get(PROFILE_URL)
+        self.assertEqual(first.status_code, 200)
+        self.assert_not_modified(client, PROFILE_URL, first['ETag'])
+
+        # Atanan uzmanın adı danışan profilinde görünür
+        self.expert_user.first_name = 'Ayşe'
+        self.expert_user.save()
+
+        self.assertEqual(client.get(PROFILE_URL, HTTP_IF_NONE_MATCH=first['ETag']).status_code, 200)
+
+    def test_expert_list_detects_removed_rows(self):
+        other = User.objects.create_user(
+            email='expert2@test.com', username='expert2', password='testpass123', role='expert',
+        )
+        ExpertProfile.objects.create(user=other, approval_status=True)
+        client = self.api(self.client_user)
+        first = client.get(EXPERTS_URL)
+        self.assertEqual(first.status_code, 200)
+        self.assert_not_modified(client, EXPERTS_URL, first['ETag'])
+
+        # Silme en son updated_at'i değiştirmez; satır sayısı ETag'e girer
+        other.delete()
+
+        second = client.get(EXPERTS_URL, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(len(second.data), 1)
+
+    def test_expert_list_changes_with_services(self):
+        service = Service.objects.create(name='Terapi', slug='terapi')
+        client = self.api(self.client_user)
+        first = client.get(EXPERTS_URL)
+        self.assert_not_modified(client, EXPERTS_URL, first['ETag'])
+
+        self.expert.services.add(service)
+        second = client.get(EXPERTS_URL, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 200)
+        self.assert_not_modified(client, EXPERTS_URL, second['ETag'])
+
+        # Sözlük tarafından temizleme de profil satırını ilerletir
+        service.experts.clear()
+        self.assertEqual(client.get(EXPERTS_URL, HTTP_IF_NONE_MATCH=second['ETag']).status_code, 200)
+
+    def test_appointment_list_changes_with_counterpart_name(self):
+        Appointment.objects.create(
+            expert=self.expert_user, client=self.client_user, date=date(2026, 3, 2), time=time(10), status='confirmed',
+        )
+        url = f'{APPOINTMENTS_URL}?start_date=2026-03-01&end_date=2026-03-31'
+        client = self.api(self.client_user)
+        first = client.get(url)
+        self.assertEqual(first.status_code, 200)
+        self.assert_not_modified(client, url, first['ETag'])
+
+        self.expert_user.first_name = 'Ayşe'
+        self.expert_user.save()
+
+        second = client.get(url, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.data[0]['expert_name'].split()[0], 'Ayşe')
@@ -0,0 +1,46 @@
+from django.contrib.auth.hashers import check_password, identify_hasher
+from django.test import TestCase, override_settings
+
+from accounts.hashers import needs_rehash, rehash_password, verify_password
+from accounts.models import User
+
+
+@override_settings(BACKGROUND_TASKS_SYNC=True)
+class PasswordRehashTests(TestCase):
+    def setUp(self):
+        with override_settings(PASSWORD_HASH_ITERATIONS=1000):
+            self.user = User.objects.create_user(
+                email='client@test.com', username='client', password='eski-parola', role='client',
+            )
+        self.old_encoded = self.user.password
+
+    def iterations(self, encoded):
+        return identify_hasher(encoded).decode(encoded)['iterations']
+
+    @override_settings(PASSWORD_HASH_ITERATIONS=2000)
+    def test_login_rehashes_outdated_hash(self):
+        self.assertTrue(needs_rehash(self.old_encoded))
+        with self.captureOnCommitCallbacks(execute=True):
+            self.assertTrue(verify_password(self.user, 'eski-parola'))
+
+        self.user.refresh_from_db()
+        self.assertEqual(self.iterations(self.user.password), 2000)
+        self.assertTrue(check_password('eski-parola', self.user.password))
+
+    @override_settings(PASSWORD_HASH_ITERATIONS=2000)
+    def test_wrong_password_schedules_nothing(self):
+        with self.captureOnCommitCallbacks() as callbacks:
+            self.assertFalse(verify_password(self.user, 'yanlis'))
+        self.assertEqual(callbacks, [])
+
+    @override_settings(PASSWORD_HASH_ITERATIONS=2000)
+    def test_rehash_does_not_overwrite_changed_password(self):
+        # Giriş ile arka plan işi arasında parola değiştirildi
+        self.user.set_password('yeni-parola')
+        self.user.save()
+
+        rehash_password(self.user.pk, self.old_encoded, 'eski-parola')
+
+        self.user.refresh_from_db()
+        self.assertTrue(check_password('yeni-parola', self.user.password))
+        self.assertFalse(check_password('eski-parola', self.user.password))
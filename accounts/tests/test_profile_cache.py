@@ -0,0 +1,71 @@
+import tempfile
+from io import BytesIO
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+from rest_framework_simplejwt.tokens import RefreshToken
+
+from accounts import thumbnails
+from accounts.models import Document, DocumentType, ExpertProfile, User
+from accounts.profile_cache import cache_key
+from accounts.storage.local import LocalStorage
+
+PROFILE_URL = '/api/v1/accounts/profile/'
+
+
+def png_bytes():
+    buffer = BytesIO()
+    Image.new('RGB', (300, 200), 'red').save(buffer, 'PNG')
+    return buffer.getvalue()
+
+
+@override_settings(PROFILE_CACHE_TIMEOUT=600)
+class ProfileCacheInvalidationTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.user = User.objects.create_user(
+            email='expert@test.com', username='expert', password='testpass123', role='expert',
+        )
+        ExpertProfile.objects.create(user=self.user)
+        self.photo = Document.objects.create(
+            user=self.user, file_key=f'experts/{self.user.id}/profile_photo/photo.png',
+            original_filename='photo.png', type=DocumentType.PROFILE_PHOTO,
+        )
+        self.client = APIClient()
+        self.client.cookies['access_token'] = str(RefreshToken.for_user(self.user).access_token)
+
+    def get_profile(self):
+        response = self.client.get(PROFILE_URL)
+        self.assertEqual(response.status_code, 200)
+        self.assertIsNotNone(cache.get(cache_key(self.user.id)))
+        return response
+
+    def test_document_change_drops_cached_profile(self):
+        self.get_profile()
+        with self.captureOnCommitCallbacks(execute=True):
+            self.photo.original_filename = 'yeni.png'
+            self.photo.save()
+        self.assertIsNone(cache.get(cache_key(self.user.id)))
+        documents = self.get_profile().data['documents']
+        self.assertEqual(documents[0]['original_filename'], 'yeni.png')
+
+    def test_thumbnail_generation_drops_cached_profile_and_etag(self):
+        first = self.get_profile()
+        with tempfile.TemporaryDirectory() as root, override_settings(LOCAL_STORAGE_ROOT=root):
+            local = LocalStorage()
+            local.write(self.photo.file_key, png_bytes(), content_type='image/png')
+            with mock.patch.object(thumbnails, 'storage', local), self.captureOnCommitCallbacks(execute=True):
+                thumbnails.generate_thumbnails(self.photo.id)
+
+        self.photo.refresh_from_db()
+        self.assertEqual(sorted(self.photo.variants), ['128', '256', '64'])
+        self.assertIsNone(cache.get(cache_key(self.user.id)))
+
+        # Varyant yazımı updated_at'i ilerletir: eski ETag artık eşleşmez
+        second = self.client.get(PROFILE_URL, HTTP_IF_NONE_MATCH=first['ETag'])
+        self.assertEqual(second.status_code, 200)
+        self.assertNotEqual(second['ETag'], first['ETag'])
+        self.assertNotEqual(second.data['documents'][0]['updated_at'], first.data['documents'][0]['updated_at'])
@@ -0,0 +1,43 @@
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from accounts.models import StorageDeletion, StorageDeletionReason
+from accounts.storage import gc
+
+
+class ProcessDeletionsTests(TestCase):
+    def setUp(self):
+        gc.schedule_deletion(['a.png', 'b.png', 'c.png'], StorageDeletionReason.DOCUMENT_DELETED)
+        self.storage = mock.Mock()
+        self.storage.delete_many.return_value = []
+        patcher = mock.patch.object(gc, 'storage', self.storage)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_deletes_and_removes_rows(self):
+        result = gc.process_deletions()
+        self.assertEqual((result.deleted, result.failed), (3, 0))
+        self.assertFalse(StorageDeletion.objects.exists())
+
+    def test_claimed_batch_is_skipped_by_concurrent_run(self):
+        claimed = gc.claim_batch(timezone.now(), batch_size=2, max_attempts=gc.MAX_ATTEMPTS)
+        self.assertEqual(len(claimed), 2)
+
+        # Diğer çalıştırma sadece sahiplenilmemiş kaydı işler
+        result = gc.process_deletions()
+        self.assertEqual(result.deleted, 1)
+        self.storage.delete_many.assert_called_once_with(['c.png'])
+        self.assertEqual(
+            sorted(StorageDeletion.objects.values_list('file_key', flat=True)),
+            sorted(item.file_key for item in claimed),
+        )
+
+    def test_failure_is_counted_once(self):
+        self.storage.delete_many.return_value = ['b.png']
+        gc.process_deletions()
+        gc.process_deletions()
+        item = StorageDeletion.objects.get()
+        self.assertEqual((item.file_key, item.attempts), ('b.png', 1))
+        self.assertGreater(item.next_attempt_at, timezone.now())
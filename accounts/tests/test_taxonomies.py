@@ -0,0 +1,38 @@
+from django.test import TestCase
+from rest_framework import serializers
+
+from accounts.models import Language, Service
+from accounts.taxonomies import TaxonomyPrimaryKeyRelatedField, TaxonomySlugRelatedField, get_snapshot
+
+
+class TaxonomySerializer(serializers.Serializer):
+    services = TaxonomyPrimaryKeyRelatedField(Service, many=True, required=False)
+    service = TaxonomyPrimaryKeyRelatedField(Service, required=False, allow_null=True)
+    languages = TaxonomySlugRelatedField(Language, slug_field='code', many=True, required=False)
+
+
+class TaxonomyRelatedFieldTests(TestCase):
+    def setUp(self):
+        self.first = Service.objects.create(name='Bireysel Terapi', slug='bireysel')
+        self.second = Service.objects.create(name='Aile Terapisi', slug='aile')
+        Language.objects.create(name='Türkçe', code='tr')
+        get_snapshot()
+
+    def test_lists_are_validated_with_one_query_each(self):
+        with self.assertNumQueries(2):
+            serializer = TaxonomySerializer(data={
+                'services': [self.second.pk, self.first.pk], 'languages': ['tr'],
+            })
+            self.assertTrue(serializer.is_valid(), serializer.errors)
+        self.assertEqual([service.pk for service in serializer.validated_data['services']], [self.second.pk, self.first.pk])
+
+    def test_row_deleted_in_another_process_is_rejected(self):
+        # Sinyalsiz silme: sözlük cache'i başka bir süreçteki gibi eski kalır
+        Service.objects.filter(pk=self.second.pk).delete()
+        serializer = TaxonomySerializer(data={'services': [self.first.pk, self.second.pk]})
+        self.assertFalse(serializer.is_valid())
+        self.assertIn('services', serializer.errors)
+
+    def test_invalid_values_are_rejected(self):
+        for data in ({'service': self.second.pk + 100}, {'service': 'x'}, {'services': [True]}, {'languages': ['xx']}):
+            self.assertFalse(TaxonomySerializer(data=data).is_valid(), data)
@@ -0,0 +1,164 @@
+"""
+Uzmanlar için serbest metin araması.
+
+Her uzman için ad, unvan, kurum, hakkında metni, uzmanlık alanları, yaklaşım
+yöntemleri ve hizmet adlarından normalize edilmiş tek bir metin üretilir ve
+ExpertProfile.search_document alanına yazılır. Normalizasyon Türkçe'ye
+duyarlıdır (I/ı, İ/i) ve aksanları katlar (ğ→g, ş→s, ç→c, ö→o, ü→u, ı→i);
+sorgu da aynı şekilde normalize edildiği için "Şişli", "sisli" ile bulunur.
+
+Arama veritabanına göre yapılır:
+- PostgreSQL: search_document üzerinde tsvector (GIN) ile önek eşleşmesi
+  veya pg_trgm kelime benzerliği (GIN trigram indeksi) ile yazım hatalarına
+  toleranslı eşleşme
+- SQLite: trigram tokenizer'lı FTS5 sanal tablosundan aday satırlar, trigram
+  kelime benzerliğiyle süzülüp sıralanır
+
+Metin, profil/kullanıcı kaydedildiğinde ve M2M ilişkileri değiştiğinde
+refresh_search_document ile güncellenir (bkz. accounts/signals.py).
+"""
+import unicodedata
+
+from django.db import connection
+from django.db.models import Q
+
+from .models import ExpertProfile
+
+FTS_TABLE = 'accounts_expertprofile_fts'
+
+# Aramaya giren M2M alanları (değişince metin yenilenir)
+SEARCH_RELATIONS = ('specializations', 'approach_methods', 'services')
+
+# Bir kelimenin eşleşmiş sayılması için gereken trigram kelime benzerliği (pg_trgm varsayılanı)
+WORD_SIMILARITY_THRESHOLD = 0.6
+# SQLite'ta benzerlik hesabına alınacak en fazla aday satır
+CANDIDATE_LIMIT = 200
+SEARCH_LIMIT = 500
+
+_TURKISH_FOLD = str.maketrans({'ı': 'i', 'ğ': 'g', 'ş': 's', 'ç': 'c', 'ö': 'o', 'ü': 'u'})
+
+
+def normalize(text):
+    """Türkçe'ye duyarlı küçük harfe çevirir, aksanları katlar, noktalamayı boşluğa çevirir."""
+    if not text:
+        return ''
+    text = text.replace('I', 'ı').replace('İ', 'i').lower().translate(_TURKISH_FOLD)
+    text = ''.join(
+        char for char in unicodedata.normalize('NFKD', text)
+        if not unicodedata.combining(char)
+    )
+    return ' '.join(''.join(char if char.isalnum() else ' ' for char in text).split())
+
+
+def trigrams(word):
+    """pg_trgm gibi: kelime başına iki, sonuna bir boşluk eklenerek üçlüler."""
+    padded = f'  {word} '
+    return {padded[index:index + 3] for index in range(len(padded) - 2)}
+
+
+def word_similarity(token, words):
+    """Sorgu kelimesinin metindeki en benzer kelimeyle trigram örtüşme oranı (0-1)."""
+    token_trigrams = trigrams(token)
+    best = 0.0
+    for word in words:
+        if word.startswith(token):
+            return 1.0
+        best = max(best, len(token_trigrams & trigrams(word)) / len(token_trigrams))
+    return best
+
+
+def build_search_document(expert):
+    user = expert.user
+    parts = [
+        user.first_name,
+        user.last_name,
+        expert.title,
+        expert.institution,
+        expert.about,
+    ]
+    for relation in SEARCH_RELATIONS:
+        parts.extend(getattr(expert, relation).values_list('name', flat=True))
+    return normalize(' '.join(part for part in parts if part))
+
+
+def refresh_search_document(expert_id):
+    """Uzmanın arama metnini yeniden üretir (save() tetiklemeden) ve FTS tablosunu günceller."""
+    expert = ExpertProfile.objects.select_related('user').filter(pk=expert_id).first()
+    if expert is None:
+        remove_search_document(expert_id)
+        return
+    document = build_search_document(expert)
+    ExpertProfile.objects.filter(pk=expert_id).update(search_document=document)
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [expert_id])
+            cursor.execute(f'INSERT INTO {FTS_TABLE} (rowid, body) VALUES (%s, %s)', [expert_id, document])
+
+
+def remove_search_document(expert_id):
+    if connection.vendor == 'sqlite':
+        with connection.cursor() as cursor:
+            cursor.execute(f'DELETE FROM {FTS_TABLE} WHERE rowid = %s', [expert_id])
+
+
+def search_experts(queryset, text, limit=SEARCH_LIMIT):
+    """
+    queryset içindeki uzmanlardan metinle eşleşenlerin id'leri, en alakalıdan başlayarak.
+    """
+    tokens = normalize(text).split()
+    if not tokens:
+        return []
+    if connection.vendor == 'postgresql':
+        return _search_postgres(queryset, tokens, limit)
+    return _search_sqlite(queryset, tokens, limit)
+
+
+def _search_postgres(queryset, tokens, limit):
+    from django.contrib.postgres.search import (SearchQuery, SearchRank, SearchVector,
+                                                TrigramWordSimilarity)
+
+    text = ' '.join(tokens)
+    # Normalize edilmiş token'lar sadece harf/rakam içerir; raw tsquery güvenli
+    query = SearchQuery(' & '.join(f'{token}:*' for token in tokens), config='simple', search_type='raw')
+    vector = SearchVector('search_document', config='simple')
+    return list(
+        queryset.annotate(
+            search=vector,
+            rank=SearchRank(vector, query),
+            similarity=TrigramWordSimilarity(text, 'search_document'),
+        )
+        .filter(Q(search=query) | Q(search_document__trigram_word_similar=text))
+        .order_by('-rank', '-similarity', 'id')
+        .values_list('id', flat=True)[:limit]
+    )
+
+
+def _search_sqlite(queryset, tokens, limit):
+    long_tokens = [token for token in tokens if len(token) >= 3]
+    if not long_tokens:
+        # Trigram tokenizer 3 karakterden kısa sorguları eşleyemez
+        return list(
+            queryset.filter(*[Q(search_document__contains=token) for token in tokens])
+            .order_by('id').values_list('id', flat=True)[:limit]
+        )
+
+    # Sorgunun herhangi bir trigramını içeren satırlar aday; bm25 ile ön sıralama
+    grams = {gram for token in long_tokens for gram in (token[i:i + 3] for i in range(len(token) - 2))}
+    match = ' OR '.join(f'"{gram}"' for gram in sorted(grams))
+    with connection.cursor() as cursor:
+        cursor.execute(
+            f'SELECT rowid, body FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH %s ORDER BY rank LIMIT %s',
+            [match, CANDIDATE_LIMIT],
+        )
+        candidates = cursor.fetchall()
+
+    scored = []
+    for order, (expert_id, body) in enumerate(candidates):
+        words = body.split()
+        similarities = [word_similarity(token, words) for token in tokens]
+        if min(similarities) >= WORD_SIMILARITY_THRESHOLD:
+            scored.append((-sum(similarities), order, expert_id))
+    scored.sort()
+
+    allowed = set(queryset.filter(id__in=[item[2] for item in scored]).values_list('id', flat=True))
+    return [expert_id for _, _, expert_id in scored if expert_id in allowed][:limit]
@@ -0,0 +1,88 @@
+"""
+Profil fotoğrafları için küçük resim (thumbnail) üretimi.
+
+Profil fotoğrafı finalize edildiğinde arka planda orijinal dosya storage'dan
+okunur, kare kırpılıp THUMBNAIL_SIZES boyutlarında WebP (desteklenmiyorsa JPEG)
+olarak yazılır ve key'ler Document.variants alanına kaydedilir. API'ler
+Document.variant_key(size) ile istenen boyuta uyan en küçük varyantı sunar.
+"""
+import logging
+from io import BytesIO
+
+from django.utils import timezone
+from PIL import Image, ImageOps, UnidentifiedImageError, features
+
+from accounts.models import Document, DocumentType, StorageDeletionReason
+from accounts.storage import storage
+from accounts.storage.gc import schedule_deletion
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_SIZES = (64, 128, 256)
+
+if features.check("webp"):
+    THUMBNAIL_FORMAT, THUMBNAIL_EXTENSION, THUMBNAIL_CONTENT_TYPE = "WEBP", "webp", "image/webp"
+else:
+    THUMBNAIL_FORMAT, THUMBNAIL_EXTENSION, THUMBNAIL_CONTENT_TYPE = "JPEG", "jpg", "image/jpeg"
+
+
+def thumbnail_key(file_key, size):
+    return f"{file_key}__{size}.{THUMBNAIL_EXTENSION}"
+
+
+def render_thumbnails(data, sizes=THUMBNAIL_SIZES):
+    """Görsel baytlarından {size: bytes} üretir."""
+    with Image.open(BytesIO(data)) as image:
+        image = ImageOps.exif_transpose(image)
+        image = image.convert("RGBA" if THUMBNAIL_FORMAT == "WEBP" and image.mode in ("RGBA", "LA", "P") else "RGB")
+
+        rendered = {}
+        # Büyükten küçüğe: her boyut bir öncekinden üretilir, yeniden örnekleme ucuzlar
+        source = image
+        for size in sorted(sizes, reverse=True):
+            source = ImageOps.fit(source, (size, size), method=Image.Resampling.LANCZOS)
+            buffer = BytesIO()
+            source.save(buffer, THUMBNAIL_FORMAT, quality=80)
+            rendered[size] = buffer.getvalue()
+    return rendered
+
+
+def generate_thumbnails(document_id):
+    """
+    Belgenin küçük resimlerini üretir ve kaydeder. Bu sırada fotoğraf
+    değiştiyse üretilen dosyalar kullanılmaz ve silinmek üzere kuyruğa alınır.
+    """
+    document = Document.objects.filter(
+        id=document_id, type=DocumentType.PROFILE_PHOTO, is_current=True
+    ).first()
+    if document is None:
+        return
+
+    source_key = document.file_key
+    try:
+        rendered = render_thumbnails(storage.read(source_key))
+    except NotImplementedError:
+        # Sağlayıcı dosya içeriğine erişim sunmuyor (ör. MockStorage)
+        return
+    except (UnidentifiedImageError, OSError, Image.DecompressionBombError):
+        logger.warning("Profil fotoğrafı işlenemedi", extra={"file_key": source_key})
+        return
+
+    variants = {}
+    for size, data in rendered.items():
+        key = thumbnail_key(source_key, size)
+        storage.write(key, data, content_type=THUMBNAIL_CONTENT_TYPE)
+        variants[str(size)] = key
+
+    # update() sinyal üretmez ve auto_now alanını doldurmaz: ETag'ler updated_at'i
+    # okur, profil cache'i ayrıca düşürülür
+    updated = Document.objects.filter(id=document_id, file_key=source_key).update(
+        variants=variants, updated_at=timezone.now(),
+    )
+    if not updated:
+        schedule_deletion(variants.values(), StorageDeletionReason.REPLACED)
+        return
+
+    # profile_cache → document_serializers → thumbnails döngüsü nedeniyle burada
+    from accounts.profile_cache import invalidate_profile
+    invalidate_profile(document.user_id)
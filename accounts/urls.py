@@ -1,7 +1,9 @@
 from django.urls import path
-from .views.views import ExpertRegisterView, ClientRegisterView, AdminRegisterView, LoginView, LogoutView, MeView, ExpertListView, ClientListView, PasswordResetRequestView, PasswordResetConfirmView
+from .views.views import ExpertRegisterView, ClientRegisterView, AdminRegisterView, LoginView, LogoutView, MeView, ExpertListView, ExpertSearchView, ClientListView, ClientRosterView, PasswordResetRequestView, PasswordResetConfirmView
 from .views.profile import ProfileView
 from .views.document_views import DocumentListCreateView, DocumentPresignUploadView, DocumentDeleteView
+from .views.storage_views import LocalStorageUploadView, LocalStorageDownloadView
+from .views.taxonomy_views import TaxonomyListView
 
 urlpatterns = [
     path('register/expert/', ExpertRegisterView.as_view(), name='register_expert'),
@@ -11,14 +13,22 @@ urlpatterns = [
     path('logout/', LogoutView.as_view(), name='logout'),
     path('me/', MeView.as_view(), name='me'),
     path('experts/', ExpertListView.as_view(), name='expert_list'),
+    path('experts/search/', ExpertSearchView.as_view(), name='expert_search'),
     path('clients/', ClientListView.as_view(), name='client_list'),
+    path('clients/roster/', ClientRosterView.as_view(), name='client_roster'),
     
     path("profile/", ProfileView.as_view(), name="profile"),
+
+    path("taxonomies/", TaxonomyListView.as_view(), name="taxonomies"),
     
     path("documents/presign-upload/", DocumentPresignUploadView.as_view(), name="document-presign-upload"),
     path("documents/", DocumentListCreateView.as_view()),
     path("documents/<uuid:uid>/", DocumentDeleteView.as_view(), name="document-delete"),
 
+    # STORAGE_PROVIDER=local iken imzalı URL'leri karşılayan uçlar
+    path("storage/upload/<path:key>", LocalStorageUploadView.as_view(), name="local-storage-upload"),
+    path("storage/download/<path:key>", LocalStorageDownloadView.as_view(), name="local-storage-download"),
+
     # password reset enpoints
     path('auth/password-reset/', PasswordResetRequestView.as_view(), name='password_reset_request'),
     path('auth/password-reset/confirm/', PasswordResetConfirmView.as_view(), name='password_reset_confirm'),
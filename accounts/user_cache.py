@@ -0,0 +1,51 @@
+"""
+Kimliği doğrulanmış kullanıcı için kısa ömürlü cache.
+
+JWT ile gelen her istekte User satırı ve ardından view'larda profil
+(user.expertprofile / user.clientprofile) tekrar yüklenir. Burada kullanıcı
+profilleriyle birlikte select_related ile tek sorguda yüklenir ve
+AUTH_USER_CACHE_TIMEOUT saniye boyunca cache'te tutulur. Olmayan profiller de
+(None olarak) önbelleğe alındığından hasattr(user, 'expertprofile') zincirleri
+sorgu çalıştırmaz.
+
+User veya profil kaydedildiğinde/silindiğinde cache girdisi düşürülür (signals.py).
+Düşürme sadece paylaşılan bir cache'te (CACHE_URL) tüm worker'lara ulaşır; bu
+yüzden cache varsayılan olarak sadece CACHE_URL verildiğinde açıktır, süreç
+içi cache ile açılırsa manage.py check uyarı verir (checks.py).
+"""
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+
+from .models import User
+
+PROFILE_RELATIONS = ('expertprofile', 'clientprofile', 'admin_profile')
+
+
+def cache_key(user_id):
+    return f'auth:user:{user_id}'
+
+
+def load_user(**lookup):
+    """Kullanıcıyı tüm profilleriyle tek sorguda yükler."""
+    return User.objects.select_related(*PROFILE_RELATIONS).get(**lookup)
+
+
+def get_cached_user(user_id, lookup_field='id'):
+    timeout = getattr(settings, 'AUTH_USER_CACHE_TIMEOUT', 0)
+    if not timeout:
+        return load_user(**{lookup_field: user_id})
+
+    key = cache_key(user_id)
+    user = cache.get(key)
+    if user is None:
+        user = load_user(**{lookup_field: user_id})
+        cache.set(key, user, timeout)
+    return user
+
+
+def invalidate_user(user_id):
+    key = cache_key(user_id)
+    cache.delete(key)
+    # Commit öncesi başka bir istek eski satırı tekrar cache'e yazmış olabilir
+    transaction.on_commit(lambda: cache.delete(key))
@@ -3,8 +3,10 @@ import logging
 import uuid
 from django.db import transaction
 from accounts.serializers.document_serializers import DocumentSerializer
-from accounts.models import Document, DocumentType
+from accounts.background import run_in_background
+from accounts.models import Document, DocumentType, StorageDeletionReason
 from accounts.storage import storage
+from accounts.storage.gc import process_deletions, schedule_deletion
 from rest_framework.generics import ListCreateAPIView, DestroyAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import ValidationError  
@@ -70,7 +72,8 @@ class DocumentPresignUploadView(APIView):
         file_key = f"{role_path}/{request.user.id}/{doc_type}/{uid}"
 
         presigned = storage.presign_upload(
-            key=file_key
+            key=file_key,
+            content_type=request.data.get("content_type"),
         )
 
         return Response({
@@ -98,23 +101,13 @@ class DocumentDeleteView(DestroyAPIView):
         if instance.is_primary:
             raise ValidationError("Primary document cannot be deleted.")
 
-        file_key = instance.file_key
-
-        # DB state (atomic)
+        # DB state + dosya silme kaydı aynı transaction içinde (outbox)
         with transaction.atomic():
             instance.is_current = False
             instance.is_primary = False
             instance.save(update_fields=["is_current", "is_primary"])
+            schedule_deletion(instance.storage_keys(), StorageDeletionReason.DOCUMENT_DELETED)
 
-        # Storage delete (side-effect)
-        try:
-            storage.delete(file_key)
-        except Exception as exc:
-            logger.error(
-                "Storage delete failed",
-                extra={
-                    "file_key": file_key,
-                    "document_uid": str(instance.uid),
-                    "error": str(exc)
-                }
-            )
+        # Storage delete (side-effect) commit sonrası arka planda; başarısızsa
+        # process_storage_deletions komutu yeniden dener
+        run_in_background(process_deletions, max_batches=1)
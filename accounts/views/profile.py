@@ -1,7 +1,12 @@
 from rest_framework.generics import RetrieveUpdateAPIView
 from rest_framework.permissions import IsAuthenticated
 from rest_framework.exceptions import PermissionDenied, NotFound
-from accounts.models import Document, ExpertProfile, ClientProfile, UserRole
+from rest_framework.response import Response
+from accounts.models import Document, EmergencyContact, ExpertProfile, ClientProfile, User, UserRole
+from accounts.profile_cache import get_profile, set_profile
+from accounts.storage.presign_cache import PRESIGN_EXPIRY_MARGIN
+from accounts.taxonomies import get_snapshot
+from api.conditional import ConditionalGetMixin
 from django.db.models import Prefetch
 from accounts.serializers.profile_update_serializers import (
     ExpertProfileUpdateSerializer,
@@ -11,32 +16,81 @@ from accounts.permissions import IsOwnerProfile
 from accounts.serializers.profileSerializers import ClientProfileSerializer, ExpertProfileSerializer
 
 
-class ProfileView(RetrieveUpdateAPIView):
+class ProfileView(ConditionalGetMixin, RetrieveUpdateAPIView):
     """
     Tek endpoint üzerinden kullanıcı rolüne göre profil bilgilerini getirir ve günceller.
     /profile/
     """
     permission_classes = [IsAuthenticated, IsOwnerProfile]
+    # Belgeler süreli imzalı URL içerir
+    conditional_max_age = PRESIGN_EXPIRY_MARGIN
+
+    def get_conditional_sources(self, request, *args, **kwargs):
+        user = request.user
+        sources = [
+            User.objects.filter(pk=user.pk),
+            Document.objects.filter(user=user, is_current=True),
+        ]
+        if user.role == UserRole.EXPERT:
+            sources.append(ExpertProfile.objects.filter(user=user))
+        elif user.role == UserRole.CLIENT:
+            sources += [
+                ClientProfile.objects.filter(user=user),
+                EmergencyContact.objects.filter(client_profile__user=user),
+                # Atanan uzmanın adı ve unvanı
+                ExpertProfile.objects.filter(assigned_clients__user=user),
+                User.objects.filter(expertprofile__assigned_clients__user=user),
+            ]
+        else:
+            return None
+        return sources
+
+    def get_conditional_key(self, request, *args, **kwargs):
+        # Hizmet, dil vb. adlar sözlük tablolarından gelir
+        return f"{super().get_conditional_key(request, *args, **kwargs)}#{get_snapshot().etag}"
 
     def get_object(self):
         user = self.request.user
-        
-        active_documents = Document.objects.filter(is_current=True)
-        prefetch = Prefetch(
-            "user__documents", 
-            queryset=active_documents,
-        )
-        # 'user__documents' ifadesi: Profile -> User -> Documents yolunu izler
 
+        # Profile -> User -> Documents; sadece güncel belgeler
+        documents = Prefetch("user__documents", queryset=Document.objects.filter(is_current=True))
+
+        # Serializer'ın okuduğu tüm ilişkiler önceden yüklenir; sorgu sayısı
+        # M2M kayıt sayısından bağımsızdır (uzman 8, danışan 4 sorgu)
         try:
             if user.role == UserRole.EXPERT:
-                return ExpertProfile.objects.prefetch_related(prefetch).get(user=user)
+                queryset = ExpertProfile.objects.select_related(
+                    "user", "university", "degree_level", "major",
+                ).prefetch_related(
+                    "services", "specializations", "languages",
+                    "approach_methods", "target_groups", "session_types",
+                    documents,
+                )
             elif user.role == UserRole.CLIENT:
-                return ClientProfile.objects.prefetch_related(prefetch).get(user=user)
+                queryset = ClientProfile.objects.select_related(
+                    "user", "expert__user",
+                ).prefetch_related("substances_used", "emergency_contacts", documents)
+            else:
+                raise PermissionDenied("Bu endpoint sadece uzman ve danışan kullanıcılar içindir.")
+            return queryset.get(user=user)
         except (ExpertProfile.DoesNotExist, ClientProfile.DoesNotExist):
             raise NotFound("Profil bulunamadı.")
 
-        raise PermissionDenied("Bu endpoint sadece uzman ve danışan kullanıcılar içindir.")
+    def retrieve(self, request, *args, **kwargs):
+        """
+        Serileştirilmiş profil cache'ten döner (bkz. accounts/profile_cache.py);
+        cache'te yoksa tek seferde yüklenip yazılır.
+        """
+        data = get_profile(request.user.pk)
+        if data is None:
+            instance = self.get_object()
+            data = self.get_serializer(instance).data
+            set_profile(
+                request.user.pk,
+                data,
+                [document.file_key for document in instance.user.documents.all()],
+            )
+        return Response(data)
 
     def get_serializer_class(self):
         user = self.request.user
@@ -0,0 +1,140 @@
+# accounts/views/storage_views.py
+"""
+LocalStorage için imzalı upload/download uçları.
+
+Supabase'in imzalı URL'lerini karşılayan sunucu tarafının yerel karşılığıdır;
+sadece STORAGE_PROVIDER=local iken çalışır. Kimlik doğrulama URL'deki HMAC
+imzası ile yapılır (JWT gerekmez).
+"""
+import mimetypes
+import os
+import re
+
+from django.conf import settings
+from django.http import FileResponse, Http404, JsonResponse, StreamingHttpResponse
+from django.utils.decorators import method_decorator
+from django.views import View
+from django.views.decorators.csrf import csrf_exempt
+
+from accounts.storage import storage
+from accounts.storage.local import CHUNK_SIZE, LocalStorage
+
+RANGE_RE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+
+def _local_storage():
+    if not isinstance(storage, LocalStorage):
+        raise Http404
+    return storage
+
+
+def _invalid_signature():
+    return JsonResponse({"detail": "Geçersiz veya süresi dolmuş imza."}, status=403)
+
+
+def parse_range(header, size):
+    """
+    Tek aralıklı Range başlığını (start, end) olarak döner; başlık yoksa veya
+    desteklenmiyorsa (çoklu aralık) None. Karşılanamayan aralıkta ValueError.
+    """
+    if not header:
+        return None
+    match = RANGE_RE.match(header.strip())
+    if not match:
+        return None
+    start, end = match.groups()
+    if not start and not end:
+        return None
+    if not start:
+        # bytes=-N: son N byte
+        length = int(end)
+        if length == 0:
+            raise ValueError(header)
+        return max(size - length, 0), size - 1
+    start = int(start)
+    end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+def _iter_file_range(fh, start, length):
+    try:
+        fh.seek(start)
+        remaining = length
+        while remaining > 0:
+            chunk = fh.read(min(CHUNK_SIZE, remaining))
+            if not chunk:
+                break
+            remaining -= len(chunk)
+            yield chunk
+    finally:
+        fh.close()
+
+
+@method_decorator(csrf_exempt, name="dispatch")
+class LocalStorageUploadView(View):
+    """PUT /storage/upload/<key>?expires=..&signature=.. — gövdeyi parça parça diske yazar."""
+
+    def put(self, request, key):
+        provider = _local_storage()
+        if not provider.verify("PUT", key, request.GET.get("expires"), request.GET.get("signature")):
+            return _invalid_signature()
+
+        chunks = iter(lambda: request.read(CHUNK_SIZE), b"")
+        try:
+            size = provider.save_stream(
+                key,
+                chunks,
+                content_type=request.content_type or None,
+                max_size=getattr(settings, "LOCAL_STORAGE_MAX_UPLOAD_SIZE", None),
+            )
+        except ValueError:
+            return JsonResponse({"detail": "Dosya boyutu sınırı aşıldı."}, status=413)
+
+        return JsonResponse({"Key": key, "size": size})
+
+
+class LocalStorageDownloadView(View):
+    """GET /storage/download/<key>?expires=..&signature=.. — Range destekli dosya sunumu."""
+
+    def get(self, request, key):
+        provider = _local_storage()
+        if not provider.verify("GET", key, request.GET.get("expires"), request.GET.get("signature")):
+            return _invalid_signature()
+
+        path = provider.path_for(key)
+        try:
+            size = os.path.getsize(path)
+        except FileNotFoundError:
+            raise Http404
+
+        content_type = (
+            provider.read_meta(key).get("content_type")
+            or mimetypes.guess_type(key)[0]
+            or "application/octet-stream"
+        )
+
+        try:
+            byte_range = parse_range(request.headers.get("Range"), size)
+        except ValueError:
+            response = JsonResponse({"detail": "İstenen aralık karşılanamıyor."}, status=416)
+            response["Content-Range"] = f"bytes */{size}"
+            return response
+
+        if byte_range is None:
+            # FileResponse, sunucu destekliyorsa wsgi.file_wrapper (sendfile) kullanır
+            response = FileResponse(open(path, "rb"), content_type=content_type)
+        else:
+            start, end = byte_range
+            length = end - start + 1
+            response = StreamingHttpResponse(
+                _iter_file_range(open(path, "rb"), start, length),
+                status=206,
+                content_type=content_type,
+            )
+            response["Content-Range"] = f"bytes {start}-{end}/{size}"
+            response["Content-Length"] = str(length)
+
+        response["Accept-Ranges"] = "bytes"
+        return response
@@ -0,0 +1,31 @@
+from rest_framework.permissions import AllowAny
+from rest_framework.response import Response
+from rest_framework.views import APIView
+from rest_framework import status
+
+from accounts.taxonomies import get_snapshot
+
+
+class TaxonomyListView(APIView):
+    """
+    GET /accounts/taxonomies/ tüm açılır liste verisini (hizmetler, diller,
+    üniversiteler, uzmanlık alanları, bağımlılık türleri vb.) tek cevapta döner.
+
+    Cevap ETag taşır; istemci If-None-Match ile yeniden doğrular, veri
+    değişmediyse gövdesiz 304 döner. Veri süreç içi cache'ten gelir
+    (accounts/taxonomies.py), veritabanına gidilmez.
+    """
+    permission_classes = [AllowAny]
+    authentication_classes = []
+
+    def get(self, request):
+        snapshot = get_snapshot()
+        if_none_match = request.headers.get("If-None-Match", "")
+        if snapshot.etag in [tag.strip() for tag in if_none_match.split(",")] or if_none_match.strip() == "*":
+            response = Response(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            response = Response(snapshot.payload)
+        response["ETag"] = snapshot.etag
+        # Her kullanımda yeniden doğrulansın (ucuz: 304)
+        response["Cache-Control"] = "no-cache"
+        return response
@@ -6,23 +6,30 @@ from ..serializers.serializers import (LoginSerializer,
                                       PasswordResetRequestSerializer,
                                       PasswordResetConfirmSerializer,
                                       ExpertListSerializer,
-                                      ClientListSerializer)
+                                      ClientListSerializer,
+                                      ClientRosterSerializer)
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
 from rest_framework.permissions import IsAuthenticated
 from rest_framework_simplejwt.tokens import RefreshToken
 from rest_framework_simplejwt.exceptions import TokenError
-from django.contrib.auth import get_user_model, authenticate
+from django.contrib.auth import get_user_model
 from django.conf import settings
 from django.contrib.auth.tokens import PasswordResetTokenGenerator
 from django.utils.http import urlsafe_base64_encode, urlsafe_base64_decode
 from django.utils.encoding import force_bytes, force_str
 from django.core.mail import send_mail
 from django.contrib.auth.password_validation import validate_password
-from django.db.models import Q
-from ..models import UserRole, ExpertProfile, ClientProfile, Document, DocumentType
-from accounts.serializers.document_serializers import DocumentSerializer
+from django.db.models import Exists, OuterRef, Prefetch
+from ..models import UserRole, ExpertProfile, ClientProfile, Service, Document, DocumentType
+from ..storage.presign_cache import PRESIGN_EXPIRY_MARGIN
+from ..taxonomies import get_snapshot
+from api.conditional import ConditionalGetMixin
+from accounts.serializers.document_serializers import get_profile_photo_url, profile_photo_prefetch
+from ..hashers import verify_password
+from .. import expert_search, text_search
+from ..roster import roster_queryset
 
 User = get_user_model()
 
@@ -79,7 +86,7 @@ class LoginView(APIView):
         is_expert_frontend = frontend_type == 'expert'
         is_client_frontend = frontend_type == 'client'
         
-        # Email'e göre kullanıcıyı bul
+        # Email'e göre kullanıcıyı bul (tek sorgu; şifre aynı nesne üzerinden doğrulanır)
         email = request.data.get('email')
         try:
             user = User.objects.get(email=email)
@@ -99,10 +106,9 @@ class LoginView(APIView):
                 "detail": "Bu arayüz sadece danışanlar için tasarlanmıştır. Lütfen uzman arayüzünü kullanın."
             }, status=status.HTTP_403_FORBIDDEN)
         
-        # Şimdi şifre kontrolü yap
+        # Şimdi şifre kontrolü yap; gerekirse yeniden hash'leme arka planda yapılır
         password = request.data.get('password')
-        user = authenticate(email=user.email, password=password)
-        if not user:
+        if not user.is_active or not verify_password(user, password):
             return Response({
                 "detail": "Geçersiz e-posta veya şifre."
             }, status=status.HTTP_400_BAD_REQUEST)
@@ -111,17 +117,8 @@ class LoginView(APIView):
         refresh = RefreshToken.for_user(user)
         access_token = str(refresh.access_token)
         refresh_token = str(refresh)
-        # Profil fotoğrafını çek
-        profile_photo = Document.objects.filter(
-            user=user,
-            type=DocumentType.PROFILE_PHOTO
-        ).first()
-
-        if profile_photo:
-            serialized = DocumentSerializer(profile_photo, context={'request': request})
-            profile_photo_url = serialized.data.get("access_url")
-        else:
-            profile_photo_url = None
+        # Profil fotoğrafı (cache'lenmiş imzalı URL)
+        profile_photo_url = get_profile_photo_url(user)
         response = Response({
             "name": user.first_name,
             "surname": user.last_name,
@@ -201,17 +198,7 @@ class MeView(APIView):
 
     def get(self, request):
         user = request.user
-        # Profil fotoğrafını çek
-        profile_photo = Document.objects.filter(
-            user=user,
-            type=DocumentType.PROFILE_PHOTO
-        ).first()
-
-        if profile_photo:
-            serialized = DocumentSerializer(profile_photo, context={'request': request})
-            profile_photo_url = serialized.data.get("access_url")
-        else:
-            profile_photo_url = None
+        profile_photo_url = get_profile_photo_url(user)
 
         return Response({
             "first_name": user.first_name,
@@ -223,34 +210,135 @@ class MeView(APIView):
         })
 
 
-class ExpertListView(generics.ListAPIView):
+def expert_directory_queryset():
+    """Sayfa boyutundan bağımsız sabit sorgu: uzmanlar (+user), hizmetler, profil fotoğrafları."""
+    return (
+        ExpertProfile.objects.filter(approval_status=True)
+        .select_related('user')
+        .prefetch_related(
+            Prefetch('services', queryset=Service.objects.only('id', 'name')),
+            profile_photo_prefetch('user__documents'),
+        )
+    )
+
+
+class ExpertDirectoryConditionalMixin(ConditionalGetMixin):
+    """Uzman rehberi cevapları için koşullu GET (api/conditional.py)."""
+    # Profil fotoğrafları süreli imzalı URL
+    conditional_max_age = PRESIGN_EXPIRY_MARGIN
+
+    def get_conditional_sources(self, request, *args, **kwargs):
+        # Hizmet, dil vb. M2M değişiklikleri ExpertProfile.updated_at'i ilerletir (signals.py)
+        return [
+            ExpertProfile.objects.filter(approval_status=True),
+            User.objects.filter(expertprofile__approval_status=True),
+            Document.objects.filter(
+                type=DocumentType.PROFILE_PHOTO, is_current=True, user__expertprofile__approval_status=True
+            ),
+        ]
+
+    def get_conditional_key(self, request, *args, **kwargs):
+        # Hizmet adları sözlük tablolarından gelir
+        return f"{super().get_conditional_key(request, *args, **kwargs)}#{get_snapshot().etag}"
+
+
+class ExpertListView(ExpertDirectoryConditionalMixin, generics.ListAPIView):
     """
     GET /accounts/experts/ endpointi uzmanları listeler.
     Sadece kimliği doğrulanmış kullanıcılar erişebilir.
     Query parameter ile kategoriye göre filtreleme yapabilir: ?category=bilissel-terapi
+    Puana göre sıralama: ?ordering=rating (denormalize alanlar ve indeks üzerinden)
     """
     serializer_class = ExpertListSerializer
     permission_classes = [IsAuthenticated]
 
+    ORDERINGS = {
+        'rating': ('-rating_average', '-rating_count', 'id'),
+    }
+
     def get_queryset(self):
-        queryset = ExpertProfile.objects.filter(approval_status=True).select_related('user')
+        ordering = self.ORDERINGS.get(self.request.query_params.get('ordering'), ('id',))
+        queryset = expert_directory_queryset().order_by(*ordering)
 
         # Kategori filtresi
         category_slug = self.request.query_params.get('category', None)
         if category_slug:
-            # Servis slug'una göre filtrele
-            queryset = queryset.filter(
-                Q(services__slug=category_slug)
-            ).distinct()
+            # Servis slug'una göre filtrele; M2M join + DISTINCT yerine EXISTS alt sorgusu
+            queryset = queryset.filter(Exists(
+                ExpertProfile.services.through.objects.filter(
+                    expertprofile_id=OuterRef('pk'),
+                    service__slug=category_slug,
+                )
+            ))
 
         return queryset
     
 
+class ExpertSearchView(ExpertDirectoryConditionalMixin, APIView):
+    """
+    GET /accounts/experts/search/ facet'li uzman araması.
+
+    Facet filtreleri virgülle ayrılmış id listeleri alır (facet içi VEYA, facet'ler arası VE):
+        ?services=1,2&languages=3&specializations=..&approach_methods=..&target_groups=..&session_types=..
+    Diğer filtreler: min_price, max_price, min_rating, availability=available,busy
+    Serbest metin: q (ad, unvan, hakkında, uzmanlık alanları vb.; accounts/text_search.py)
+    Sayfalama: limit (varsayılan 20, en fazla 100), offset
+
+    Sonuçlar müsaitlik, puan ve ücrete göre (q verilmişse alakaya göre) sıralanır;
+    her facet için değer id'si başına sonuç sayıları döner. Filtreleme bellekteki
+    indeksle yapılır (accounts/expert_search.py).
+    """
+    permission_classes = [IsAuthenticated]
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+
+    def get(self, request):
+        params = request.query_params
+        try:
+            selected = {
+                facet: [int(value) for value in params[facet].split(',') if value.strip()]
+                for facet in expert_search.FACETS
+                if params.get(facet)
+            }
+            scalars = {
+                name: float(params[name])
+                for name in ('min_price', 'max_price', 'min_rating')
+                if params.get(name)
+            }
+            limit = min(int(params.get('limit', self.DEFAULT_LIMIT)), self.MAX_LIMIT)
+            offset = int(params.get('offset', 0))
+        except ValueError:
+            return Response({"error": "Geçersiz filtre parametresi."}, status=status.HTTP_400_BAD_REQUEST)
+        if limit < 1 or offset < 0:
+            return Response({"error": "Geçersiz sayfalama parametresi."}, status=status.HTTP_400_BAD_REQUEST)
+        if params.get('availability'):
+            scalars['availability'] = set(params['availability'].split(','))
+
+        within = None
+        text = params.get('q', '').strip()
+        if text:
+            within = text_search.search_experts(ExpertProfile.objects.filter(approval_status=True), text)
+
+        ids, counts = expert_search.get_index().search(selected, within=within, **scalars)
+        page_ids = ids[offset:offset + limit]
+
+        experts = expert_directory_queryset().in_bulk(page_ids)
+        # İndeks kurulduktan sonra onayı kaldırılan uzmanlar sayfada yer almaz
+        page = [experts[expert_id] for expert_id in page_ids if expert_id in experts]
+        serializer = ExpertListSerializer(page, many=True, context={'request': request})
+
+        return Response({
+            "count": len(ids),
+            "results": serializer.data,
+            "facets": counts,
+        })
+
+
 class ClientListView(generics.ListAPIView):
     """
     GET /accounts/clients/ endpointi danışanları listeler.
     - Admin kullanıcılar tüm danışanları görebilir
-    - Expert kullanıcılar sadece kendisiyle randevusu olan danışanları görebilir
+    - Expert kullanıcılar sadece kendisine atanan danışanları görebilir
     - Client kullanıcılar bu endpoint'e erişemez
     """
     serializer_class = ClientListSerializer
@@ -276,6 +364,47 @@ class ClientListView(generics.ListAPIView):
         return queryset.none()
 
 
+class ClientRosterView(APIView):
+    """
+    GET /accounts/clients/roster/ uzman paneli danışan listesi.
+
+    Uzmana atanmış her danışan için sıradaki randevu, son tamamlanan randevu,
+    en son formun risk seviyesi ve randevu/form sayıları döner. Sayfa tek SQL
+    ifadesiyle hesaplanır (accounts/roster.py).
+    Sayfalama: limit (varsayılan 20, en fazla 100), offset
+    """
+    permission_classes = [IsAuthenticated]
+    DEFAULT_LIMIT = 20
+    MAX_LIMIT = 100
+
+    def get(self, request):
+        if request.user.role != UserRole.EXPERT:
+            return Response({"error": "Bu endpoint sadece uzmanlar içindir."}, status=status.HTTP_403_FORBIDDEN)
+
+        params = request.query_params
+        try:
+            limit = min(int(params.get('limit', self.DEFAULT_LIMIT)), self.MAX_LIMIT)
+            offset = int(params.get('offset', 0))
+        except ValueError:
+            return Response({"error": "Geçersiz sayfalama parametresi."}, status=status.HTTP_400_BAD_REQUEST)
+        if limit < 1 or offset < 0:
+            return Response({"error": "Geçersiz sayfalama parametresi."}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = roster_queryset(request.user)
+        page = list(queryset[offset:offset + limit])
+        if page:
+            count = page[0].total_count
+        else:
+            # Son sayfanın ötesi; toplam pencere fonksiyonundan okunamaz
+            count = queryset.count() if offset else 0
+
+        serializer = ClientRosterSerializer(page, many=True, context={'request': request})
+        return Response({
+            "count": count,
+            "results": serializer.data,
+        })
+
+
 class PasswordResetRequestView(APIView):
     serializer_class = PasswordResetRequestSerializer
 
@@ -0,0 +1,139 @@
+"""
+Okuma uç noktaları için koşullu GET (ETag / Last-Modified) desteği.
+
+View, cevabı oluşturan satırları queryset olarak bildirir; her kaynak için
+en son güncellenme zamanı (Max) ve satır sayısı (Count, silmeleri yakalar)
+tek bir aggregate sorgusuyla (UNION ALL) okunur. Bunlardan ETag ve
+Last-Modified üretilir; istemcinin If-None-Match / If-Modified-Since başlığı
+eşleşirse serializer hiç çalışmadan gövdesiz 304 döner.
+
+Kullanım:
+
+    class FormDetailView(ConditionalGetMixin, APIView):
+        def get_conditional_sources(self, request, form_id):
+            return [Form.objects.filter(id=form_id)]
+
+Kaynak olarak queryset (updated_at alanı kullanılır) veya (queryset, alan)
+ikilisi verilebilir; alan bir DateTimeField olmalıdır. None dönülürse
+koşullu kontrol yapılmaz.
+"""
+import hashlib
+import time
+
+from django.db.models import Count, IntegerField, Max, Value
+from django.utils.http import http_date, parse_http_date_safe
+from rest_framework import status
+from rest_framework.response import Response
+
+
+class NotModified(Exception):
+    """İstemcideki kopya güncel; view gövdesiz 304 döner."""
+
+
+def _normalize_sources(sources):
+    return [source if isinstance(source, tuple) else (source, 'updated_at') for source in sources]
+
+
+def aggregate_sources(sources):
+    """Her kaynak için (son güncellenme, satır sayısı) — tek sorgu."""
+    sources = _normalize_sources(sources)
+    parts = [
+        queryset.order_by()
+        .annotate(_source=Value(index, output_field=IntegerField()))
+        .values('_source')
+        .annotate(_last=Max(field), _total=Count('pk'))
+        .values_list('_source', '_last', '_total')
+        for index, (queryset, field) in enumerate(sources)
+    ]
+    query = parts[0].union(*parts[1:], all=True) if len(parts) > 1 else parts[0]
+    rows = {source: (last, total) for source, last, total in query}
+    return [rows.get(index, (None, 0)) for index in range(len(sources))]
+
+
+def compute_validators(sources, key='', max_age=None):
+    """
+    (etag, last_modified) döner.
+    max_age verilirse ETag bu süreyle sınırlı zaman dilimine bağlanır ve
+    Last-Modified üretilmez (ör. süreli imzalı URL içeren cevaplar).
+    """
+    stats = aggregate_sources(sources)
+    parts = [key] + [f"{last.isoformat() if last else '-'}:{total}" for last, total in stats]
+    if max_age:
+        parts.append(str(int(time.time() // max_age)))
+    etag = 'W/"%s"' % hashlib.sha1('|'.join(parts).encode('utf-8')).hexdigest()
+
+    last_modified = None
+    if not max_age:
+        timestamps = [last for last, _ in stats if last is not None]
+        last_modified = max(timestamps) if timestamps else None
+    return etag, last_modified
+
+
+def _strip_weak(tag):
+    tag = tag.strip()
+    return tag[2:] if tag.startswith('W/') else tag
+
+
+def is_not_modified(request, etag, last_modified):
+    if_none_match = request.headers.get('If-None-Match')
+    if if_none_match:
+        # If-None-Match varsa If-Modified-Since dikkate alınmaz (RFC 9110)
+        tags = [_strip_weak(tag) for tag in if_none_match.split(',')]
+        return '*' in tags or _strip_weak(etag) in tags
+
+    if_modified_since = parse_http_date_safe(request.headers.get('If-Modified-Since', ''))
+    if if_modified_since is not None and last_modified is not None:
+        return int(last_modified.timestamp()) <= if_modified_since
+    return False
+
+
+class ConditionalGetMixin:
+    """
+    APIView'lara koşullu GET ekler. Kimlik doğrulama ve izin kontrollerinden
+    sonra, handler çağrılmadan önce doğrulayıcılar hesaplanır.
+    """
+    # Saniye; cevap süreli imzalı URL içeriyorsa ETag en fazla bu kadar geçerli kalır
+    conditional_max_age = None
+
+    def get_conditional_sources(self, request, *args, **kwargs):
+        raise NotImplementedError
+
+    def get_conditional_key(self, request, *args, **kwargs):
+        """Aynı kaynaklardan farklı cevap üreten girdiler (kullanıcı, sorgu parametreleri)."""
+        user_id = getattr(request.user, 'pk', None)
+        return f"{user_id}?{request.META.get('QUERY_STRING', '')}"
+
+    def initial(self, request, *args, **kwargs):
+        super().initial(request, *args, **kwargs)
+        self._conditional_validators = None
+        if request.method not in ('GET', 'HEAD'):
+            return
+
+        sources = self.get_conditional_sources(request, *args, **kwargs)
+        if sources is None:
+            return
+        etag, last_modified = compute_validators(
+            sources,
+            key=self.get_conditional_key(request, *args, **kwargs),
+            max_age=self.conditional_max_age,
+        )
+        self._conditional_validators = (etag, last_modified)
+        if is_not_modified(request, etag, last_modified):
+            raise NotModified()
+
+    def handle_exception(self, exc):
+        if isinstance(exc, NotModified):
+            return Response(status=status.HTTP_304_NOT_MODIFIED)
+        return super().handle_exception(exc)
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        validators = getattr(self, '_conditional_validators', None)
+        if validators and response.status_code in (status.HTTP_200_OK, status.HTTP_304_NOT_MODIFIED):
+            etag, last_modified = validators
+            response['ETag'] = etag
+            if last_modified is not None:
+                response['Last-Modified'] = http_date(last_modified.timestamp())
+            # Kullanıcıya özel; her kullanımda yeniden doğrulansın
+            response['Cache-Control'] = 'private, no-cache'
+        return response
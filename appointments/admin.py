@@ -4,7 +4,9 @@ from django.urls import reverse
 from django.db.models import Count, Q
 from django.utils import timezone
 from datetime import timedelta
-from .models import Appointment
+from .dashboard import refresh_weeks
+from .models import Appointment, DailyUtilization, SessionReview
+from .utilization import utilization_by_service, utilization_series, utilization_summary
 
 
 class AppointmentStatusFilter(admin.SimpleListFilter):
@@ -152,42 +154,126 @@ class AppointmentAdmin(admin.ModelAdmin):
 
         if hasattr(response, 'context_data'):
             queryset = self.get_queryset(request)
+            today = timezone.now().date()
 
-            # İstatistikler
-            stats = {
-                'total': queryset.count(),
-                'confirmed': queryset.filter(status='confirmed').count(),
-                'pending': queryset.filter(status__in=['pending', 'waiting_approval']).count(),
-                'today': queryset.filter(date=timezone.now().date()).count(),
-                'upcoming': queryset.filter(date__gte=timezone.now().date(), status='confirmed').count(),
-            }
+            # İstatistikler (tek aggregate sorgusu)
+            stats = queryset.aggregate(
+                total=Count('id'),
+                confirmed=Count('id', filter=Q(status='confirmed')),
+                pending=Count('id', filter=Q(status__in=['pending', 'waiting_approval'])),
+                today=Count('id', filter=Q(date=today)),
+                upcoming=Count('id', filter=Q(date__gte=today, status='confirmed')),
+            )
 
             response.context_data['appointment_stats'] = stats
+            # Kapasite/talep özeti randevular yerine günlük özet tablosundan okunur
+            response.context_data['utilization_stats'] = utilization_summary(
+                DailyUtilization.objects.filter(day__range=(today - timedelta(days=29), today))
+            )
 
         return response
 
     # Custom actions
     def mark_as_confirmed(self, request, queryset):
         """Seçili randevuları onaylanmış olarak işaretle"""
-        updated = queryset.filter(status__in=['pending', 'waiting_approval']).update(status='confirmed', is_confirmed=True)
+        changed = queryset.filter(status__in=['pending', 'waiting_approval'])
+        # update() sinyal üretmez; haftalık özetler elle yenilenir, updated_at
+        # günlük kullanım özeti işinin değişikliği görmesi için verilir
+        keys = set(changed.values_list('expert_id', 'date'))
+        updated = changed.update(status='confirmed', is_confirmed=True, updated_at=timezone.now())
+        refresh_weeks(keys)
         self.message_user(request, f'{updated} randevu onaylandı.')
     mark_as_confirmed.short_description = "Seçili randevuları onayla"
 
     def mark_as_completed(self, request, queryset):
         """Seçili randevuları tamamlanmış olarak işaretle"""
-        updated = queryset.filter(status='confirmed').update(status='completed')
+        changed = queryset.filter(status='confirmed')
+        keys = set(changed.values_list('expert_id', 'date'))
+        updated = changed.update(status='completed', updated_at=timezone.now())
+        refresh_weeks(keys)
         self.message_user(request, f'{updated} randevu tamamlandı olarak işaretlendi.')
     mark_as_completed.short_description = "Seçili randevuları tamamla"
 
     def mark_as_cancelled(self, request, queryset):
         """Seçili randevuları iptal edilmiş olarak işaretle"""
-        updated = queryset.update(status='cancelled', is_confirmed=False)
+        keys = set(queryset.values_list('expert_id', 'date'))
+        updated = queryset.update(status='cancelled', is_confirmed=False, updated_at=timezone.now())
+        refresh_weeks(keys)
         self.message_user(request, f'{updated} randevu iptal edildi.')
     mark_as_cancelled.short_description = "Seçili randevuları iptal et"
 
     def soft_delete(self, request, queryset):
         """Seçili randevuları soft delete yap"""
-        updated = queryset.update(is_deleted=True)
+        keys = set(queryset.values_list('expert_id', 'date'))
+        updated = queryset.update(is_deleted=True, updated_at=timezone.now())
+        refresh_weeks(keys)
         self.message_user(request, f'{updated} randevu silindi (soft delete).')
     soft_delete.short_description = "Seçili randevuları sil (soft delete)"
 
+
+@admin.register(SessionReview)
+class SessionReviewAdmin(admin.ModelAdmin):
+    list_display = ['appointment', 'expert', 'client', 'rating', 'created_at']
+    list_filter = ['rating']
+    search_fields = [
+        'expert__first_name', 'expert__last_name',
+        'client__first_name', 'client__last_name',
+        'comment'
+    ]
+    raw_id_fields = ['appointment', 'expert', 'client']
+    readonly_fields = ['created_at', 'updated_at']
+    ordering = ['-created_at']
+
+
+@admin.register(DailyUtilization)
+class DailyUtilizationAdmin(admin.ModelAdmin):
+    """Günlük kapasite/talep özeti; refresh_daily_utilization komutuyla doldurulur, elle değiştirilmez."""
+    change_list_template = 'admin/appointments/dailyutilization/change_list.html'
+    list_display = [
+        'day', 'expert', 'service', 'available_minutes', 'booked_minutes',
+        'utilization_bar', 'sessions', 'completed', 'cancelled', 'completion_rate_display'
+    ]
+    list_filter = ['service', 'day', 'is_stale']
+    search_fields = ['expert__first_name', 'expert__last_name', 'expert__email']
+    date_hierarchy = 'day'
+    ordering = ['-day', 'expert']
+    list_select_related = ['expert', 'service']
+    list_per_page = 50
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def utilization_bar(self, obj):
+        """Dolu dakikaların müsait dakikalara oranı"""
+        if obj.utilization is None:
+            return '-'
+        percent = round(obj.utilization * 100)
+        color = '#f44336' if percent > 100 else '#4caf50' if percent >= 50 else '#ff9800'
+        return format_html(
+            '<div style="width: 100px; background: #eee;"><div style="width: {}px; background: {}; height: 8px;"></div></div>'
+            '<small>%{}</small>',
+            min(percent, 100), color, percent
+        )
+    utilization_bar.short_description = 'Doluluk'
+
+    def completion_rate_display(self, obj):
+        return '-' if obj.completion_rate is None else f'%{round(obj.completion_rate * 100)}'
+    completion_rate_display.short_description = 'Tamamlanma'
+
+    def changelist_view(self, request, extra_context=None):
+        """Filtrelenmiş özet satırlarından grafik verileri"""
+        response = super().changelist_view(request, extra_context)
+
+        if hasattr(response, 'context_data') and 'cl' in response.context_data:
+            queryset = response.context_data['cl'].queryset
+            series = utilization_series(queryset)
+            for row in series:
+                row['utilization_percent'] = min(round((row['utilization'] or 0) * 100), 100)
+            response.context_data['utilization_stats'] = utilization_summary(queryset)
+            response.context_data['utilization_series'] = series
+            response.context_data['utilization_by_service'] = utilization_by_service(queryset)
+
+        return response
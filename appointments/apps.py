@@ -3,4 +3,7 @@ from django.apps import AppConfig
 class AppointmentsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'appointments'
-    verbose_name = 'Randevu Yönetimi'
\ No newline at end of file
+    verbose_name = 'Randevu Yönetimi'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -0,0 +1,160 @@
+"""
+Uzman paneli özetleri.
+
+Haftalık randevu sayıları ve dolu dakikalar ExpertWeeklyStats tablosunda
+tutulur. Randevu kaydedildiğinde/silindiğinde (signals.py) ve admin toplu
+işlemlerinde sadece etkilenen (uzman, hafta) satırları tek bir gruplu sorgu
+ve tek bir upsert ile yeniden hesaplanır; panel geçmiş haftalar için
+Appointment tablosunu taramaz. Tablo rebuild_weekly_stats komutuyla
+baştan üretilebilir.
+
+Müsait dakikalar WeeklyAvailability'deki aktif aralıklardan (haftalık
+tekrarlayan program) hesaplanır; istisnalar (AvailabilityException) hesaba
+katılmaz.
+"""
+from datetime import date, datetime, timedelta
+
+from django.db.models import Count, IntegerField, Q, Sum, Value
+from django.db.models.functions import Coalesce, TruncWeek
+from django.utils import timezone
+
+from availability.models import WeeklyAvailability
+
+from .models import Appointment, ExpertWeeklyStats, User
+
+# Sayılmayan (iptal edilmiş) durum
+CANCELLED_STATUSES = ('cancelled',)
+# Uzman onayı bekleyen talepler
+PENDING_APPROVAL_STATUSES = ('waiting_approval', 'cancel_requested')
+
+
+def week_start(day):
+    if isinstance(day, datetime):
+        day = day.date()
+    elif isinstance(day, str):
+        day = date.fromisoformat(day)
+    return day - timedelta(days=day.weekday())
+
+
+def _weekly_rows(appointments):
+    """(expert_id, hafta) başına özet; tek gruplu sorgu."""
+    active = ~Q(status__in=CANCELLED_STATUSES)
+    return (
+        appointments.filter(is_deleted=False)
+        .order_by()
+        .annotate(week=TruncWeek('date'))
+        .values('expert_id', 'week')
+        .annotate(
+            sessions=Count('id', filter=active),
+            completed=Count('id', filter=Q(status='completed')),
+            cancelled=Count('id', filter=Q(status__in=CANCELLED_STATUSES)),
+            booked_minutes=Coalesce(Sum('duration', filter=active), Value(0), output_field=IntegerField()),
+        )
+    )
+
+
+def _stats(expert_id, week, row=None):
+    row = row or {}
+    return ExpertWeeklyStats(
+        expert_id=expert_id,
+        week_start=week,
+        sessions=row.get('sessions', 0),
+        completed=row.get('completed', 0),
+        cancelled=row.get('cancelled', 0),
+        booked_minutes=row.get('booked_minutes', 0),
+    )
+
+
+def refresh_weeks(keys):
+    """
+    keys: (expert_id, tarih) ikilileri; tarihin haftası yeniden hesaplanır.
+    Randevusu kalmayan haftalar sıfırlanır.
+    """
+    pairs = {(expert_id, week_start(day)) for expert_id, day in keys if expert_id and day}
+    # Uzman kullanıcı silinmişse (randevular cascade ile silinir) satır yazılmaz
+    existing = set(User.objects.filter(pk__in={expert_id for expert_id, _ in pairs}).values_list('pk', flat=True))
+    pairs = {(expert_id, week) for expert_id, week in pairs if expert_id in existing}
+    if not pairs:
+        return
+    weeks = [week for _, week in pairs]
+    rows = _weekly_rows(Appointment.objects.filter(
+        expert_id__in={expert_id for expert_id, _ in pairs},
+        date__gte=min(weeks),
+        date__lt=max(weeks) + timedelta(days=7),
+    ))
+    found = {(row['expert_id'], week_start(row['week'])): row for row in rows}
+    ExpertWeeklyStats.objects.bulk_create(
+        [_stats(expert_id, week, found.get((expert_id, week))) for expert_id, week in sorted(pairs)],
+        update_conflicts=True,
+        unique_fields=['expert', 'week_start'],
+        update_fields=['sessions', 'completed', 'cancelled', 'booked_minutes', 'updated_at'],
+    )
+
+
+def rebuild_weekly_stats():
+    """Tüm tabloyu randevulardan yeniden üretir; yazılan satır sayısını döner."""
+    stats = [
+        _stats(row['expert_id'], week_start(row['week']), row)
+        for row in _weekly_rows(Appointment.objects.all())
+    ]
+    ExpertWeeklyStats.objects.all().delete()
+    ExpertWeeklyStats.objects.bulk_create(stats, batch_size=1000)
+    return len(stats)
+
+
+def available_minutes_per_week(expert_profile):
+    """Aktif haftalık müsaitlik aralıklarının toplam dakikası (kapasiteyle çarpılmış)."""
+    total = 0
+    for start, end, capacity in WeeklyAvailability.objects.filter(
+        expert=expert_profile, is_active=True,
+    ).values_list('start_time', 'end_time', 'capacity'):
+        minutes = (end.hour * 60 + end.minute) - (start.hour * 60 + start.minute)
+        total += max(minutes, 0) * capacity
+    return total
+
+
+def expert_dashboard(expert_user, weeks=8, today=None):
+    """Uzman paneli cevabı: durum sayıları, son N haftanın özeti, doluluk, onay bekleyenler."""
+    today = today or timezone.localdate()
+    current_week = week_start(today)
+    first_week = current_week - timedelta(weeks=weeks - 1)
+
+    status_counts = dict(
+        Appointment.objects.filter(expert=expert_user, is_deleted=False)
+        .order_by().values_list('status').annotate(total=Count('id'))
+    )
+    rows = {
+        row.week_start: row
+        for row in ExpertWeeklyStats.objects.filter(
+            expert=expert_user, week_start__gte=first_week, week_start__lte=current_week,
+        )
+    }
+    expert_profile = getattr(expert_user, 'expertprofile', None)
+    available = available_minutes_per_week(expert_profile) if expert_profile else 0
+
+    weekly = []
+    for index in range(weeks):
+        week = first_week + timedelta(weeks=index)
+        row = rows.get(week) or _stats(expert_user.pk, week)
+        weekly.append({
+            'week_start': week,
+            'sessions': row.sessions,
+            'completed': row.completed,
+            'cancelled': row.cancelled,
+            'booked_minutes': row.booked_minutes,
+            'available_minutes': available,
+            'utilization': round(row.booked_minutes / available, 4) if available else None,
+        })
+
+    booked_total = sum(week['booked_minutes'] for week in weekly)
+    available_total = available * weeks
+    return {
+        'status_counts': {status: status_counts.get(status, 0) for status, _ in Appointment._meta.get_field('status').choices},
+        'pending_approvals': {status: status_counts.get(status, 0) for status in PENDING_APPROVAL_STATUSES},
+        'weeks': weekly,
+        'utilization': {
+            'booked_minutes': booked_total,
+            'available_minutes': available_total,
+            'rate': round(booked_total / available_total, 4) if available_total else None,
+        },
+    }
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from appointments.dashboard import rebuild_weekly_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Uzman paneli haftalık özet tablosunu (ExpertWeeklyStats) randevulardan yeniden üretir. "
+        "İlk kurulumda veya randevular sinyal üretmeden toplu değiştirildiğinde çalıştırılmalıdır."
+    )
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            total = rebuild_weekly_stats()
+        self.stdout.write(f"{total} haftalık özet satırı yazıldı.")
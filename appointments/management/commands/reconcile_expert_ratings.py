@@ -0,0 +1,23 @@
+from django.core.management.base import BaseCommand
+from django.db import transaction
+
+from appointments.reviews import reconcile_ratings
+
+
+class Command(BaseCommand):
+    help = (
+        "Uzmanların rating_average / rating_count alanlarını seans değerlendirmelerinden "
+        "yeniden hesaplar ve sapanları düzeltir. Değerlendirmesi olmayan uzmanlar 0'lanır."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--dry-run', action='store_true', help='Yazmadan sadece raporla')
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            drifted = reconcile_ratings(dry_run=options['dry_run'])
+
+        if options['dry_run']:
+            self.stdout.write(f"[dry-run] {len(drifted)} uzmanın puanı değerlendirmelerle uyuşmuyor.")
+            return
+        self.stdout.write(f"{len(drifted)} uzmanın puanı düzeltildi.")
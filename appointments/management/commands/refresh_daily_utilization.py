@@ -0,0 +1,22 @@
+from django.core.management.base import BaseCommand
+
+from appointments.utilization import refresh_daily_utilization
+
+
+class Command(BaseCommand):
+    help = (
+        "Admin günlük kullanım özetini (DailyUtilization) son çalıştırmadan beri değişen günler için "
+        "yeniden hesaplar. Periyodik (ör. cron ile 5-15 dakikada bir) çalıştırılmalıdır; tekrar "
+        "çalıştırmak güvenlidir. --full geçmiş günlerin kapasitesini bugünkü haftalık programla yeniden yazar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--full', action='store_true', help='Değişiklik takibi yerine tüm günleri yeniden hesapla')
+        parser.add_argument('--dry-run', action='store_true', help='Yazmadan, işlenecek (uzman, gün) sayısını göster')
+
+    def handle(self, *args, **options):
+        total = refresh_daily_utilization(full=options['full'], dry_run=options['dry_run'])
+        if options['dry_run']:
+            self.stdout.write(f"{total} (uzman, gün) yeniden hesaplanacak.")
+        else:
+            self.stdout.write(f"{total} (uzman, gün) yeniden hesaplandı.")
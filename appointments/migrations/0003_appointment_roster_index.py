@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0002_sessionreview'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='appointment',
+            index=models.Index(fields=['client', 'expert', 'date', 'time'], name='appointment_roster_idx'),
+        ),
+    ]
@@ -0,0 +1,65 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:33
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import TruncWeek
+
+
+def backfill_weekly_stats(apps, schema_editor):
+    Appointment = apps.get_model('appointments', 'Appointment')
+    ExpertWeeklyStats = apps.get_model('appointments', 'ExpertWeeklyStats')
+    active = ~Q(status='cancelled')
+    rows = (
+        Appointment.objects.filter(is_deleted=False).order_by()
+        .annotate(week=TruncWeek('date')).values('expert_id', 'week')
+        .annotate(
+            sessions=Count('id', filter=active),
+            completed=Count('id', filter=Q(status='completed')),
+            cancelled=Count('id', filter=Q(status='cancelled')),
+            booked_minutes=Sum('duration', filter=active),
+        )
+    )
+    ExpertWeeklyStats.objects.bulk_create([
+        ExpertWeeklyStats(
+            expert_id=row['expert_id'],
+            week_start=row['week'],
+            sessions=row['sessions'],
+            completed=row['completed'],
+            cancelled=row['cancelled'],
+            booked_minutes=row['booked_minutes'] or 0,
+        )
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('appointments', '0003_appointment_roster_index'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ExpertWeeklyStats',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('week_start', models.DateField()),
+                ('sessions', models.PositiveIntegerField(default=0)),
+                ('completed', models.PositiveIntegerField(default=0)),
+                ('cancelled', models.PositiveIntegerField(default=0)),
+                ('booked_minutes', models.PositiveIntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('expert', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='weekly_stats', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'verbose_name': 'Haftalık Uzman Özeti',
+                'verbose_name_plural': 'Haftalık Uzman Özetleri',
+                'ordering': ['expert', 'week_start'],
+                'constraints': [models.UniqueConstraint(fields=('expert', 'week_start'), name='unique_expert_week_stats')],
+            },
+        ),
+        migrations.RunPython(backfill_weekly_stats, migrations.RunPython.noop),
+    ]
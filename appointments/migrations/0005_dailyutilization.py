@@ -0,0 +1,54 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:38
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0007_expert_rating_index'),
+        ('appointments', '0004_expertweeklystats'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RollupWatermark',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('name', models.CharField(max_length=64, unique=True)),
+                ('changed_until', models.DateTimeField()),
+                ('covered_until', models.DateField(blank=True, null=True)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+            options={
+                'verbose_name': 'Özet İşi Konumu',
+                'verbose_name_plural': 'Özet İşi Konumları',
+            },
+        ),
+        migrations.CreateModel(
+            name='DailyUtilization',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('day', models.DateField()),
+                ('available_minutes', models.PositiveIntegerField(default=0)),
+                ('booked_minutes', models.PositiveIntegerField(default=0)),
+                ('sessions', models.PositiveIntegerField(default=0)),
+                ('completed', models.PositiveIntegerField(default=0)),
+                ('cancelled', models.PositiveIntegerField(default=0)),
+                ('is_stale', models.BooleanField(default=False)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('expert', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='daily_utilization', to=settings.AUTH_USER_MODEL)),
+                ('service', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='daily_utilization', to='accounts.service')),
+            ],
+            options={
+                'verbose_name': 'Günlük Kullanım Özeti',
+                'verbose_name_plural': 'Günlük Kullanım Özetleri',
+                'ordering': ['-day', 'expert', 'service'],
+                'indexes': [models.Index(fields=['day'], name='daily_utilization_day_idx'), models.Index(condition=models.Q(('is_stale', True)), fields=['is_stale'], name='daily_utilization_stale_idx')],
+                'constraints': [models.UniqueConstraint(condition=models.Q(('service__isnull', False)), fields=('expert', 'service', 'day'), name='unique_expert_service_day_utilization'), models.UniqueConstraint(condition=models.Q(('service__isnull', True)), fields=('expert', 'day'), name='unique_expert_day_utilization')],
+            },
+        ),
+    ]
@@ -1,4 +1,5 @@
 from django.db import models
+from django.core.validators import MaxValueValidator, MinValueValidator
 from django.contrib.auth import get_user_model
 
 User = get_user_model()
@@ -40,6 +41,171 @@ class Appointment(models.Model):
     class Meta:
         app_label = 'appointments'
         ordering = ['-created_at']
+        indexes = [
+            # Uzman panelindeki danışan listesi alt sorguları (accounts/roster.py)
+            models.Index(fields=['client', 'expert', 'date', 'time'], name='appointment_roster_idx'),
+        ]
     
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Tarih/uzman değişince eski haftanın ve günün özeti de yenilenir (signals.py)
+        instance._loaded_week_key = (
+            (instance.expert_id, instance.date)
+            if 'expert_id' in field_names and 'date' in field_names else None
+        )
+        return instance
+
+    def __str__(self):
+        return f"{self.expert.get_full_name()} - {self.client.get_full_name()} ({self.date})"
+
+class SessionReview(models.Model):
+    """
+    Danışanın tamamlanmış bir seans için verdiği puan ve yorum.
+    Uzmanın ExpertProfile.rating_average / rating_count alanları her kayıt,
+    puan değişikliği ve silmede artımlı olarak güncellenir (bkz. appointments/reviews.py).
+    """
+    appointment = models.OneToOneField(Appointment, on_delete=models.CASCADE, related_name="review")
+    # Gruplamalar için randevudan kopyalanır
+    expert = models.ForeignKey(User, on_delete=models.CASCADE, related_name="reviews_received")
+    client = models.ForeignKey(User, on_delete=models.CASCADE, related_name="reviews_given")
+
+    rating = models.PositiveSmallIntegerField(validators=[MinValueValidator(1), MaxValueValidator(5)])
+    comment = models.TextField(blank=True, default="")
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = 'appointments'
+        ordering = ['-created_at']
+        verbose_name = "Seans Değerlendirmesi"
+        verbose_name_plural = "Seans Değerlendirmeleri"
+        indexes = [
+            models.Index(fields=['expert', '-created_at'], name='review_expert_created_idx'),
+        ]
+        constraints = [
+            models.CheckConstraint(condition=models.Q(rating__gte=1, rating__lte=5), name='review_rating_range'),
+        ]
+
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Puan değişikliğinde eski değer gerekir (signals.py)
+        instance._loaded_rating = instance.rating if 'rating' in field_names else None
+        return instance
+
+    def __str__(self):
+        return f"{self.appointment} - {self.rating}/5"
+
+
+
+class ExpertWeeklyStats(models.Model):
+    """
+    Uzman başına haftalık randevu özeti (uzman paneli).
+    Randevu kaydedildiğinde/silindiğinde ilgili hafta satırı tek bir gruplu
+    sorguyla yeniden hesaplanır (bkz. appointments/dashboard.py).
+    """
+    expert = models.ForeignKey(User, on_delete=models.CASCADE, related_name="weekly_stats")
+    # Haftanın pazartesi günü
+    week_start = models.DateField()
+
+    # İptal edilmemiş randevular (tamamlananlar dahil)
+    sessions = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    cancelled = models.PositiveIntegerField(default=0)
+    # İptal edilmemiş randevuların toplam süresi
+    booked_minutes = models.PositiveIntegerField(default=0)
+
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = 'appointments'
+        ordering = ['expert', 'week_start']
+        verbose_name = "Haftalık Uzman Özeti"
+        verbose_name_plural = "Haftalık Uzman Özetleri"
+        constraints = [
+            models.UniqueConstraint(fields=['expert', 'week_start'], name='unique_expert_week_stats'),
+        ]
+
+    def __str__(self):
+        return f"{self.expert_id} - {self.week_start}"
+
+
+class DailyUtilization(models.Model):
+    """
+    Uzman ve hizmet başına günlük kapasite/talep özeti (admin grafikleri).
+    Değişen günler refresh_daily_utilization komutuyla artımlı olarak yeniden
+    hesaplanır (bkz. appointments/utilization.py). service boş satır, herhangi
+    bir hizmete bağlı olmayan müsaitlik ve randevuları tutar; işlenen her
+    (uzman, gün) için bu satır sıfır değerlerle de olsa yazılır.
+    """
+    expert = models.ForeignKey(User, on_delete=models.CASCADE, related_name="daily_utilization")
+    service = models.ForeignKey(
+        'accounts.Service', null=True, blank=True, on_delete=models.CASCADE, related_name="daily_utilization"
+    )
+    day = models.DateField()
+
+    # Haftalık program + istisnalar, kapasiteyle çarpılmış
+    available_minutes = models.PositiveIntegerField(default=0)
+    # İptal edilmemiş randevuların toplam süresi
+    booked_minutes = models.PositiveIntegerField(default=0)
+    # İptal edilmemiş randevular (tamamlananlar dahil)
+    sessions = models.PositiveIntegerField(default=0)
+    completed = models.PositiveIntegerField(default=0)
+    cancelled = models.PositiveIntegerField(default=0)
+
+    # Randevu taşındığında/silindiğinde eski günün satırı işaretlenir (signals.py)
+    is_stale = models.BooleanField(default=False)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = 'appointments'
+        ordering = ['-day', 'expert', 'service']
+        verbose_name = "Günlük Kullanım Özeti"
+        verbose_name_plural = "Günlük Kullanım Özetleri"
+        indexes = [
+            models.Index(fields=['day'], name='daily_utilization_day_idx'),
+            models.Index(fields=['is_stale'], condition=models.Q(is_stale=True), name='daily_utilization_stale_idx'),
+        ]
+        constraints = [
+            models.UniqueConstraint(
+                fields=['expert', 'service', 'day'], condition=models.Q(service__isnull=False),
+                name='unique_expert_service_day_utilization',
+            ),
+            models.UniqueConstraint(
+                fields=['expert', 'day'], condition=models.Q(service__isnull=True),
+                name='unique_expert_day_utilization',
+            ),
+        ]
+
+    @property
+    def utilization(self):
+        return round(self.booked_minutes / self.available_minutes, 4) if self.available_minutes else None
+
+    @property
+    def completion_rate(self):
+        return round(self.completed / self.sessions, 4) if self.sessions else None
+
+    def __str__(self):
+        return f"{self.expert_id} - {self.service_id or '-'} - {self.day}"
+
+
+class RollupWatermark(models.Model):
+    """
+    Artımlı özet işlerinin kaldığı yer: changed_until'den sonra güncellenen
+    (updated_at) kayıtlar bir sonraki çalıştırmada işlenir; covered_until
+    müsaitliklerin önceden hesaplandığı son gündür.
+    """
+    name = models.CharField(max_length=64, unique=True)
+    changed_until = models.DateTimeField()
+    covered_until = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        app_label = 'appointments'
+        verbose_name = "Özet İşi Konumu"
+        verbose_name_plural = "Özet İşi Konumları"
+
     def __str__(self):
-        return f"{self.expert.get_full_name()} - {self.client.get_full_name()} ({self.date})"
\ No newline at end of file
+        return f"{self.name}: {self.changed_until:%Y-%m-%d %H:%M:%S}"
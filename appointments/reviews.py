@@ -0,0 +1,115 @@
+"""
+Uzman puan ortalamalarının (ExpertProfile.rating_average / rating_count)
+artımlı güncellenmesi.
+
+Her değerlendirme eklendiğinde, puanı değiştiğinde veya silindiğinde uzmanın
+satırı tek bir UPDATE ile F() ifadeleriyle güncellenir; ortalama için tüm
+değerlendirmeler yeniden okunmaz ve eşzamanlı istekler birbirinin yazdığını
+ezmez. SQL'de SET ifadelerinin sağ tarafı satırın eski değerlerini gördüğü
+için (PostgreSQL, SQLite) ortalama ve sayı aynı ifadede tutarlı hesaplanır.
+
+Kayan nokta yuvarlamasından doğabilecek sapmalar veya toplu/elle yapılan
+değişiklikler reconcile_expert_ratings komutuyla düzeltilir.
+
+QuerySet.update() sinyal üretmediği için kullanıcı/profil cache'leri ve uzman
+arama indeksi burada ayrıca geçersiz kılınır.
+"""
+from django.db import transaction
+from django.db.models import (Avg, Case, Count, F, FloatField, IntegerField, OuterRef, Subquery, Value,
+                              When)
+from django.db.models.functions import Cast, Coalesce
+from django.utils import timezone
+
+from accounts import expert_search
+from accounts.models import ExpertProfile
+from accounts.profile_cache import invalidate_profile
+from accounts.user_cache import invalidate_user
+
+from .models import SessionReview
+
+# Ortalamadaki bu kadar sapma yuvarlama kabul edilir
+RATING_TOLERANCE = 1e-6
+
+
+def _as_float(expression):
+    return Cast(expression, output_field=FloatField())
+
+
+def apply_rating_change(expert_user_id, added=None, removed=None):
+    """
+    Uzmanın puan ortalamasını artımlı günceller.
+    added: eklenen puan, removed: çıkarılan puan; puan değişikliğinde ikisi birden.
+    """
+    if added is None and removed is None:
+        return
+    if added is not None and removed is not None:
+        # Sayı değişmez, ortalama farkın sayıya bölümü kadar kayar
+        values = {
+            'rating_average': F('rating_average') + _as_float(Value(added - removed)) / F('rating_count'),
+        }
+        experts = ExpertProfile.objects.filter(user_id=expert_user_id, rating_count__gt=0)
+    elif added is not None:
+        values = {
+            'rating_average': (F('rating_average') * F('rating_count') + added) / _as_float(F('rating_count') + 1),
+            'rating_count': F('rating_count') + 1,
+        }
+        experts = ExpertProfile.objects.filter(user_id=expert_user_id)
+    else:
+        values = {
+            'rating_average': Case(
+                When(rating_count__lte=1, then=Value(0.0)),
+                default=(F('rating_average') * F('rating_count') - removed) / _as_float(F('rating_count') - 1),
+                output_field=FloatField(),
+            ),
+            'rating_count': Case(
+                When(rating_count__lte=1, then=Value(0)),
+                default=F('rating_count') - 1,
+                output_field=IntegerField(),
+            ),
+        }
+        experts = ExpertProfile.objects.filter(user_id=expert_user_id)
+
+    # update() auto_now alanını doldurmaz; koşullu GET doğrulayıcıları updated_at okur
+    if experts.update(updated_at=timezone.now(), **values):
+        ratings_changed(expert_user_id)
+
+
+def ratings_changed(*expert_user_ids):
+    """Puanları sinyalsiz güncellenen uzmanlar için cache'leri düşürür."""
+    for user_id in expert_user_ids:
+        invalidate_user(user_id)
+    invalidate_profile(*expert_user_ids)
+    transaction.on_commit(expert_search.bump_version)
+
+
+def reconcile_ratings(dry_run=False):
+    """
+    Değerlendirmelerden uzman başına ortalama/sayıyı tek gruplu sorguyla
+    hesaplar, kayıtlı değerlerden sapan uzmanları düzeltir.
+    Düzeltilen (veya dry_run'da düzeltilecek) uzmanların user id'lerini döner.
+    """
+    expected = {
+        row['expert_id']: (row['average'], row['total'])
+        for row in SessionReview.objects.order_by().values('expert_id').annotate(
+            average=Avg('rating'), total=Count('id'),
+        )
+    }
+    drifted = [
+        user_id
+        for user_id, average, count in ExpertProfile.objects.values_list('user_id', 'rating_average', 'rating_count')
+        if count != expected.get(user_id, (0.0, 0))[1]
+        or abs(average - expected.get(user_id, (0.0, 0))[0]) > RATING_TOLERANCE
+    ]
+    if not drifted or dry_run:
+        return drifted
+
+    # Değerler UPDATE içinde yeniden hesaplanır; okuma ile yazma arasında gelen
+    # artımlı güncellemeler ezilmez
+    reviews = SessionReview.objects.filter(expert_id=OuterRef('user_id')).order_by().values('expert_id')
+    ExpertProfile.objects.filter(user_id__in=drifted).update(
+        rating_average=Coalesce(Subquery(reviews.annotate(value=Avg('rating')).values('value')), Value(0.0)),
+        rating_count=Coalesce(Subquery(reviews.annotate(value=Count('id')).values('value')), Value(0)),
+        updated_at=timezone.now(),
+    )
+    ratings_changed(*drifted)
+    return drifted
@@ -1,5 +1,5 @@
 from rest_framework import serializers
-from .models import Appointment
+from .models import Appointment, SessionReview
 from zoom.services import create_zoom_meeting
 from datetime import datetime
 from django.conf import settings
@@ -305,4 +305,15 @@ class ExpertAppointmentSummarySerializer(serializers.ModelSerializer):
         # Bitiş datetime
         end_datetime = start_datetime + timedelta(minutes=total_minutes)
 
-        return end_datetime.time()
\ No newline at end of file
+        return end_datetime.time()
+
+
+class SessionReviewSerializer(serializers.ModelSerializer):
+    """
+    Tamamlanmış randevu için danışan değerlendirmesi.
+    Randevu, uzman ve danışan view tarafından atanır.
+    """
+    class Meta:
+        model = SessionReview
+        fields = ['id', 'appointment', 'expert', 'client', 'rating', 'comment', 'created_at', 'updated_at']
+        read_only_fields = ['appointment', 'expert', 'client', 'created_at', 'updated_at']
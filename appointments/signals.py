@@ -0,0 +1,61 @@
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from django.utils import timezone
+
+from availability.models import AvailabilityException, WeeklyAvailability
+
+from .dashboard import refresh_weeks
+from .models import Appointment, DailyUtilization, SessionReview
+from .reviews import apply_rating_change
+from .utilization import mark_stale
+
+
+@receiver(post_save, sender=SessionReview)
+def review_saved(sender, instance, created, **kwargs):
+    if created:
+        apply_rating_change(instance.expert_id, added=instance.rating)
+    else:
+        previous = getattr(instance, '_loaded_rating', None)
+        if previous is not None and previous != instance.rating:
+            apply_rating_change(instance.expert_id, added=instance.rating, removed=previous)
+    instance._loaded_rating = instance.rating
+
+
+@receiver(post_delete, sender=SessionReview)
+def review_deleted(sender, instance, **kwargs):
+    apply_rating_change(instance.expert_id, removed=getattr(instance, '_loaded_rating', None) or instance.rating)
+
+
+@receiver(post_save, sender=Appointment)
+@receiver(post_delete, sender=Appointment)
+def appointment_weekly_stats_changed(sender, instance, **kwargs):
+    current = (instance.expert_id, instance.date)
+    keys = {current}
+    previous = getattr(instance, '_loaded_week_key', None)
+    if previous:
+        keys.add(previous)
+    # Commit sonrası: cascade silmelerde uzman satırı da silinmiş olabilir
+    transaction.on_commit(lambda: refresh_weeks(keys))
+    # Günlük özet yeni günü updated_at ile bulur; taşınan randevunun eski günü
+    # ve silinen randevunun günü işaretlenir
+    mark_stale(keys if kwargs['signal'] is post_delete else keys - {current})
+    instance._loaded_week_key = current
+
+
+@receiver(post_delete, sender=AvailabilityException)
+def availability_exception_deleted(sender, instance, **kwargs):
+    rows = DailyUtilization.objects.filter(expert__expertprofile=instance.expert_id)
+    if instance.is_recurring:
+        rows = rows.filter(day__month=instance.date.month, day__day=instance.date.day)
+    else:
+        rows = rows.filter(day=instance.date)
+    rows.update(is_stale=True)
+
+
+@receiver(post_delete, sender=WeeklyAvailability)
+def weekly_availability_deleted(sender, instance, **kwargs):
+    # Geçmiş günlerin kapasitesi değişmez
+    DailyUtilization.objects.filter(
+        expert__expertprofile=instance.expert_id, day__gte=timezone.localdate(),
+    ).update(is_stale=True)
@@ -0,0 +1,115 @@
+from datetime import date, time, timedelta
+
+from django.test import TestCase
+
+from accounts.models import ClientProfile, ExpertProfile, User
+from appointments.dashboard import rebuild_weekly_stats, week_start
+from appointments.models import Appointment, ExpertWeeklyStats
+
+# Pazartesi; iki randevu haftası birbirinden ayrı
+MONDAY = date(2026, 3, 2)
+NEXT_WEEK = MONDAY + timedelta(weeks=1)
+
+
+class WeeklyStatsTestCase(TestCase):
+    def setUp(self):
+        self.expert = User.objects.create_user(
+            email='expert@test.com', username='expert', password='testpass123', role='expert',
+        )
+        profile = ExpertProfile.objects.create(user=self.expert, approval_status=True)
+        self.client_user = User.objects.create_user(
+            email='client@test.com', username='client', password='testpass123', role='client',
+        )
+        ClientProfile.objects.create(user=self.client_user, expert=profile)
+
+    def book(self, day, status='confirmed', duration=45, hour=10):
+        with self.captureOnCommitCallbacks(execute=True):
+            return Appointment.objects.create(
+                expert=self.expert, client=self.client_user, date=day, time=time(hour),
+                duration=duration, status=status,
+            )
+
+    def week(self, day):
+        stats = ExpertWeeklyStats.objects.get(expert=self.expert, week_start=week_start(day))
+        return stats.sessions, stats.completed, stats.cancelled, stats.booked_minutes
+
+    def assert_matches_rebuild(self):
+        current = sorted(
+            # Randevusu kalmayan haftalar sıfır satır olarak kalır; rebuild bunları üretmez
+            ExpertWeeklyStats.objects.exclude(sessions=0, cancelled=0)
+            .values_list('expert_id', 'week_start', 'sessions', 'completed', 'cancelled', 'booked_minutes')
+        )
+        rebuild_weekly_stats()
+        rebuilt = sorted(
+            ExpertWeeklyStats.objects.values_list(
+                'expert_id', 'week_start', 'sessions', 'completed', 'cancelled', 'booked_minutes',
+            )
+        )
+        self.assertEqual(current, rebuilt)
+
+
+class WeeklyStatsTests(WeeklyStatsTestCase):
+    def test_create_counts_week(self):
+        self.book(MONDAY + timedelta(days=2))
+        self.book(MONDAY + timedelta(days=3), status='cancelled', duration=30)
+        self.assertEqual(self.week(MONDAY), (1, 0, 1, 45))
+        self.assert_matches_rebuild()
+
+    def test_move_to_another_week_refreshes_both(self):
+        appointment = self.book(MONDAY + timedelta(days=1))
+        with self.captureOnCommitCallbacks(execute=True):
+            appointment.date = NEXT_WEEK + timedelta(days=4)
+            appointment.save()
+        self.assertEqual(self.week(MONDAY), (0, 0, 0, 0))
+        self.assertEqual(self.week(NEXT_WEEK), (1, 0, 0, 45))
+        self.assert_matches_rebuild()
+
+    def test_status_change_within_week(self):
+        appointment = self.book(MONDAY)
+        with self.captureOnCommitCallbacks(execute=True):
+            appointment.status = 'completed'
+            appointment.save()
+        self.assertEqual(self.week(MONDAY), (1, 1, 0, 45))
+
+    def test_delete_resets_week(self):
+        appointment = self.book(MONDAY)
+        self.book(MONDAY + timedelta(days=1), duration=60)
+        with self.captureOnCommitCallbacks(execute=True):
+            appointment.delete()
+        self.assertEqual(self.week(MONDAY), (1, 0, 0, 60))
+        self.assert_matches_rebuild()
+
+    def test_expert_delete_leaves_no_rows(self):
+        self.book(MONDAY)
+        with self.captureOnCommitCallbacks(execute=True):
+            self.expert.delete()
+        self.assertFalse(ExpertWeeklyStats.objects.exists())
+
+
+class WeeklyStatsAdminActionTests(WeeklyStatsTestCase):
+    def setUp(self):
+        super().setUp()
+        admin = User.objects.create_superuser(email='admin@test.com', username='admin', password='testpass123')
+        self.client.force_login(admin)
+
+    def run_action(self, action, appointments):
+        response = self.client.post('/admin/appointments/appointment/', {
+            'action': action,
+            '_selected_action': [appointment.pk for appointment in appointments],
+        })
+        self.assertEqual(response.status_code, 302)
+
+    def test_bulk_actions_refresh_weeks(self):
+        first = self.book(MONDAY, status='waiting_approval')
+        second = self.book(NEXT_WEEK, status='waiting_approval', duration=60)
+
+        self.run_action('mark_as_confirmed', [first, second])
+        self.run_action('mark_as_completed', [first])
+        self.assertEqual(self.week(MONDAY), (1, 1, 0, 45))
+
+        self.run_action('mark_as_cancelled', [second])
+        self.assertEqual(self.week(NEXT_WEEK), (0, 0, 1, 0))
+
+        self.run_action('soft_delete', [first])
+        self.assertEqual(self.week(MONDAY), (0, 0, 0, 0))
+        self.assert_matches_rebuild()
@@ -6,6 +6,8 @@ from .views import (
     AppointmentDetailView,
     get_zoom_meeting_info,
     ExpertAppointmentsForClientView,
+    AppointmentReviewView,
+    ExpertDashboardView,
 )
 
 app_name = 'appointments'
@@ -14,6 +16,9 @@ urlpatterns = [
     # Listeleme
     path('', AppointmentListView.as_view(), name='appointment_list'),
     
+    # Uzman paneli özeti
+    path('dashboard/', ExpertDashboardView.as_view(), name='expert_dashboard'),
+
     # Randevu oluşturma (ayrı endpoint'ler)
     path('expert/create/', ExpertAppointmentCreateView.as_view(), name='expert_appointment_create'),
     path('client/request/', ClientAppointmentRequestView.as_view(), name='client_appointment_request'),
@@ -22,6 +27,7 @@ urlpatterns = [
     path('<int:pk>/', AppointmentDetailView.as_view(), name='appointment_detail'),
     path('<int:pk>/status/', AppointmentDetailView.as_view(), name='appointment_status_update'),
     path('<int:appointment_id>/meeting-info/', get_zoom_meeting_info, name='meeting_info'),
+    path('<int:pk>/review/', AppointmentReviewView.as_view(), name='appointment_review'),
 
     # Expert appointments for clients
     path('experts/<int:expert_id>/appointments/', ExpertAppointmentsForClientView.as_view(), name='expert_appointments'),
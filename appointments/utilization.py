@@ -0,0 +1,289 @@
+"""
+Admin için uzman ve hizmet başına günlük kapasite/talep özeti (DailyUtilization).
+
+refresh_daily_utilization artımlı ve tekrar çalıştırılabilir bir iştir; son
+çalıştırmadan beri değişen günleri updated_at su seviyesiyle (RollupWatermark)
+bulur:
+- updated_at'i değişen randevuların (uzman, gün) ikilileri
+- değişen müsaitlik istisnalarının günleri
+- haftalık programı değişen uzmanların bugünden sonraki günleri (geçmiş
+  günlerin kapasitesi o günkü programla yazılmış olarak kalır)
+- ufka (UTILIZATION_DAYS_AHEAD) yeni giren günler
+- sinyallerle eskimiş işaretlenen satırlar (taşınan/silinen randevu, silinen
+  istisna veya haftalık aralık; bkz. signals.py)
+Bu günler birkaç toplu sorguyla okunan veriden yeniden hesaplanır ve
+satırları DELETE + bulk_create ile değiştirilir; aynı gün iki kez işlense de
+sonuç değişmez. Admin grafikleri Appointment yerine bu tabloyu okur.
+
+Randevularda hizmet alanı olmadığından randevu, saatini kapsayan haftalık
+müsaitlik aralığının (yoksa ekstra istisnanın) hizmetine yazılır.
+
+QuerySet.update() updated_at'i doldurmaz; randevuları toplu güncelleyenler
+updated_at=timezone.now() vermelidir (bkz. admin.py).
+"""
+from collections import defaultdict
+from datetime import timedelta
+from functools import reduce
+from operator import or_
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q, Sum
+from django.utils import timezone
+
+from availability.models import AvailabilityException, WeeklyAvailability
+
+from .dashboard import CANCELLED_STATUSES
+from .models import Appointment, DailyUtilization, RollupWatermark, User
+
+WATERMARK = 'daily_utilization'
+# Okuma ile commit arasındaki yarışta kaçan kayıtlar bir sonraki çalıştırmada yakalanır
+WATERMARK_OVERLAP = timedelta(minutes=5)
+# Bir seferde yeniden hesaplanan (uzman, gün) sayısı
+BATCH_SIZE = 500
+
+COUNTERS = ('available_minutes', 'booked_minutes', 'sessions', 'completed', 'cancelled')
+
+
+def _minutes(value):
+    return value.hour * 60 + value.minute
+
+
+def _days(first, last):
+    return [first + timedelta(days=offset) for offset in range((last - first).days + 1)]
+
+
+def _subtract(start, end, cuts):
+    """[start, end) aralığından cuts aralıkları çıkarıldıktan sonra kalan dakika."""
+    remaining = [(start, end)]
+    for cut_start, cut_end in cuts:
+        pieces = []
+        for piece_start, piece_end in remaining:
+            if cut_end <= piece_start or cut_start >= piece_end:
+                pieces.append((piece_start, piece_end))
+                continue
+            if piece_start < cut_start:
+                pieces.append((piece_start, cut_start))
+            if cut_end < piece_end:
+                pieces.append((cut_end, piece_end))
+        remaining = pieces
+    return sum(piece_end - piece_start for piece_start, piece_end in remaining)
+
+
+def _applies(exception, day):
+    if exception['is_recurring']:
+        return (exception['date'].month, exception['date'].day) == (day.month, day.day)
+    return exception['date'] == day
+
+
+def _service_for(time, intervals):
+    minute = _minutes(time)
+    for interval in intervals:
+        if _minutes(interval['start_time']) <= minute < _minutes(interval['end_time']):
+            return interval['service_id']
+    return None
+
+
+def _day_rows(expert_id, day, slots, exceptions, appointments):
+    """Tek (uzman, gün) için hizmet başına satırlar; hizmetsiz satır her zaman döner."""
+    totals = defaultdict(lambda: dict.fromkeys(COUNTERS, 0))
+    totals[None]  # işlenen gün sıfır değerlerle de olsa yazılır
+
+    day_exceptions = [exception for exception in exceptions if _applies(exception, day)]
+    cancels = [exception for exception in day_exceptions if exception['exception_type'] == 'cancel']
+    adds = [exception for exception in day_exceptions if exception['exception_type'] == 'add']
+
+    for slot in slots:
+        start, end = _minutes(slot['start_time']), _minutes(slot['end_time'])
+        cuts = [
+            # Saat aralığı belirtilmemiş iptal tüm günü kapatır
+            (_minutes(cancel['start_time']), _minutes(cancel['end_time']))
+            if cancel['start_time'] and cancel['end_time'] else (start, end)
+            for cancel in cancels
+            if cancel['service_id'] in (None, slot['service_id'])
+        ]
+        totals[slot['service_id']]['available_minutes'] += _subtract(start, end, cuts) * slot['capacity']
+    for add in adds:
+        totals[add['service_id']]['available_minutes'] += max(_minutes(add['end_time']) - _minutes(add['start_time']), 0)
+
+    for appointment in appointments:
+        row = totals[_service_for(appointment['time'], [*slots, *adds])]
+        if appointment['status'] in CANCELLED_STATUSES:
+            row['cancelled'] += 1
+            continue
+        row['sessions'] += 1
+        row['booked_minutes'] += max(appointment['duration'], 0)
+        if appointment['status'] == 'completed':
+            row['completed'] += 1
+
+    return [
+        DailyUtilization(expert_id=expert_id, service_id=service_id, day=day, **values)
+        for service_id, values in totals.items()
+    ]
+
+
+def _refresh_batch(pairs):
+    expert_ids = {expert_id for expert_id, _ in pairs}
+    days = [day for _, day in pairs]
+    first, last = min(days), max(days)
+
+    slots = defaultdict(list)
+    for slot in WeeklyAvailability.objects.filter(
+        expert__user_id__in=expert_ids, is_active=True,
+    ).order_by('start_time', 'id').values(
+        'expert__user_id', 'day_of_week', 'start_time', 'end_time', 'service_id', 'capacity',
+    ):
+        slots[(slot['expert__user_id'], slot['day_of_week'])].append(slot)
+
+    exceptions = defaultdict(list)
+    for exception in AvailabilityException.objects.filter(
+        Q(date__range=(first, last)) | Q(is_recurring=True), expert__user_id__in=expert_ids,
+    ).order_by('start_time', 'id').values(
+        'expert__user_id', 'date', 'exception_type', 'start_time', 'end_time', 'service_id', 'is_recurring',
+    ):
+        exceptions[exception['expert__user_id']].append(exception)
+
+    appointments = defaultdict(list)
+    for appointment in Appointment.objects.filter(
+        expert_id__in=expert_ids, date__range=(first, last), is_deleted=False,
+    ).order_by().values('expert_id', 'date', 'time', 'duration', 'status'):
+        appointments[(appointment['expert_id'], appointment['date'])].append(appointment)
+
+    rows = []
+    days_by_expert = defaultdict(list)
+    for expert_id, day in pairs:
+        days_by_expert[expert_id].append(day)
+        rows.extend(_day_rows(
+            expert_id, day,
+            slots.get((expert_id, day.weekday()), []),
+            exceptions.get(expert_id, []),
+            appointments.get((expert_id, day), []),
+        ))
+
+    DailyUtilization.objects.filter(reduce(or_, (
+        Q(expert_id=expert_id, day__in=expert_days) for expert_id, expert_days in days_by_expert.items()
+    ))).delete()
+    DailyUtilization.objects.bulk_create(rows, batch_size=1000)
+
+
+def refresh_days(pairs):
+    """
+    pairs: (uzman user id, gün) ikilileri; satırları yeniden hesaplanıp
+    değiştirilir. İşlenen ikili sayısını döner.
+    """
+    pairs = {(expert_id, day) for expert_id, day in pairs if expert_id and day}
+    # Silinmiş uzmanlar için satır yazılmaz
+    existing = set(User.objects.filter(pk__in={expert_id for expert_id, _ in pairs}).values_list('pk', flat=True))
+    pairs = sorted((expert_id, day) for expert_id, day in pairs if expert_id in existing)
+    with transaction.atomic():
+        for index in range(0, len(pairs), BATCH_SIZE):
+            _refresh_batch(pairs[index:index + BATCH_SIZE])
+    return len(pairs)
+
+
+def mark_stale(keys):
+    """(uzman user id, gün) satırlarını bir sonraki çalıştırmada yeniden hesaplanmak üzere işaretler."""
+    keys = {(expert_id, day) for expert_id, day in keys if expert_id and day}
+    if keys:
+        DailyUtilization.objects.filter(reduce(or_, (
+            Q(expert_id=expert_id, day=day) for expert_id, day in keys
+        ))).update(is_stale=True)
+
+
+def _scheduled_experts():
+    return set(WeeklyAvailability.objects.filter(is_active=True).values_list('expert__user_id', flat=True))
+
+
+def _exception_pairs(exceptions, horizon):
+    pairs = set()
+    for expert_id, day, recurring in exceptions.values_list('expert__user_id', 'date', 'is_recurring'):
+        pairs.add((expert_id, day))
+        if recurring:
+            pairs.update((expert_id, other) for other in horizon if (other.month, other.day) == (day.month, day.day))
+    return pairs
+
+
+def _changed_pairs(watermark, today, horizon_end):
+    since = watermark.changed_until - WATERMARK_OVERLAP
+    horizon = _days(today, horizon_end)
+
+    pairs = set(Appointment.objects.filter(updated_at__gt=since).values_list('expert_id', 'date'))
+    pairs |= _exception_pairs(AvailabilityException.objects.filter(updated_at__gt=since), horizon)
+    rescheduled = set(
+        WeeklyAvailability.objects.filter(updated_at__gt=since).values_list('expert__user_id', flat=True)
+    )
+    pairs.update((expert_id, day) for expert_id in rescheduled for day in horizon)
+
+    # Ufka yeni giren günler
+    covered_until = watermark.covered_until or today - timedelta(days=1)
+    new_days = _days(max(today, covered_until + timedelta(days=1)), horizon_end)
+    if new_days:
+        pairs.update((expert_id, day) for expert_id in _scheduled_experts() for day in new_days)
+
+    pairs.update(DailyUtilization.objects.filter(is_stale=True).values_list('expert_id', 'day'))
+    return pairs
+
+
+def _all_pairs(today, horizon_end):
+    horizon = _days(today, horizon_end)
+    pairs = set(DailyUtilization.objects.values_list('expert_id', 'day'))
+    pairs.update(Appointment.objects.order_by().values_list('expert_id', 'date').distinct())
+    pairs |= _exception_pairs(AvailabilityException.objects.all(), horizon)
+    pairs.update((expert_id, day) for expert_id in _scheduled_experts() for day in horizon)
+    return pairs
+
+
+def refresh_daily_utilization(full=False, dry_run=False, now=None):
+    """
+    Değişen günleri yeniden hesaplar ve su seviyesini ilerletir. Su seviyesi
+    yoksa (ilk çalıştırma) veya full=True ise randevusu, istisnası veya satırı
+    olan tüm günler ve ufuktaki günler işlenir. İşlenen (veya dry_run'da
+    işlenecek) (uzman, gün) sayısını döner.
+    """
+    now = now or timezone.now()
+    today = timezone.localdate(now)
+    horizon_end = today + timedelta(days=settings.UTILIZATION_DAYS_AHEAD)
+
+    with transaction.atomic():
+        # Eşzamanlı iki çalıştırma aynı günleri yazmasın
+        watermark = RollupWatermark.objects.select_for_update().filter(name=WATERMARK).first()
+        if full or watermark is None:
+            pairs = _all_pairs(today, horizon_end)
+        else:
+            pairs = _changed_pairs(watermark, today, horizon_end)
+        if dry_run:
+            return len(pairs)
+
+        processed = refresh_days(pairs)
+        RollupWatermark.objects.update_or_create(
+            name=WATERMARK, defaults={'changed_until': now, 'covered_until': horizon_end},
+        )
+    return processed
+
+
+def _rates(values):
+    available, booked, sessions = values['available_minutes'], values['booked_minutes'], values['sessions']
+    values['utilization'] = round(booked / available, 4) if available else None
+    values['completion_rate'] = round(values['completed'] / sessions, 4) if sessions else None
+    return values
+
+
+def _sums():
+    return {name: Sum(name, default=0) for name in COUNTERS}
+
+
+def utilization_summary(queryset):
+    """Özet satırlarının toplamı ve oranları (tek aggregate sorgusu)."""
+    return _rates(queryset.aggregate(**_sums()))
+
+
+def utilization_series(queryset, days=31):
+    """Grafik için gün başına toplamlar; en son `days` gün, eskiden yeniye."""
+    rows = queryset.order_by().values('day').annotate(**_sums()).order_by('-day')[:days]
+    return [_rates(row) for row in reversed(list(rows))]
+
+
+def utilization_by_service(queryset):
+    """Hizmet başına toplamlar; hizmetsiz satırlar service_name=None ile döner."""
+    rows = queryset.order_by().values('service_id', 'service__name').annotate(**_sums()).order_by('service__name')
+    return [_rates({**row, 'service_name': row.pop('service__name')}) for row in rows]
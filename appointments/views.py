@@ -1,15 +1,18 @@
 from rest_framework import generics, permissions, status
 from rest_framework.decorators import api_view, permission_classes
+from rest_framework.views import APIView
 from rest_framework.response import Response
 from django.shortcuts import get_object_or_404
 from django.conf import settings
-from .models import Appointment
+from .dashboard import expert_dashboard
+from .models import Appointment, ExpertWeeklyStats, SessionReview
 from .serializers import (
     AppointmentSerializer,
     CreateAppointmentWithZoomSerializer,
     ClientCreateAppointmentSerializer,
     AppointmentStatusSerializer,
-    ExpertAppointmentSummarySerializer
+    ExpertAppointmentSummarySerializer,
+    SessionReviewSerializer,
 )
 from .permissions import (
     IsExpertOrClientForCreatePermission,
@@ -17,14 +20,18 @@ from .permissions import (
     IsAppointmentExpertPermission,
     IsAppointmentClientPermission
 )
-from accounts.models import UserRole
+from accounts.models import ClientProfile, ExpertProfile, User, UserRole
+from availability.models import WeeklyAvailability
+from api.conditional import ConditionalGetMixin
 from zoom.services import create_zoom_meeting
 from datetime import datetime
 from django.utils import timezone
+from django.db import IntegrityError, transaction
+from django.db.models import Q
 from dateutil.relativedelta import relativedelta
 
 
-class AppointmentListView(generics.ListAPIView):
+class AppointmentListView(ConditionalGetMixin, generics.ListAPIView):
     """
     Kullanıcı rolüne göre randevuları listele
     Sorgu parametreleri:
@@ -37,6 +44,19 @@ class AppointmentListView(generics.ListAPIView):
     permission_classes = [permissions.IsAuthenticated]
     serializer_class = AppointmentSerializer
 
+    def get_conditional_sources(self, request, *args, **kwargs):
+        # Tarih/durum filtreleri ETag anahtarındaki sorgu parametreleriyle ayrışır
+        appointments = self.get_queryset()
+        # Cevaptaki uzman/danışan adları User satırlarından gelir
+        parties = Q(pk__in=appointments.values('expert_id')) | Q(pk__in=appointments.values('client_id'))
+        users = User.objects.filter(parties)
+        return [
+            appointments,
+            users,
+            ExpertProfile.objects.filter(user__in=users),
+            ClientProfile.objects.filter(user__in=users),
+        ]
+
     def list(self, request, *args, **kwargs):
         user = self.request.user
 
@@ -371,3 +391,123 @@ class ExpertAppointmentsForClientView(generics.ListAPIView):
             'end_date': request.query_params.get('end_date'),
             'appointments': serializer.data
         })
+
+
+class AppointmentReviewView(generics.GenericAPIView):
+    """
+    Randevu değerlendirmesi
+    GET   /appointments/{id}/review/  randevunun uzmanı veya danışanı görür
+    POST  /appointments/{id}/review/  danışan, tamamlanmış randevu için bir kez puan verir
+    PATCH /appointments/{id}/review/  danışan puanını/yorumunu günceller
+    Uzmanın puan ortalaması artımlı olarak güncellenir (appointments/reviews.py).
+    """
+    permission_classes = [IsAppointmentParticipantPermission]
+    serializer_class = SessionReviewSerializer
+
+    def get_appointment(self):
+        appointment = get_object_or_404(
+            Appointment.objects.filter(is_deleted=False).select_related('review'),
+            pk=self.kwargs['pk'],
+        )
+        self.check_object_permissions(self.request, appointment)
+        return appointment
+
+    def get(self, request, *args, **kwargs):
+        appointment = self.get_appointment()
+        review = getattr(appointment, 'review', None)
+        if review is None:
+            return Response({'error': 'Bu randevu için değerlendirme bulunamadı'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(self.get_serializer(review).data)
+
+    def post(self, request, *args, **kwargs):
+        appointment = self.get_appointment()
+        if appointment.client_id != request.user.id:
+            return Response(
+                {'error': 'Değerlendirme sadece randevunun danışanı tarafından yapılabilir'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        if appointment.status != 'completed':
+            return Response(
+                {'error': 'Sadece tamamlanmış randevular değerlendirilebilir'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        if getattr(appointment, 'review', None) is not None:
+            return Response(
+                {'error': 'Bu randevu zaten değerlendirilmiş'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+        try:
+            with transaction.atomic():
+                serializer.save(appointment=appointment, expert_id=appointment.expert_id, client=request.user)
+        except IntegrityError:
+            # Eşzamanlı ikinci istek
+            return Response(
+                {'error': 'Bu randevu zaten değerlendirilmiş'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(serializer.data, status=status.HTTP_201_CREATED)
+
+    def patch(self, request, *args, **kwargs):
+        appointment = self.get_appointment()
+        review = getattr(appointment, 'review', None)
+        if review is None:
+            return Response({'error': 'Bu randevu için değerlendirme bulunamadı'}, status=status.HTTP_404_NOT_FOUND)
+        if review.client_id != request.user.id:
+            return Response(
+                {'error': 'Değerlendirmeyi sadece danışan güncelleyebilir'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+
+        serializer = self.get_serializer(review, data=request.data, partial=True)
+        serializer.is_valid(raise_exception=True)
+        with transaction.atomic():
+            serializer.save()
+        return Response(serializer.data)
+
+
+class ExpertDashboardView(ConditionalGetMixin, APIView):
+    """
+    Uzman paneli özeti
+    GET /appointments/dashboard/?weeks=8
+    - status_counts: duruma göre randevu sayıları
+    - pending_approvals: onay bekleyen talepler (waiting_approval, cancel_requested)
+    - weeks: son N haftanın seans sayıları ve doluluk oranı (en fazla 52)
+    - utilization: dolu dakikalar / haftalık müsaitlikten hesaplanan dakikalar
+    Geçmiş haftalar ExpertWeeklyStats özet tablosundan okunur (appointments/dashboard.py).
+    """
+    permission_classes = [permissions.IsAuthenticated]
+    DEFAULT_WEEKS = 8
+    MAX_WEEKS = 52
+
+    def get_conditional_sources(self, request, *args, **kwargs):
+        if request.user.role != UserRole.EXPERT:
+            return None
+        return [
+            Appointment.objects.filter(expert=request.user),
+            ExpertWeeklyStats.objects.filter(expert=request.user),
+            WeeklyAvailability.objects.filter(expert__user=request.user),
+        ]
+
+    def get_conditional_key(self, request, *args, **kwargs):
+        # Hafta penceresi güne bağlı
+        return f"{super().get_conditional_key(request, *args, **kwargs)}@{timezone.localdate()}"
+
+    def get(self, request):
+        if request.user.role != UserRole.EXPERT:
+            return Response(
+                {'error': 'Bu endpoint sadece uzmanlar içindir'},
+                status=status.HTTP_403_FORBIDDEN
+            )
+        try:
+            weeks = int(request.query_params.get('weeks', self.DEFAULT_WEEKS))
+        except ValueError:
+            weeks = 0
+        if not 1 <= weeks <= self.MAX_WEEKS:
+            return Response(
+                {'error': f'weeks 1 ile {self.MAX_WEEKS} arasında olmalıdır'},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        return Response(expert_dashboard(request.user, weeks=weeks))
@@ -97,6 +97,7 @@ class AvailabilityException(models.Model):
     is_recurring = models.BooleanField(default=False)  # True = her yıl tekrarla
 
     created_at = models.DateTimeField(auto_now_add=True)
+    updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
         verbose_name = "Availability Exception"
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from .models import WeeklyAvailability, AvailabilityException, Service
+from accounts.taxonomies import TaxonomyPrimaryKeyRelatedField
 
 
 class WeeklyAvailabilitySerializer(serializers.ModelSerializer):
@@ -39,8 +40,8 @@ class WeeklyAvailabilityDeleteSerializer(serializers.Serializer):
     )
     start_time = serializers.TimeField(help_text="Başlangıç saati (HH:MM:SS)")
     end_time = serializers.TimeField(help_text="Bitiş saati (HH:MM:SS)")
-    service = serializers.PrimaryKeyRelatedField(
-        queryset=Service.objects.all(), 
+    service = TaxonomyPrimaryKeyRelatedField(
+        Service,
         required=False,
         help_text="Opsiyonel: sadece bu servis için sil"
     )
@@ -13,6 +13,7 @@ from rest_framework.exceptions import ValidationError
 from datetime import datetime, timedelta
 from .models import ExpertProfile
 from django.db import transaction
+from api.conditional import ConditionalGetMixin
 
 
 class WeeklyAvailabilityViewSet(viewsets.GenericViewSet):
@@ -535,12 +536,31 @@ class ExpertAvailabilityView(generics.ListAPIView):
         )
 
 
-class MyAvailabilityView(generics.GenericAPIView):
+class MyAvailabilityView(ConditionalGetMixin, generics.GenericAPIView):
     """
     Current expert's availability calendar (weekly + exceptions)
     """
     permission_classes = [permissions.IsAuthenticated]
 
+    def get_conditional_sources(self, request, *args, **kwargs):
+        user = request.user
+        if hasattr(user, 'expertprofile'):
+            expert_filter = {'expert__user': user}
+        else:
+            expert_user_id = request.query_params.get('expert_user_id', '')
+            if not expert_user_id.isdigit():
+                # Hatalı istek; view kendi hata cevabını üretsin
+                return None
+            expert_filter = {'expert__user_id': int(expert_user_id)}
+        return [
+            WeeklyAvailability.objects.filter(**expert_filter),
+            AvailabilityException.objects.filter(**expert_filter),
+        ]
+
+    def get_conditional_key(self, request, *args, **kwargs):
+        # Tarih verilmezse aralık bugüne göre hesaplanır
+        return f"{super().get_conditional_key(request, *args, **kwargs)}@{datetime.today().date()}"
+
     def get(self, request, *args, **kwargs):
         user = request.user
 
@@ -0,0 +1,42 @@
+"""
+Uzmanın danışan verilerine erişimi için ortak çözümleme katmanı.
+
+Expert view'ları URL'deki client_id'yi hem ClientProfile.id hem de User.id
+olarak kabul eder. Burada danışan tek sorguda çözülür; uzman profili kimlik
+doğrulama sırasında kullanıcıyla birlikte yüklenmiştir (accounts/user_cache.py).
+"""
+from django.db.models import Q
+from rest_framework.exceptions import NotFound, PermissionDenied
+
+from accounts.models import ClientProfile, ExpertProfile
+
+
+def get_request_expert_profile(request):
+    """İsteği yapan uzmanın profili."""
+    try:
+        return request.user.expertprofile
+    except ExpertProfile.DoesNotExist:
+        raise NotFound("No ExpertProfile matches the given query.")
+
+
+def resolve_client_for_expert(request, client_id):
+    """
+    client_id'yi (ClientProfile.id veya User.id) tek sorguda çözer ve
+    uzmanın bu danışana erişim yetkisini kontrol eder.
+    Aynı değer hem bir profil id'si hem de başka bir profilin user_id'si ise
+    profil id eşleşmesi önceliklidir.
+    """
+    expert = get_request_expert_profile(request)
+
+    candidates = list(ClientProfile.objects.filter(Q(id=client_id) | Q(user_id=client_id))[:2])
+    client_profile = next((c for c in candidates if c.id == client_id), None)
+    if client_profile is None and candidates:
+        client_profile = candidates[0]
+    if client_profile is None:
+        raise NotFound("No ClientProfile matches the given query.")
+
+    # Expert kontrolü: eğer client_profile'ın expert'i varsa, mevcut expert ile eşleşmeli
+    if client_profile.expert_id and client_profile.expert_id != expert.id:
+        raise PermissionDenied("Bu danışana erişim yetkiniz yok.")
+
+    return client_profile
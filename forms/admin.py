@@ -1,21 +1,79 @@
-from django.contrib import admin
+import copy
+
+from django.contrib import admin, messages
+from django.core.exceptions import ValidationError
+from django.forms import ModelForm
+from django.forms.models import BaseInlineFormSet
+
+from .flow import publish_form, store_flow, validate_flow
 from .models import Form, Question, QuestionOption, FormResponse, Answer, RiskLevelMapping
 
+# --- AKIŞ DOĞRULAMASI ---
+# Yayındaki formlarda döngü veya geçersiz hedef oluşturan değişiklikler kayıttan
+# önce reddedilir; kayıtlı akış sinyallerle düşürülür ve ilk okumada derlenir.
+
+def _changed_instances(formset):
+    return [
+        form.instance for form in formset.forms
+        if form.has_changed() and form not in formset.deleted_forms
+    ]
+
+class QuestionFlowFormSet(BaseInlineFormSet):
+    """Form sayfasındaki sorular (ve yayına alma) birlikte doğrulanır."""
+    def clean(self):
+        super().clean()
+        if any(self.errors) or not self.instance.is_active:
+            return
+        validate_flow(
+            self.instance,
+            questions=_changed_instances(self),
+            deleted_questions=[form.instance for form in self.deleted_forms],
+        )
+
+class QuestionOptionFlowFormSet(BaseInlineFormSet):
+    """Soru sayfasında soru ve seçenekleri birlikte doğrulanır."""
+    def clean(self):
+        super().clean()
+        question = self.instance
+        if any(self.errors) or question.form_id is None:
+            return
+        if question.form.is_active:
+            validate_flow(question.form, questions=[question], options=_changed_instances(self))
+        if question.pk:
+            # Başka forma taşınan soru eski formun akışından çıkar
+            previous = Form.objects.filter(questions=question.pk).exclude(pk=question.form_id).first()
+            if previous is not None and previous.is_active:
+                validate_flow(previous, deleted_questions=[question])
+
+class QuestionOptionAdminForm(ModelForm):
+    def clean(self):
+        cleaned_data = super().clean()
+        question = cleaned_data.get('question')
+        if question is not None and question.form.is_active:
+            option = copy.copy(self.instance)
+            option.question = question
+            option.next_question = cleaned_data.get('next_question')
+            validate_flow(question.form, options=[option])
+        return cleaned_data
+
 # --- INLINES ---
 
 class QuestionOptionInline(admin.TabularInline):
     """Adminler seçenekleri ve puan değerlerini yönetebilir."""
     model = QuestionOption
+    fk_name = 'question'
+    formset = QuestionOptionFlowFormSet
     extra = 1
     ordering = ['order']
-    fields = ('option_text', 'score_value', 'is_correct', 'order')
+    fields = ('option_text', 'score_value', 'is_correct', 'order', 'next_question')
 
 class QuestionInline(admin.TabularInline):
     """Adminler form altındaki soruları yönetebilir."""
     model = Question
+    formset = QuestionFlowFormSet
     extra = 1
     ordering = ['order']
-    fields = ('question_text', 'question_type', 'order', 'is_required')
+    fields = ('question_text', 'question_type', 'order', 'is_required', 'next_question')
 
 # --- ADMIN CLASSES ---
 
@@ -24,10 +82,27 @@ class FormAdmin(admin.ModelAdmin):
     """
     Adminler form başlıklarını, açıklamalarını ve genel ayarlarını yönetir.
     """
-    list_display = ['title', 'scoring_type', 'stage', 'is_active']
+    list_display = ['title', 'scoring_type', 'stage', 'is_active', 'flow_compiled_at']
     list_filter = ['scoring_type', 'is_active', 'stage']
     search_fields = ['title']
     inlines = [QuestionInline]
+    actions = ['publish_forms']
+
+    @admin.action(description="Soru akışını derle ve yayınla")
+    def publish_forms(self, request, queryset):
+        for form in queryset:
+            try:
+                publish_form(form)
+            except ValidationError as e:
+                self.message_user(request, f"{form.title}: {' '.join(e.messages)}", messages.ERROR)
+            else:
+                self.message_user(request, f"{form.title}: akış derlendi ve yayınlandı.", messages.SUCCESS)
+
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        # Yayına alınan formun akışı (inline'lar kaydedildikten sonra) hemen derlenir
+        if form.instance.is_active and 'is_active' in form.changed_data:
+            store_flow(Form.objects.get(pk=form.instance.pk))
 
 @admin.register(Question)
 class QuestionAdmin(admin.ModelAdmin):
@@ -39,11 +114,25 @@ class QuestionAdmin(admin.ModelAdmin):
     search_fields = ['question_text']
     inlines = [QuestionOptionInline]
 
+    def get_deleted_objects(self, objs, request):
+        deleted_objects, model_count, perms_needed, protected = super().get_deleted_objects(objs, request)
+        # Silinen sorunun yerine sıradaki soru geçer; yayındaki akışta döngü oluşturmamalı
+        by_form = {}
+        for question in objs:
+            by_form.setdefault(question.form_id, []).append(question)
+        for form in Form.objects.filter(pk__in=by_form, is_active=True):
+            try:
+                validate_flow(form, deleted_questions=by_form[form.pk])
+            except ValidationError as e:
+                protected.append(f"{form.title}: {' '.join(e.messages)}")
+        return deleted_objects, model_count, perms_needed, protected
+
 @admin.register(QuestionOption)
 class QuestionOptionAdmin(admin.ModelAdmin):
     """
     Seçenek bazlı CRUD işlemleri yapılabilir.
     """
+    form = QuestionOptionAdminForm
     list_display = ['option_text', 'question', 'score_value', 'order']
     list_filter = ['question__form']
 
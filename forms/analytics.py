@@ -0,0 +1,197 @@
+"""
+Uzman tarafı form analitiği.
+
+Özetler FormAnalyticsSummary tablosunda (form, uzman) başına tutulur:
+- build_summary: veritabanı agregasyonları ile özeti baştan oluşturur
+- record_submission: yeni gönderimi mevcut özete artımlı olarak ekler
+- get_summary: güncel özeti döner, gerekiyorsa yeniden oluşturur
+"""
+import math
+
+from django.db import transaction
+from django.db.models import Count, Sum
+from django.db.models.functions import TruncMonth
+from django.utils import timezone
+
+from accounts.models import ClientProfile
+from .models import Answer, FormAnalyticsSummary, FormResponse
+
+HISTOGRAM_BUCKETS = 10
+
+
+def histogram_width(form):
+    """Puan dağılımı için kova genişliği (max_score yoksa 1 puanlık kovalar)."""
+    if form.max_score and form.max_score > 0:
+        return form.max_score / HISTOGRAM_BUCKETS
+    return 1.0
+
+
+def histogram_bucket(form, score):
+    """Negatif puanlar ilk, max_score'a eşit (veya aşan) puanlar son kovaya düşer."""
+    bucket = max(int(math.floor((score or 0.0) / histogram_width(form))), 0)
+    if form.max_score and form.max_score > 0:
+        bucket = min(bucket, HISTOGRAM_BUCKETS - 1)
+    return str(bucket)
+
+
+def month_key(value):
+    return timezone.localtime(value).strftime('%Y-%m')
+
+
+def expert_responses(form, expert):
+    """Uzmana atanmış danışanların bu form için cevapları."""
+    return FormResponse.objects.filter(form=form, user__clientprofile__expert=expert)
+
+
+def build_summary(form, expert):
+    """Özeti veritabanı agregasyonlarıyla baştan hesaplar ve kaydeder."""
+    responses = expert_responses(form, expert)
+
+    totals = responses.aggregate(count=Count('id'), score_sum=Sum('total_score'))
+
+    risk_counts = {
+        row['risk_level'] or '': row['count']
+        for row in responses.values('risk_level').annotate(count=Count('id'))
+    }
+
+    score_histogram = {}
+    for row in responses.values('total_score').annotate(count=Count('id')):
+        bucket = histogram_bucket(form, row['total_score'])
+        score_histogram[bucket] = score_histogram.get(bucket, 0) + row['count']
+
+    question_stats = {
+        str(row['question_id']): [row['score_sum'] or 0.0, row['count']]
+        for row in Answer.objects.filter(form_response__in=responses)
+        .values('question_id')
+        .annotate(score_sum=Sum('answer_score'), count=Count('id'))
+    }
+
+    monthly_trend = {
+        row['month'].strftime('%Y-%m'): [row['count'], row['score_sum'] or 0.0]
+        for row in responses.annotate(month=TruncMonth('submitted_at'))
+        .values('month')
+        .annotate(count=Count('id'), score_sum=Sum('total_score'))
+        .order_by()
+    }
+
+    summary, _ = FormAnalyticsSummary.objects.update_or_create(
+        form=form,
+        expert=expert,
+        defaults={
+            'response_count': totals['count'],
+            'score_sum': totals['score_sum'] or 0.0,
+            'risk_counts': risk_counts,
+            'score_histogram': score_histogram,
+            'question_stats': question_stats,
+            'monthly_trend': monthly_trend,
+            'is_stale': False,
+        },
+    )
+    return summary
+
+
+def get_summary(form, expert):
+    summary = FormAnalyticsSummary.objects.filter(form=form, expert=expert).first()
+    if summary is None or summary.is_stale:
+        summary = build_summary(form, expert)
+    return summary
+
+
+def record_submission(response):
+    """
+    Yeni gönderilen cevabı danışanın uzmanına ait özete artımlı olarak ekler.
+    Özet henüz yoksa ya da eskimişse dokunulmaz; ilk okumada zaten baştan oluşturulur.
+    """
+    expert_id = (
+        ClientProfile.objects.filter(user_id=response.user_id)
+        .values_list('expert_id', flat=True)
+        .first()
+    )
+    if not expert_id:
+        return
+
+    with transaction.atomic():
+        summary = (
+            FormAnalyticsSummary.objects.select_for_update()
+            .filter(form_id=response.form_id, expert_id=expert_id, is_stale=False)
+            .first()
+        )
+        if summary is None:
+            return
+
+        form = response.form
+        score = response.total_score or 0.0
+
+        summary.response_count += 1
+        summary.score_sum += score
+
+        risk_level = response.risk_level or ''
+        summary.risk_counts[risk_level] = summary.risk_counts.get(risk_level, 0) + 1
+
+        bucket = histogram_bucket(form, score)
+        summary.score_histogram[bucket] = summary.score_histogram.get(bucket, 0) + 1
+
+        for question_id, answer_score in response.answers.values_list('question_id', 'answer_score'):
+            key = str(question_id)
+            score_sum, count = summary.question_stats.get(key, [0.0, 0])
+            summary.question_stats[key] = [score_sum + (answer_score or 0.0), count + 1]
+
+        month = month_key(response.submitted_at)
+        count, score_sum = summary.monthly_trend.get(month, [0, 0.0])
+        summary.monthly_trend[month] = [count + 1, score_sum + score]
+
+        summary.save()
+
+
+def mark_stale(**filters):
+    """Verilen filtreye uyan özetleri bir sonraki okumada yeniden oluşturulmak üzere işaretler."""
+    FormAnalyticsSummary.objects.filter(**filters).update(is_stale=True)
+
+
+def serialize_summary(summary, form):
+    """Özet satırını API cevabına dönüştürür."""
+    count = summary.response_count
+    width = histogram_width(form)
+
+    histogram = [
+        {
+            'min_score': int(bucket) * width,
+            'max_score': (int(bucket) + 1) * width,
+            'count': bucket_count,
+        }
+        for bucket, bucket_count in sorted(summary.score_histogram.items(), key=lambda item: int(item[0]))
+    ]
+
+    questions = []
+    for question in form.questions.all().order_by('order'):
+        score_sum, answer_count = summary.question_stats.get(str(question.id), [0.0, 0])
+        questions.append({
+            'question_id': question.id,
+            'question_text': question.question_text,
+            'order': question.order,
+            'answer_count': answer_count,
+            'mean_score': score_sum / answer_count if answer_count else None,
+        })
+
+    trend = [
+        {
+            'period': period,
+            'count': period_count,
+            'average_score': score_sum / period_count if period_count else None,
+        }
+        for period, (period_count, score_sum) in sorted(summary.monthly_trend.items())
+    ]
+
+    return {
+        'form': {'id': form.id, 'title': form.title, 'max_score': form.max_score},
+        'response_count': count,
+        'average_score': summary.score_sum / count if count else None,
+        'risk_levels': [
+            {'risk_level': level, 'count': level_count}
+            for level, level_count in sorted(summary.risk_counts.items(), key=lambda item: -item[1])
+        ],
+        'score_histogram': histogram,
+        'questions': questions,
+        'trend': trend,
+        'refreshed_at': summary.refreshed_at,
+    }
@@ -5,3 +5,6 @@ class FormsConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'forms'
     verbose_name = 'Forms Management'
+
+    def ready(self):
+        from . import signals  # noqa: F401
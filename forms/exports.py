@@ -0,0 +1,189 @@
+"""
+Form cevaplarının akış (streaming) halinde dışa aktarımı.
+
+Cevaplar id üzerinden keyset chunk'lar halinde okunur; her chunk için cevap
+satırları ve seçilen seçenekler ayrı, düz sorgularla çekilir. Böylece bellek
+kullanımı toplam kayıt sayısından bağımsız olarak sabit kalır.
+
+Desteklenen biçimler:
+- csv:    her cevap (Answer) için bir satır; cevapsız form cevabı için
+          cevap sütunları boş tek satır
+- ndjson: her form cevabı (FormResponse) için cevapları iç içe bir JSON satırı
+- wide:   her form cevabı için bir satır, her soru için bir sütun (form_id zorunlu)
+"""
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+from .models import Answer, FormResponse, Question
+
+EXPORT_FORMATS = ('csv', 'ndjson', 'wide')
+
+CONTENT_TYPES = {
+    'csv': 'text/csv; charset=utf-8',
+    'wide': 'text/csv; charset=utf-8',
+    'ndjson': 'application/x-ndjson',
+}
+
+FILE_EXTENSIONS = {'csv': 'csv', 'wide': 'csv', 'ndjson': 'ndjson'}
+
+RESPONSE_FIELDS = [
+    'response_id', 'form_id', 'form_title', 'user_id', 'user_email',
+    'submitted_at', 'total_score', 'risk_level', 'percentage_score',
+]
+
+ANSWER_FIELDS = [
+    'question_id', 'question_order', 'question_type', 'question_text',
+    'text_answer', 'numeric_answer', 'answer_score',
+    'selected_option_ids', 'selected_options',
+]
+
+OPTION_SEPARATOR = '|'
+
+
+class Echo:
+    """csv.writer için yazılanı geri döndüren sahte dosya nesnesi."""
+
+    def write(self, value):
+        return value
+
+
+def iter_responses(form_id=None, chunk_size=1000):
+    """
+    FormResponse kayıtlarını cevaplarıyla birlikte sözlük olarak üretir.
+    Chunk başına üç sorgu çalışır: cevaplar, yanıt satırları ve seçilen seçenekler.
+    """
+    responses = FormResponse.objects.order_by('id')
+    if form_id is not None:
+        responses = responses.filter(form_id=form_id)
+
+    option_through = Answer.selected_options.through
+    last_id = 0
+    while True:
+        chunk = list(
+            responses.filter(id__gt=last_id).values(
+                'id', 'form_id', 'form__title', 'user_id', 'user__email',
+                'submitted_at', 'total_score', 'risk_level', 'percentage_score',
+            )[:chunk_size]
+        )
+        if not chunk:
+            return
+        last_id = chunk[-1]['id']
+        response_ids = [row['id'] for row in chunk]
+
+        selected = {}
+        for answer_id, option_id, option_text in (
+            option_through.objects.filter(answer__form_response_id__in=response_ids)
+            .order_by('answer_id', 'questionoption__order')
+            .values_list('answer_id', 'questionoption_id', 'questionoption__option_text')
+            .iterator(chunk_size=chunk_size)
+        ):
+            selected.setdefault(answer_id, []).append((option_id, option_text))
+
+        answers = {}
+        for row in (
+            Answer.objects.filter(form_response_id__in=response_ids)
+            .order_by('form_response_id', 'question__order', 'question_id')
+            .values(
+                'id', 'form_response_id', 'question_id', 'question__order',
+                'question__question_type', 'question__question_text',
+                'text_answer', 'numeric_answer', 'answer_score',
+            )
+            .iterator(chunk_size=chunk_size)
+        ):
+            options = selected.get(row['id'], [])
+            answers.setdefault(row['form_response_id'], []).append({
+                'question_id': row['question_id'],
+                'question_order': row['question__order'],
+                'question_type': row['question__question_type'],
+                'question_text': row['question__question_text'],
+                'text_answer': row['text_answer'],
+                'numeric_answer': row['numeric_answer'],
+                'answer_score': row['answer_score'],
+                'selected_option_ids': [option_id for option_id, _ in options],
+                'selected_options': [text for _, text in options],
+            })
+
+        for row in chunk:
+            yield {
+                'response_id': row['id'],
+                'form_id': row['form_id'],
+                'form_title': row['form__title'],
+                'user_id': row['user_id'],
+                'user_email': row['user__email'],
+                'submitted_at': row['submitted_at'],
+                'total_score': row['total_score'],
+                'risk_level': row['risk_level'],
+                'percentage_score': row['percentage_score'],
+                'answers': answers.get(row['id'], []),
+            }
+
+
+def _csv_value(value):
+    if isinstance(value, list):
+        return OPTION_SEPARATOR.join(str(item) for item in value)
+    if value is None:
+        return ''
+    if hasattr(value, 'isoformat'):
+        return value.isoformat()
+    return value
+
+
+def stream_csv(form_id=None, chunk_size=1000):
+    """Her cevap satırı için bir CSV satırı üretir; cevapsız gönderimler boş cevap sütunlarıyla tek satırdır."""
+    writer = csv.writer(Echo())
+    yield writer.writerow(RESPONSE_FIELDS + ANSWER_FIELDS)
+    for response in iter_responses(form_id, chunk_size):
+        base = [_csv_value(response[name]) for name in RESPONSE_FIELDS]
+        if not response['answers']:
+            # Cevapsız gönderim de diğer biçimlerdeki gibi dışa aktarılır
+            yield writer.writerow(base + [''] * len(ANSWER_FIELDS))
+        for answer in response['answers']:
+            yield writer.writerow(base + [_csv_value(answer[name]) for name in ANSWER_FIELDS])
+
+
+def stream_ndjson(form_id=None, chunk_size=1000):
+    """Her form cevabı için bir JSON satırı üretir."""
+    for response in iter_responses(form_id, chunk_size):
+        yield json.dumps(response, cls=DjangoJSONEncoder, ensure_ascii=False) + '\n'
+
+
+def _wide_cell(answer):
+    if answer['selected_options']:
+        return OPTION_SEPARATOR.join(answer['selected_options'])
+    if answer['numeric_answer'] is not None:
+        return answer['numeric_answer']
+    return answer['text_answer']
+
+
+def stream_wide(form_id, chunk_size=1000):
+    """Her form cevabı için bir satır; sorular sütun olarak (pivot)."""
+    questions = list(
+        Question.objects.filter(form_id=form_id).order_by('order', 'id').values_list('id', 'order')
+    )
+    columns = {question_id: index for index, (question_id, _) in enumerate(questions)}
+
+    writer = csv.writer(Echo())
+    yield writer.writerow(
+        RESPONSE_FIELDS + [f'q{order}_{question_id}' for question_id, order in questions]
+    )
+    for response in iter_responses(form_id, chunk_size):
+        cells = [''] * len(questions)
+        for answer in response['answers']:
+            index = columns.get(answer['question_id'])
+            if index is not None:
+                cells[index] = _csv_value(_wide_cell(answer))
+        yield writer.writerow([_csv_value(response[name]) for name in RESPONSE_FIELDS] + cells)
+
+
+def stream_export(export_format, form_id=None, chunk_size=1000):
+    if export_format == 'csv':
+        return stream_csv(form_id, chunk_size)
+    if export_format == 'ndjson':
+        return stream_ndjson(form_id, chunk_size)
+    if export_format == 'wide':
+        if form_id is None:
+            raise ValueError("wide biçimi için form_id zorunludur.")
+        return stream_wide(form_id, chunk_size)
+    raise ValueError(f"Geçersiz biçim: {export_format}")
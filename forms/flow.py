@@ -0,0 +1,265 @@
+"""
+Koşullu soru akışı.
+
+Formun soru grafiği bir komşuluk tablosuna derlenir ve Form.flow_graph
+alanına yazılır:
+- Question.next_question: sorudan sonra gelinecek soru (boşsa sıradaki soru)
+- QuestionOption.next_question: seçenek seçildiğinde dallanılacak soru
+
+Derleme sırasında graf döngülere ve form dışı hedeflere karşı doğrulanır.
+Soru veya seçenek değiştiğinde sinyaller sadece derlenmiş akışı düşürür
+(signals.py); akış yayınlanırken veya ilk okumada (get_flow) yeniden
+derlenir. Yayındaki formlarda geçersiz graf oluşturacak değişiklikler
+kaydedilmeden önce validate_flow ile reddedilir (admin formları, bkz.
+admin.py). Cevap anında sıradaki soru(lar) derlenmiş tablodan sözlük
+aramalarıyla bulunur, veritabanına gidilmez.
+"""
+from dataclasses import dataclass
+
+from django.core.exceptions import ValidationError
+from django.utils import timezone
+
+from .models import Form, Question, QuestionOption
+from .serializers import QuestionOptionSerializer, QuestionSerializer, build_question_options
+
+FLOW_GRAPH_VERSION = 1
+
+# form_id -> (flow_compiled_at, FlowGraph); süreç içi, derleme zamanı değişince yenilenir
+_graph_cache = {}
+
+
+@dataclass
+class FlowGraph:
+    start: int | None
+    next: dict
+    branches: dict
+    questions: dict
+
+    def resolve(self, after=None, option_ids=()):
+        """Verilen sorudan ve seçilen seçeneklerden sonra gelinecek soru id'si."""
+        if after is None:
+            return self.start
+        if after not in self.next:
+            raise KeyError(after)
+        branches = self.branches.get(after)
+        if branches:
+            for option_id in option_ids:
+                target = branches.get(option_id)
+                if target is not None:
+                    return target
+        return self.next[after]
+
+    def walk(self, after=None, option_ids=(), limit=1):
+        """
+        Sıradaki soruyu ve ardından cevaba bağlı olmayan soruları döner.
+        Dallanan bir soruya gelindiğinde durulur; sonrası o sorunun cevabına bağlıdır.
+        """
+        questions = []
+        current = self.resolve(after, option_ids)
+        while current is not None and len(questions) < limit:
+            questions.append(self.questions[current])
+            if self.branches.get(current):
+                break
+            current = self.next[current]
+        return questions, current is None
+
+
+def _find_cycle(edges):
+    """Yönlü grafta döngü varsa döngüdeki düğümleri sırasıyla döner (iteratif DFS)."""
+    WHITE, GREY, BLACK = 0, 1, 2
+    color = dict.fromkeys(edges, WHITE)
+    for root in edges:
+        if color[root] != WHITE:
+            continue
+        path = [root]
+        stack = [iter(edges[root])]
+        color[root] = GREY
+        while stack:
+            node = next(stack[-1], None)
+            if node is None:
+                color[path.pop()] = BLACK
+                stack.pop()
+            elif color[node] == GREY:
+                return path[path.index(node):] + [node]
+            elif color[node] == WHITE:
+                color[node] = GREY
+                path.append(node)
+                stack.append(iter(edges[node]))
+    return None
+
+
+def _build_nodes(questions, options):
+    """
+    questions: sıralı (soru id, next_question id) ikilileri
+    options: (seçenek id, soru id, next_question id) üçlüleri
+    Döngü veya başka forma ait hedef varsa ValidationError fırlatır.
+    """
+    question_ids = {question_id for question_id, _ in questions}
+
+    nodes = {}
+    for index, (question_id, next_id) in enumerate(questions):
+        fallback = questions[index + 1][0] if index + 1 < len(questions) else None
+        nodes[question_id] = {'next': next_id or fallback, 'branches': {}}
+    for option_id, question_id, next_id in options:
+        if next_id is not None:
+            nodes[question_id]['branches'][option_id] = next_id
+
+    edges = {}
+    for question_id, node in nodes.items():
+        targets = [node['next'], *node['branches'].values()]
+        foreign = [target for target in targets if target is not None and target not in question_ids]
+        if foreign:
+            raise ValidationError(
+                f"Soru {question_id} başka bir forma ait soruya yönleniyor: {foreign}"
+            )
+        edges[question_id] = [target for target in dict.fromkeys(targets) if target is not None]
+
+    cycle = _find_cycle(edges)
+    if cycle:
+        raise ValidationError(
+            "Soru akışında döngü var: " + " -> ".join(str(question_id) for question_id in cycle)
+        )
+    return nodes
+
+
+def compile_flow(form):
+    """
+    Formun soru grafiğini derler ve doğrular.
+    Döngü veya başka forma ait hedef varsa ValidationError fırlatır.
+    """
+    questions = list(Question.objects.filter(form=form).order_by('order', 'id'))
+    options = list(
+        QuestionOption.objects.filter(question__form=form).order_by('question_id', 'order', 'id')
+    )
+    nodes = _build_nodes(
+        [(question.id, question.next_question_id) for question in questions],
+        [(option.id, option.question_id, option.next_question_id) for option in options],
+    )
+
+    option_data = {}
+    for option in QuestionOptionSerializer(options, many=True).data:
+        option_data.setdefault(option['question'], []).append(option)
+
+    payloads = {}
+    for question in QuestionSerializer(questions, many=True).data:
+        question['options'] = build_question_options(question, option_data.get(question['id'], []))
+        payloads[str(question['id'])] = question
+
+    return {
+        'version': FLOW_GRAPH_VERSION,
+        'start': questions[0].id if questions else None,
+        'nodes': {
+            str(question_id): {
+                'next': node['next'],
+                'branches': {str(option_id): target for option_id, target in node['branches'].items()},
+            }
+            for question_id, node in nodes.items()
+        },
+        'questions': payloads,
+    }
+
+
+def store_flow(form):
+    """
+    Akışı derleyip forma yazar. save() yerine update() ile, sinyal tetiklemeden;
+    updated_at da ilerletilir, böylece formun ETag'i (FormDetailView) değişir.
+    """
+    form.flow_graph = compile_flow(form)
+    form.flow_compiled_at = form.updated_at = timezone.now()
+    Form.objects.filter(pk=form.pk).update(
+        flow_graph=form.flow_graph, flow_compiled_at=form.flow_compiled_at, updated_at=form.updated_at
+    )
+    return form
+
+
+def publish_form(form):
+    """Akışı derleyip doğrular ve formu yayına alır."""
+    store_flow(form)
+    if not form.is_active:
+        form.is_active = True
+        form.save(update_fields=['is_active', 'updated_at'])
+    return form
+
+
+def invalidate_flow(form_id):
+    """
+    Formun derlenmiş akışını düşürür; yayınlanırken veya ilk okumada derlenir.
+    updated_at da ilerletilir, böylece formun ETag'i (FormDetailView) değişir.
+    """
+    Form.objects.filter(pk=form_id).update(flow_graph=None, flow_compiled_at=None, updated_at=timezone.now())
+    _graph_cache.pop(form_id, None)
+
+
+def validate_flow(form, questions=(), options=(), deleted_questions=()):
+    """
+    Kaydedilmemiş soru/seçenek değişiklikleriyle oluşacak akışı veritabanına
+    yazmadan doğrular; geçersizse ValidationError fırlatır. Verilen satırlar
+    kayıtlı olanların yerine geçer, yeni satırlara geçici (negatif) id verilir.
+    Silinen soruya yönelen bağlantılar boşalır (SET_NULL).
+    """
+    temporary = {}
+
+    def key(obj):
+        return obj.pk or temporary.setdefault(id(obj), -(len(temporary) + 1))
+
+    removed = {question.pk for question in deleted_questions if question.pk}
+    stored_questions = Question.objects.filter(form=form) if form.pk else []
+    rows = {question.pk: question for question in stored_questions}
+    rows.update((key(question), question) for question in questions)
+    rows = sorted(
+        (question for question_key, question in rows.items()
+         if question_key not in removed and question.form_id == form.pk),
+        key=lambda question: (question.order, question.pk is None, question.pk or 0),
+    )
+    question_keys = {key(question) for question in rows}
+
+    stored_options = QuestionOption.objects.filter(question__form=form) if form.pk else []
+    option_rows = {option.pk: option for option in stored_options}
+    option_rows.update((key(option), option) for option in options)
+
+    def target(next_id):
+        return None if next_id in removed else next_id
+
+    def question_key(option):
+        # Yeni sorunun inline seçenekleri soruya nesne olarak bağlıdır
+        return option.question_id or key(option.question)
+
+    _build_nodes(
+        [(key(question), target(question.next_question_id)) for question in rows],
+        [
+            (option_key, question_key(option), target(option.next_question_id))
+            for option_key, option in option_rows.items()
+            if question_key(option) in question_keys
+        ],
+    )
+
+
+def _load(data):
+    return FlowGraph(
+        start=data['start'],
+        next={int(question_id): node['next'] for question_id, node in data['nodes'].items()},
+        branches={
+            int(question_id): {int(option_id): target for option_id, target in node['branches'].items()}
+            for question_id, node in data['nodes'].items()
+            if node['branches']
+        },
+        questions={int(question_id): payload for question_id, payload in data['questions'].items()},
+    )
+
+
+def get_flow(form):
+    """
+    Formun derlenmiş akışını döner. Hiç derlenmemiş, değişiklik sonrası
+    düşürülmüş veya eski sürümde derlenmiş akış burada derlenir; graf
+    geçersizse ValidationError fırlatır.
+    """
+    if form.flow_graph is None or form.flow_graph.get('version') != FLOW_GRAPH_VERSION:
+        store_flow(form)
+
+    cached = _graph_cache.get(form.id)
+    if cached is not None and cached[0] == form.flow_compiled_at:
+        return cached[1]
+
+    graph = _load(form.flow_graph)
+    _graph_cache[form.id] = (form.flow_compiled_at, graph)
+    return graph
@@ -0,0 +1,34 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from forms.exports import EXPORT_FORMATS, stream_export
+from forms.models import Form
+
+
+class Command(BaseCommand):
+    help = "Form cevaplarını CSV, NDJSON veya form başına geniş (wide) CSV olarak dışa aktarır."
+
+    def add_arguments(self, parser):
+        parser.add_argument('--type', choices=EXPORT_FORMATS, default='csv', help='Çıktı biçimi')
+        parser.add_argument('--form', type=int, dest='form_id', help='Sadece bu formun cevapları')
+        parser.add_argument('--output', '-o', help='Çıktı dosyası (varsayılan: stdout)')
+        parser.add_argument('--chunk-size', type=int, default=2000, help='Chunk başına cevap sayısı')
+
+    def handle(self, *args, **options):
+        form_id = options['form_id']
+        if form_id is not None and not Form.objects.filter(id=form_id).exists():
+            raise CommandError(f'Form bulunamadı: {form_id}')
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size pozitif olmalıdır.')
+
+        try:
+            chunks = stream_export(options['type'], form_id, options['chunk_size'])
+        except ValueError as exc:
+            raise CommandError(str(exc))
+
+        if options['output']:
+            with open(options['output'], 'w', encoding='utf-8', newline='') as output:
+                output.writelines(chunks)
+            self.stderr.write(self.style.SUCCESS(f"Dışa aktarım yazıldı: {options['output']}"))
+        else:
+            for chunk in chunks:
+                self.stdout.write(chunk, ending='')
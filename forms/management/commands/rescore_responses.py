@@ -0,0 +1,64 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from forms.models import Form
+from forms.scoring import rescore_form
+
+
+class Command(BaseCommand):
+    help = (
+        "Bir formun (veya tüm formların) kayıtlı cevaplarını güncel seçenek puanları "
+        "ve risk eşiklerine göre toplu olarak yeniden puanlar."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('form_ids', nargs='*', type=int, help="Yeniden puanlanacak form ID'leri")
+        parser.add_argument('--all', action='store_true', help='Tüm formları yeniden puanla')
+        parser.add_argument('--chunk-size', type=int, default=1000, help='Chunk başına cevap sayısı')
+        parser.add_argument('--dry-run', action='store_true', help='Yazmadan sadece farkları raporla')
+        parser.add_argument('--max-diffs', type=int, default=20, help='Gösterilecek en fazla fark satırı')
+
+    def handle(self, *args, **options):
+        if options['all']:
+            forms = Form.objects.all().order_by('id')
+        elif options['form_ids']:
+            forms = Form.objects.filter(id__in=options['form_ids']).order_by('id')
+            missing = set(options['form_ids']) - set(forms.values_list('id', flat=True))
+            if missing:
+                raise CommandError(f"Form bulunamadı: {', '.join(map(str, sorted(missing)))}")
+        else:
+            raise CommandError("Form ID'si verin veya --all kullanın.")
+
+        if options['chunk_size'] < 1:
+            raise CommandError('--chunk-size pozitif olmalıdır.')
+
+        dry_run = options['dry_run']
+        for form in forms:
+            result = rescore_form(
+                form,
+                chunk_size=options['chunk_size'],
+                dry_run=dry_run,
+                max_diffs=options['max_diffs'],
+            )
+
+            prefix = '[dry-run] ' if dry_run else ''
+            self.stdout.write(
+                f"{prefix}#{form.id} {form.title}: "
+                f"{result.responses_changed}/{result.responses_scanned} cevap, "
+                f"{result.answers_changed}/{result.answers_scanned} yanıt satırı değişti "
+                f"({result.elapsed:.2f}s, {result.responses_per_second:.0f} cevap/s, "
+                f"{result.answers_per_second:.0f} yanıt satırı/s)"
+            )
+            for diff in result.diffs:
+                before_score, before_risk, before_pct = diff['before']
+                after_score, after_risk, after_pct = diff['after']
+                self.stdout.write(
+                    f"  response {diff['response_id']}: "
+                    f"puan {before_score} -> {after_score}, "
+                    f"risk '{before_risk}' -> '{after_risk}', "
+                    f"yüzde {before_pct} -> {after_pct}"
+                )
+            if result.responses_changed > len(result.diffs):
+                self.stdout.write(f"  ... ve {result.responses_changed - len(result.diffs)} fark daha")
+
+        if not dry_run:
+            self.stdout.write(self.style.SUCCESS('Yeniden puanlama tamamlandı.'))
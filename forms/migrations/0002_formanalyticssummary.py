@@ -0,0 +1,36 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:57
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('accounts', '0001_initial'),
+        ('forms', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FormAnalyticsSummary',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('response_count', models.PositiveIntegerField(default=0, verbose_name='Cevap Sayısı')),
+                ('score_sum', models.FloatField(default=0.0, verbose_name='Toplam Puan')),
+                ('risk_counts', models.JSONField(blank=True, default=dict, verbose_name='Risk Seviyesi Dağılımı')),
+                ('score_histogram', models.JSONField(blank=True, default=dict, verbose_name='Puan Dağılımı')),
+                ('question_stats', models.JSONField(blank=True, default=dict, verbose_name='Soru İstatistikleri')),
+                ('monthly_trend', models.JSONField(blank=True, default=dict, verbose_name='Aylık Eğilim')),
+                ('is_stale', models.BooleanField(default=False, verbose_name='Yenilenmeli mi?')),
+                ('refreshed_at', models.DateTimeField(auto_now=True, verbose_name='Yenilenme Tarihi')),
+                ('expert', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='form_analytics_summaries', to='accounts.expertprofile', verbose_name='Uzman')),
+                ('form', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='analytics_summaries', to='forms.form', verbose_name='Form')),
+            ],
+            options={
+                'verbose_name': 'Form Analitik Özeti',
+                'verbose_name_plural': 'Form Analitik Özetleri',
+                'unique_together': {('form', 'expert')},
+            },
+        ),
+    ]
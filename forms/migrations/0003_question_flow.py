@@ -0,0 +1,29 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:01
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0002_formanalyticssummary'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='form',
+            name='flow_compiled_at',
+            field=models.DateTimeField(blank=True, editable=False, null=True, verbose_name='Akış Derlenme Tarihi'),
+        ),
+        migrations.AddField(
+            model_name='form',
+            name='flow_graph',
+            field=models.JSONField(blank=True, editable=False, null=True, verbose_name='Soru Akışı'),
+        ),
+        migrations.AddField(
+            model_name='questionoption',
+            name='next_question',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='branch_options', to='forms.question', verbose_name='Dallanılacak Soru'),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:31
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0003_question_flow'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='formresponse',
+            index=models.Index(fields=['user', '-submitted_at'], name='formresponse_user_latest_idx'),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:48
+
+from django.db import migrations
+
+
+def mark_summaries_stale(apps, schema_editor):
+    # max_score'a eşit puanlar eskiden fazladan bir kovaya yazılıyordu; özetler ilk okumada yeniden oluşturulur
+    FormAnalyticsSummary = apps.get_model('forms', 'FormAnalyticsSummary')
+    FormAnalyticsSummary.objects.update(is_stale=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('forms', '0004_formresponse_user_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(mark_summaries_stale, migrations.RunPython.noop),
+    ]
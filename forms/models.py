@@ -27,6 +27,9 @@ class Form(models.Model):
         default='none', 
         verbose_name="Puanlama Tipi"
     )
+    # Yayınlama sırasında derlenen soru akışı (komşuluk tablosu), bkz. forms/flow.py
+    flow_graph = models.JSONField(null=True, blank=True, editable=False, verbose_name="Soru Akışı")
+    flow_compiled_at = models.DateTimeField(null=True, blank=True, editable=False, verbose_name="Akış Derlenme Tarihi")
     
     class Meta:
         verbose_name = "Form"
@@ -113,6 +116,11 @@ class QuestionOption(models.Model):
     # Scoring support for weighted questions
     score_value = models.FloatField(default=0.0, verbose_name="Puan Değeri")
     is_correct = models.BooleanField(default=False, verbose_name="Doğru Cevap mı?")
+    # Seçenek seçildiğinde sorunun next_question'ı yerine bu soruya dallanılır
+    next_question = models.ForeignKey(
+        Question, null=True, blank=True, on_delete=models.SET_NULL,
+        related_name='branch_options', verbose_name="Dallanılacak Soru"
+    )
     
     class Meta:
         verbose_name = "Soru Seçeneği"
@@ -140,6 +148,10 @@ class FormResponse(models.Model):
         verbose_name_plural = "Form Cevapları"
         ordering = ['-submitted_at']
         unique_together = ['form', 'user']  # Bir kullanıcı bir formu sadece bir kez doldurabilir
+        indexes = [
+            # Kullanıcının en son cevabı (accounts/roster.py)
+            models.Index(fields=['user', '-submitted_at'], name='formresponse_user_latest_idx'),
+        ]
     
     def __str__(self):
         return f"{self.user.username} - {self.form.title}"
@@ -216,3 +228,36 @@ class RiskLevelMapping(models.Model):
     
     def __str__(self):
         return f"{self.form_type}: {self.min_score}-{self.max_score} = {self.risk_level}"
+
+
+class FormAnalyticsSummary(models.Model):
+    """
+    Uzman bazlı form analitiği için materyalize özet tablosu.
+    Yeni gönderimlerde artımlı güncellenir; toplu değişikliklerde (yeniden puanlama,
+    danışan ataması vb.) is_stale işaretlenir ve ilk okumada yeniden oluşturulur.
+    """
+    form = models.ForeignKey(Form, on_delete=models.CASCADE, related_name='analytics_summaries', verbose_name="Form")
+    expert = models.ForeignKey(
+        'accounts.ExpertProfile', on_delete=models.CASCADE,
+        related_name='form_analytics_summaries', verbose_name="Uzman"
+    )
+    response_count = models.PositiveIntegerField(default=0, verbose_name="Cevap Sayısı")
+    score_sum = models.FloatField(default=0.0, verbose_name="Toplam Puan")
+    # {"Yüksek Risk": 3, ...}
+    risk_counts = models.JSONField(default=dict, blank=True, verbose_name="Risk Seviyesi Dağılımı")
+    # {"<bucket index>": count}
+    score_histogram = models.JSONField(default=dict, blank=True, verbose_name="Puan Dağılımı")
+    # {"<question id>": [score_sum, answer_count]}
+    question_stats = models.JSONField(default=dict, blank=True, verbose_name="Soru İstatistikleri")
+    # {"YYYY-MM": [response_count, score_sum]}
+    monthly_trend = models.JSONField(default=dict, blank=True, verbose_name="Aylık Eğilim")
+    is_stale = models.BooleanField(default=False, verbose_name="Yenilenmeli mi?")
+    refreshed_at = models.DateTimeField(auto_now=True, verbose_name="Yenilenme Tarihi")
+
+    class Meta:
+        verbose_name = "Form Analitik Özeti"
+        verbose_name_plural = "Form Analitik Özetleri"
+        unique_together = ['form', 'expert']
+
+    def __str__(self):
+        return f"{self.form.title} - {self.expert}"
@@ -0,0 +1,150 @@
+"""
+Form cevaplarının toplu olarak yeniden puanlanması.
+
+Seçenek puanları (score_value) veya risk eşikleri değiştiğinde kayıtlı
+FormResponse.total_score / risk_level / percentage_score değerleri eskir.
+Buradaki yardımcılar bir formun tüm cevaplarını parçalar (chunk) halinde,
+nesne başına save() çağırmadan yeniden hesaplar ve bulk_update ile yazar.
+"""
+import time
+from dataclasses import dataclass, field
+
+from django.db import transaction
+from django.db.models import Sum
+
+from .analytics import mark_stale
+from .models import Answer, FormResponse, Question
+
+CHOICE_QUESTION_TYPES = ('yes_no', 'single_choice', 'multiple_choice')
+
+
+@dataclass
+class RescoreResult:
+    responses_scanned: int = 0
+    answers_scanned: int = 0
+    responses_changed: int = 0
+    answers_changed: int = 0
+    elapsed: float = 0.0
+    diffs: list = field(default_factory=list)
+
+    @property
+    def responses_per_second(self):
+        return self.responses_scanned / self.elapsed if self.elapsed else 0.0
+
+    @property
+    def answers_per_second(self):
+        return self.answers_scanned / self.elapsed if self.elapsed else 0.0
+
+
+def _answer_score(question_type, weight, numeric_answer, option_sum):
+    """Answer.calculate_score ile aynı kurallar, sorgusuz."""
+    if question_type in CHOICE_QUESTION_TYPES:
+        return float(option_sum or 0.0)
+    if question_type == 'scale' and numeric_answer is not None:
+        return numeric_answer
+    if question_type == 'number' and numeric_answer is not None:
+        return numeric_answer * weight
+    return 0.0
+
+
+def rescore_form(form, chunk_size=1000, dry_run=False, max_diffs=50):
+    """
+    Formun tüm cevaplarını yeniden puanlar.
+
+    Her chunk için üç sorgu çalışır: cevap satırları, cevap başına seçilen
+    seçenek puan toplamları (GROUP BY) ve cevapların kendisi. Değişen kayıtlar
+    tek transaction içinde bulk_update ile yazılır. dry_run=True ise hiçbir şey
+    yazılmaz, sadece farklar raporlanır.
+    """
+    started = time.perf_counter()
+    result = RescoreResult()
+
+    questions = {
+        q_id: (q_type, weight)
+        for q_id, q_type, weight in Question.objects.filter(form=form).values_list(
+            'id', 'question_type', 'score_weight'
+        )
+    }
+    option_through = Answer.selected_options.through
+    max_score = form.max_score if form.max_score and form.max_score > 0 else None
+
+    # Aynı toplam puan için risk seviyesi bir kez hesaplanır
+    risk_cache = {}
+
+    def risk_for(score):
+        if score not in risk_cache:
+            risk_cache[score] = form.calculate_risk_level(score) or ''
+        return risk_cache[score]
+
+    last_id = 0
+    while True:
+        # Keyset pagination: OFFSET kullanmadan sıradaki chunk
+        responses = list(
+            FormResponse.objects.filter(form=form, id__gt=last_id)
+            .order_by('id')
+            .only('id', 'total_score', 'risk_level', 'percentage_score')[:chunk_size]
+        )
+        if not responses:
+            break
+        last_id = responses[-1].id
+        response_ids = [r.id for r in responses]
+
+        option_sums = dict(
+            option_through.objects.filter(answer__form_response_id__in=response_ids)
+            .values('answer_id')
+            .annotate(total=Sum('questionoption__score_value'))
+            .values_list('answer_id', 'total')
+        )
+        answers = list(
+            Answer.objects.filter(form_response_id__in=response_ids)
+            .only('id', 'form_response_id', 'question_id', 'numeric_answer', 'answer_score')
+        )
+
+        totals = dict.fromkeys(response_ids, 0.0)
+        changed_answers = []
+        for answer in answers:
+            q_type, weight = questions.get(answer.question_id, (None, 1.0))
+            score = _answer_score(q_type, weight, answer.numeric_answer, option_sums.get(answer.id))
+            totals[answer.form_response_id] += score
+            if answer.answer_score != score:
+                answer.answer_score = score
+                changed_answers.append(answer)
+
+        changed_responses = []
+        for response in responses:
+            total = totals[response.id]
+            risk_level = risk_for(total)
+            percentage = (total / max_score) * 100 if max_score else response.percentage_score
+            current = (response.total_score, response.risk_level, response.percentage_score)
+            if current == (total, risk_level, percentage):
+                continue
+            if len(result.diffs) < max_diffs:
+                result.diffs.append({
+                    'response_id': response.id,
+                    'before': current,
+                    'after': (total, risk_level, percentage),
+                })
+            response.total_score = total
+            response.risk_level = risk_level
+            response.percentage_score = percentage
+            changed_responses.append(response)
+
+        if not dry_run:
+            with transaction.atomic():
+                Answer.objects.bulk_update(changed_answers, ['answer_score'], batch_size=chunk_size)
+                FormResponse.objects.bulk_update(
+                    changed_responses,
+                    ['total_score', 'risk_level', 'percentage_score'],
+                    batch_size=chunk_size,
+                )
+
+        result.responses_scanned += len(responses)
+        result.answers_scanned += len(answers)
+        result.responses_changed += len(changed_responses)
+        result.answers_changed += len(changed_answers)
+
+    if not dry_run and (result.responses_changed or result.answers_changed):
+        mark_stale(form=form)
+
+    result.elapsed = time.perf_counter() - started
+    return result
@@ -51,7 +51,8 @@ class FormListSerializer(serializers.ModelSerializer):
     
     class Meta:
         model = Form
-        fields = '__all__'
+        # Derlenmiş soru akışı listede taşınmaz, bkz. FormFlowView
+        exclude = ['flow_graph']
 
 
 class FormResponseClientDetailSerializer(serializers.ModelSerializer):
@@ -357,3 +358,41 @@ class QuestionOptionSerializer(serializers.ModelSerializer):
     class Meta:
         model = QuestionOption
         fields = '__all__'
+
+
+def build_question_options(question, options):
+    """
+    Soru tipine göre istemciye gönderilecek seçenek listesini oluşturur.
+    question: serileştirilmiş soru, options: serileştirilmiş seçenekleri.
+    """
+    q_type = question.get("question_type")
+
+    if q_type in {"single_choice", "multiple_choice", "test"}:
+        return options
+
+    if q_type == "yes_no":
+        return options or [
+            {"value": 1, "text": "Evet"},
+            {"value": 0, "text": "Hayır"},
+        ]
+
+    if q_type == "scale":
+        return [
+            {
+                "type": "scale",
+                "min": question.get("min_scale_value", 0),
+                "max": question.get("max_scale_value", 4),
+                "step": 1,
+            }
+        ]
+
+    if q_type == "number":
+        return [{"type": "number"}]
+
+    if q_type == "date":
+        return [{"type": "date", "format": "YYYY-MM-DD"}]
+
+    if q_type == "textarea":
+        return [{"type": "textarea"}]
+
+    return [{"type": "text"}]
@@ -0,0 +1,64 @@
+from django.db.models import QuerySet
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from accounts.models import ClientProfile
+from .analytics import mark_stale
+from .flow import invalidate_flow
+from .models import Form, FormResponse, Question, QuestionOption
+
+
+@receiver(post_save, sender=Form)
+def form_saved(sender, instance, **kwargs):
+    # max_score değişirse puan dağılımı kovaları da değişir
+    mark_stale(form=instance)
+
+
+@receiver(post_delete, sender=FormResponse)
+def form_response_deleted(sender, instance, **kwargs):
+    mark_stale(form_id=instance.form_id)
+
+
+@receiver(pre_save, sender=ClientProfile)
+def client_profile_expert_snapshot(sender, instance, **kwargs):
+    instance._previous_expert_id = (
+        ClientProfile.objects.filter(pk=instance.pk).values_list('expert_id', flat=True).first()
+        if instance.pk else None
+    )
+
+
+@receiver(post_save, sender=ClientProfile)
+def client_profile_expert_changed(sender, instance, **kwargs):
+    previous_expert_id = getattr(instance, '_previous_expert_id', None)
+    if previous_expert_id == instance.expert_id:
+        return
+    # Danışan başka bir uzmana geçtiyse iki uzmanın özetleri de eskir
+    expert_ids = [expert_id for expert_id in (previous_expert_id, instance.expert_id) if expert_id]
+    if expert_ids:
+        mark_stale(expert_id__in=expert_ids)
+
+
+def _cascaded_from(origin, *models):
+    """post_delete: satır verilen modellerden birinin (tek kayıt veya queryset) silinmesiyle mi silindi."""
+    model = origin.model if isinstance(origin, QuerySet) else type(origin)
+    return model in models
+
+
+@receiver(post_save, sender=Question)
+@receiver(post_delete, sender=Question)
+def question_changed(sender, instance, origin=None, **kwargs):
+    # Form silinirken cascade ile silinen sorular için akış düşürülmez
+    if _cascaded_from(origin, Form):
+        return
+    invalidate_flow(instance.form_id)
+
+
+@receiver(post_save, sender=QuestionOption)
+@receiver(post_delete, sender=QuestionOption)
+def question_option_changed(sender, instance, origin=None, **kwargs):
+    # Soru veya form silinirken akış bir kez, silinen soru için düşürülür
+    if _cascaded_from(origin, Form, Question):
+        return
+    form_id = Question.objects.filter(pk=instance.question_id).values_list('form_id', flat=True).first()
+    if form_id:
+        invalidate_flow(form_id)
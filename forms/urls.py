@@ -3,10 +3,13 @@ from rest_framework.routers import DefaultRouter
 from .views import (
     FormListView,
     FormDetailView, FormSubmitView,
+    FormFlowView,
     UserResponsesView,
     UserResponseDetailView,
     FormClientResponsesView,
-    FormClientResponseDetailView
+    FormClientResponseDetailView,
+    FormAnalyticsView,
+    FormResponseExportView,
 )
 
 app_name = 'forms'
@@ -15,6 +18,7 @@ urlpatterns = [
     # Client endpoints
     path('', FormListView.as_view(), name='forms_list'),
     path('<int:form_id>/', FormDetailView.as_view(), name='form_detail'),
+    path('<int:form_id>/flow/', FormFlowView.as_view(), name='form_flow'),
     
     path('submit/', FormSubmitView.as_view(), name='submit_form'),
     
@@ -32,4 +36,11 @@ urlpatterns = [
     path('clients/<int:client_id>/form-responses/<int:response_id>/',
          FormClientResponseDetailView.as_view(),
          name='clients_response_detail'),
+
+    # Admin endpoints
+    path('export/', FormResponseExportView.as_view(), name='responses_export'),
+
+    path('<int:form_id>/analytics/',
+         FormAnalyticsView.as_view(),
+         name='form_analytics'),
 ]
@@ -1,11 +1,20 @@
 from rest_framework.views import APIView
-from rest_framework.permissions import IsAuthenticated
+from rest_framework.permissions import IsAuthenticated, IsAdminUser
 from rest_framework.response import Response
 from rest_framework import status
+from django.core.exceptions import ValidationError as DjangoValidationError
+from django.db import transaction
+from django.http import StreamingHttpResponse
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
 
-from accounts.models import UserRole, ClientProfile, ExpertProfile
+from accounts.models import UserRole
+from api.conditional import ConditionalGetMixin
 from .models import Form, FormResponse, Answer, Question, QuestionOption
+from .access import get_request_expert_profile, resolve_client_for_expert
+from .analytics import get_summary, record_submission, serialize_summary
+from .flow import get_flow
+from .exports import CONTENT_TYPES, EXPORT_FORMATS, FILE_EXTENSIONS, stream_export
 from .serializers import (
     FormSerializer,
     FormListSerializer,
@@ -16,6 +25,7 @@ from .serializers import (
     FormResponseExpertSummarySerializer,
     FormResponseClientDetailSerializer,
     FormResponseExpertDetailSerializer,
+    build_question_options,
 )
 
 # --------------------------------------------------
@@ -35,9 +45,16 @@ class FormListView(APIView):
         return Response(serializer.data)
 
 
-class FormDetailView(APIView):
+class FormDetailView(ConditionalGetMixin, APIView):
     permission_classes = [IsAuthenticated]
 
+    def get_conditional_sources(self, request, form_id):
+        # Soru/seçenek değişiklikleri formun updated_at alanını ilerletir (forms/signals.py)
+        return [
+            Form.objects.filter(id=form_id, is_active=True),
+            (FormResponse.objects.filter(form_id=form_id, user=request.user), 'submitted_at'),
+        ]
+
     def get(self, request, form_id):
         form = get_object_or_404(Form, id=form_id, is_active=True)
         has_responded = FormResponse.objects.filter(
@@ -53,41 +70,58 @@ class FormDetailView(APIView):
         for q in q_data:
             options_qs = QuestionOption.objects.filter(question_id=q["id"])
             options = QuestionOptionSerializer(options_qs, many=True).data
-            q_type = q.get("question_type")
+            q["options"] = build_question_options(q, options)
 
-            if q_type in {"single_choice", "multiple_choice", "test"}:
-                q["options"] = options
+        data["questions"] = q_data
+        return Response(data)
 
-            elif q_type == "yes_no":
-                q["options"] = options or [
-                    {"value": 1, "text": "Evet"},
-                    {"value": 0, "text": "Hayır"},
-                ]
+class FormFlowView(APIView):
+    """
+    Soruları akışa göre parça parça döner.
+    ?after=<soru_id>&options=<id,id> verilmezse formun ilk sorusundan başlanır.
+    """
+    permission_classes = [IsAuthenticated]
 
-            elif q_type == "scale":
-                q["options"] = [
-                    {
-                        "type": "scale",
-                        "min": q.get("min_scale_value", 0),
-                        "max": q.get("max_scale_value", 4),
-                        "step": 1,
-                    }
-                ]
+    MAX_LIMIT = 50
 
-            elif q_type == "number":
-                q["options"] = [{"type": "number"}]
+    def get(self, request, form_id):
+        form = get_object_or_404(Form, id=form_id, is_active=True)
 
-            elif q_type == "date":
-                q["options"] = [{"type": "date", "format": "YYYY-MM-DD"}]
+        try:
+            after = request.query_params.get("after")
+            after = int(after) if after else None
+            option_ids = [
+                int(option_id)
+                for option_id in request.query_params.get("options", "").split(",")
+                if option_id.strip()
+            ]
+            limit = min(int(request.query_params.get("limit", 1)), self.MAX_LIMIT)
+        except ValueError:
+            return Response(
+                {"error": "after, options ve limit sayısal olmalıdır."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if limit < 1:
+            return Response({"error": "limit en az 1 olmalıdır."}, status=status.HTTP_400_BAD_REQUEST)
 
-            elif q_type == "textarea":
-                q["options"] = [{"type": "textarea"}]
+        try:
+            graph = get_flow(form)
+        except DjangoValidationError as e:
+            return Response({"error": e.messages}, status=status.HTTP_409_CONFLICT)
 
-            else:
-                q["options"] = [{"type": "text"}]
+        try:
+            questions, is_complete = graph.walk(after, option_ids, limit)
+        except KeyError:
+            return Response(
+                {"error": "Soru bu forma ait değil."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
 
-        data["questions"] = q_data
-        return Response(data)
+        return Response({
+            "form_id": form.id,
+            "questions": questions,
+            "is_complete": is_complete,
+        })
 
 # --------------------------------------------------
 # Client
@@ -109,18 +143,22 @@ class FormSubmitView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        response_obj = FormResponse.objects.create(
-            form_id=form_id, user=request.user
-        )
-
-        for a in answers:
-            answer = Answer.objects.create(
-                form_response=response_obj,
-                question_id=a["question_id"],
-                text_answer=a.get("text_answer", ""),
+        with transaction.atomic():
+            response_obj = FormResponse.objects.create(
+                form_id=form_id, user=request.user
             )
-            if a.get("selected_option_ids"):
-                answer.selected_options.set(a["selected_option_ids"])
+
+            for a in answers:
+                answer = Answer.objects.create(
+                    form_response=response_obj,
+                    question_id=a["question_id"],
+                    text_answer=a.get("text_answer", ""),
+                )
+                if a.get("selected_option_ids"):
+                    answer.selected_options.set(a["selected_option_ids"])
+
+            # Uzmanın analitik özetini artımlı güncelle
+            record_submission(response_obj)
 
         return Response(
             {"response_id": response_obj.id},
@@ -165,32 +203,9 @@ class FormClientResponsesView(APIView):
         if request.user.role != UserRole.EXPERT:
             return Response(status=status.HTTP_403_FORBIDDEN)
 
-        expert = get_object_or_404(ExpertProfile, user=request.user)
-        
-        # client_id hem ClientProfile.id hem de User.id olabilir
-        # Önce ClientProfile.id olarak dene
-        try:
-            client_profile = ClientProfile.objects.get(id=client_id)
-            user_id = client_profile.user_id
-        except ClientProfile.DoesNotExist:
-            # Eğer ClientProfile.id değilse, User.id olarak dene
-            try:
-                client_profile = ClientProfile.objects.get(user_id=client_id)
-                user_id = client_id
-            except ClientProfile.DoesNotExist:
-                return Response(
-                    {"detail": "No ClientProfile matches the given query."},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-        
-        # Expert kontrolü: eğer client_profile'ın expert'i varsa, mevcut expert ile eşleşmeli
-        if client_profile.expert and client_profile.expert != expert:
-            return Response(
-                {"detail": "Bu danışana erişim yetkiniz yok."},
-                status=status.HTTP_403_FORBIDDEN
-            )
+        client_profile = resolve_client_for_expert(request, client_id)
 
-        responses = FormResponse.objects.filter(user_id=user_id)
+        responses = FormResponse.objects.filter(user_id=client_profile.user_id).select_related("form")
         serializer = FormResponseExpertSummarySerializer(responses, many=True)
         return Response(serializer.data)
 
@@ -202,34 +217,77 @@ class FormClientResponseDetailView(APIView):
         if request.user.role != UserRole.EXPERT:
             return Response(status=status.HTTP_403_FORBIDDEN)
 
-        expert = get_object_or_404(ExpertProfile, user=request.user)
-        
-        # client_id hem ClientProfile.id hem de User.id olabilir
-        # Önce ClientProfile.id olarak dene
-        try:
-            client_profile = ClientProfile.objects.get(id=client_id)
-            user_id = client_profile.user_id
-        except ClientProfile.DoesNotExist:
-            # Eğer ClientProfile.id değilse, User.id olarak dene
-            try:
-                client_profile = ClientProfile.objects.get(user_id=client_id)
-                user_id = client_id
-            except ClientProfile.DoesNotExist:
-                return Response(
-                    {"detail": "No ClientProfile matches the given query."},
-                    status=status.HTTP_404_NOT_FOUND
-                )
-        
-        # Expert kontrolü: eğer client_profile'ın expert'i varsa, mevcut expert ile eşleşmeli
-        if client_profile.expert and client_profile.expert != expert:
-            return Response(
-                {"detail": "Bu danışana erişim yetkiniz yok."},
-                status=status.HTTP_403_FORBIDDEN
-            )
+        client_profile = resolve_client_for_expert(request, client_id)
 
         response_obj = get_object_or_404(
-            FormResponse, id=response_id, user_id=user_id
+            FormResponse.objects.select_related("form", "user"),
+            id=response_id,
+            user_id=client_profile.user_id,
         )
         # Expert kullanıcılar için detaylı serializer - cevaplar + scoring + interpretation + recommendations
         serializer = FormResponseExpertDetailSerializer(response_obj)
         return Response(serializer.data)
+
+
+class FormAnalyticsView(APIView):
+    """
+    Uzmana atanmış danışanların bu form için toplu analitiği:
+    puan dağılımı, risk seviyesi sayıları, soru bazlı ortalamalar ve aylık eğilim.
+    """
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request, form_id):
+        if request.user.role != UserRole.EXPERT:
+            return Response(status=status.HTTP_403_FORBIDDEN)
+
+        expert = get_request_expert_profile(request)
+        form = get_object_or_404(Form, id=form_id)
+
+        summary = get_summary(form, expert)
+        return Response(serialize_summary(summary, form))
+
+# --------------------------------------------------
+# Admin
+# --------------------------------------------------
+
+class FormResponseExportView(APIView):
+    """
+    Form cevaplarını akış halinde dışa aktarır.
+    GET /forms/export/?type=csv|ndjson|wide&form_id=<id>
+    wide biçimi için form_id zorunludur.
+    """
+    permission_classes = [IsAdminUser]
+
+    def get(self, request):
+        export_format = request.query_params.get("type", "csv")
+        if export_format not in EXPORT_FORMATS:
+            return Response(
+                {"detail": f"Geçersiz type. Geçerli değerler: {', '.join(EXPORT_FORMATS)}"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        form_id = request.query_params.get("form_id")
+        if form_id is not None:
+            if not form_id.isdigit():
+                return Response(
+                    {"detail": "form_id sayısal olmalıdır."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            form_id = get_object_or_404(Form, id=form_id).id
+        elif export_format == "wide":
+            return Response(
+                {"detail": "wide biçimi için form_id zorunludur."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        filename = "form-responses-{}{}.{}".format(
+            form_id if form_id is not None else "all",
+            timezone.now().strftime("-%Y%m%d%H%M%S"),
+            FILE_EXTENSIONS[export_format],
+        )
+        response = StreamingHttpResponse(
+            stream_export(export_format, form_id),
+            content_type=CONTENT_TYPES[export_format],
+        )
+        response["Content-Disposition"] = f'attachment; filename="{filename}"'
+        return response
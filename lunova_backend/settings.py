@@ -41,11 +41,20 @@ if STORAGE_PROVIDER == 'supabase':
     
 elif STORAGE_PROVIDER == 'mock':
     print(">>> MockStorage etkinleştirildi.")
+
+elif STORAGE_PROVIDER == 'local':
+    # Dosyalar diskte tutulur, imzalı URL'ler accounts/views/storage_views.py ile sunulur
+    print(">>> LocalStorage etkinleştirildi.")
+    LOCAL_STORAGE_ROOT = env.path('LOCAL_STORAGE_ROOT', default=BASE_DIR / 'local-storage')
+    LOCAL_STORAGE_BASE_URL = env.str(
+        'LOCAL_STORAGE_BASE_URL', default='http://localhost:8000/api/v1/accounts/storage'
+    )
+    LOCAL_STORAGE_MAX_UPLOAD_SIZE = env.int('LOCAL_STORAGE_MAX_UPLOAD_SIZE', default=20 * 1024 * 1024)
     
 else:
     raise ImproperlyConfigured(
         f"Invalid STORAGE_PROVIDER='{STORAGE_PROVIDER}'. "
-        "Allowed values: 'supabase', 'mock'."
+        "Allowed values: 'supabase', 'mock', 'local'."
     )
 
 # 1. Ortam Değişkenlerini Oku ve Temizle
@@ -85,6 +94,11 @@ else:
         "Lütfen ayarlarınızı kontrol edin."
     )
 
+# Cache: çok worker'lı ortamlarda paylaşılan bir backend verilmeli (ör. redis://...)
+CACHES = {
+    'default': env.cache('CACHE_URL', default='locmemcache://'),
+}
+
 # STATIC_ROOT (production)
 STATIC_ROOT = 'staticfiles'
 
@@ -122,6 +136,10 @@ INSTALLED_APPS = [
     'availability',     # Müsaitlik
 ]
 
+# PostgreSQL'de trigram lookup'ları (accounts/text_search.py) için
+if DATABASES['default'].get('ENGINE', '').endswith('postgresql'):
+    INSTALLED_APPS.append('django.contrib.postgres')
+
 MIDDLEWARE = [
     'corsheaders.middleware.CorsMiddleware',  # React ile haberleşmek için
     'django.middleware.security.SecurityMiddleware',
@@ -156,6 +174,21 @@ WSGI_APPLICATION = 'lunova_backend.wsgi.application'
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
+# Parola hash'leme: PBKDF2 maliyeti ayarlanabilir; eski hash'ler girişte arka planda yükseltilir
+PASSWORD_HASHERS = [
+    'accounts.hashers.PBKDF2PasswordHasher',
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.Argon2PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+    'django.contrib.auth.hashers.ScryptPasswordHasher',
+]
+# Boş bırakılırsa Django'nun varsayılan PBKDF2 iterasyon sayısı kullanılır
+PASSWORD_HASH_ITERATIONS = env.int('PASSWORD_HASH_ITERATIONS', default=None)
+
+# accounts/background.py: arka plan iş havuzu
+BACKGROUND_TASK_WORKERS = env.int('BACKGROUND_TASK_WORKERS', default=2)
+BACKGROUND_TASKS_SYNC = env.bool('BACKGROUND_TASKS_SYNC', default=False)
+
 AUTH_PASSWORD_VALIDATORS = [
     {
         'NAME': 'django.contrib.auth.password_validation.UserAttributeSimilarityValidator',
@@ -267,6 +300,29 @@ REST_FRAMEWORK = {
 
 AUTH_USER_MODEL = 'accounts.User'
 
+# Token blacklist kontrolü süreç içi filtre ile yapılır (accounts/blacklist.py). Filtre
+# worker'lar arasında cache üzerinden senkron tutulur; varsayılan olarak sadece paylaşılan
+# bir cache (CACHE_URL) verildiğinde açıktır, locmem cache ile açılsa da kullanılmaz
+AUTH_BLACKLIST_FILTER = env.bool('AUTH_BLACKLIST_FILTER', default=bool(env.str('CACHE_URL', default='')))
+# Cache'teki sayaç kaybolur veya güncellenemezse filtrenin en geç kaç saniyede bir yenileneceği;
+# blacklist'e alınan bir token başka worker'larda en kötü durumda bu kadar süre kabul edilebilir
+AUTH_BLACKLIST_MAX_AGE = env.int('AUTH_BLACKLIST_MAX_AGE', default=60)
+# Kimliği doğrulanmış kullanıcı (profilleriyle) kaç saniye cache'te tutulur; 0 kapatır. Girdi
+# sadece değişikliği yapan worker'ın cache'inden düşürülebildiği için varsayılan olarak sadece
+# paylaşılan bir cache (CACHE_URL) verildiğinde açıktır; aksi halde pasifleştirilen kullanıcı veya
+# değişen rol diğer worker'larda bu süre kadar geçerli kalır (bkz. accounts/checks.py)
+AUTH_USER_CACHE_TIMEOUT = env.int('AUTH_USER_CACHE_TIMEOUT', default=60 if env.str('CACHE_URL', default='') else 0)
+# Uzman arama indeksi paylaşılan cache olmasa bile en geç kaç saniyede bir yeniden kurulur
+EXPERT_SEARCH_INDEX_MAX_AGE = env.int('EXPERT_SEARCH_INDEX_MAX_AGE', default=300)
+# Sözlük tabloları (hizmet, dil, üniversite...) cache'i en geç kaç saniyede bir yenilenir
+TAXONOMY_CACHE_MAX_AGE = env.int('TAXONOMY_CACHE_MAX_AGE', default=600)
+# Serileştirilmiş /profile/ cevabı kaç saniye cache'te tutulur; 0 kapatır. Kullanıcı cache'i
+# gibi varsayılan olarak sadece paylaşılan bir cache (CACHE_URL) verildiğinde açıktır; süreç
+# içi cache'te diğer worker'lar eski cevabı yeni ETag ile sunabilir (bkz. accounts/checks.py)
+PROFILE_CACHE_TIMEOUT = env.int('PROFILE_CACHE_TIMEOUT', default=600 if env.str('CACHE_URL', default='') else 0)
+# Günlük kullanım özetinde müsait dakikalar bugünden itibaren kaç gün ileri hesaplanır
+UTILIZATION_DAYS_AHEAD = env.int('UTILIZATION_DAYS_AHEAD', default=30)
+
 SIMPLE_JWT = {
     'ACCESS_TOKEN_LIFETIME': timedelta(minutes=15),
     'REFRESH_TOKEN_LIFETIME': timedelta(days=7),